@@ -1,161 +1,346 @@
 #!/usr/bin/env python3
-"""Post-generation hook for cookiecutter-python-package."""
+"""Post-generation hook for cookiecutter-python-package.
+
+Cookiecutter renders this file with Jinja before running it, so the only
+templated part is ``COOKIECUTTER_CONTEXT`` below. Everything else works on an
+explicit context dict and pluggable filesystem/git backends, which lets the
+tests import the raw file and call :func:`run_hook` in-process against an
+in-memory tree.
+"""
+
+from __future__ import annotations
 
 import shutil
 import subprocess
 from pathlib import Path
+from typing import Any, Callable, Protocol
 
 # Get the project directory
 PROJECT_DIRECTORY = Path.cwd()
 
+# Rendered by cookiecutter; only the options the hook acts on are listed.
+COOKIECUTTER_CONTEXT: dict[str, str] = {
+    "project_name": "{{ cookiecutter.project_name }}",
+    "project_slug": "{{ cookiecutter.project_slug }}",
+    "full_name": "{{ cookiecutter.full_name }}",
+    "email": "{{ cookiecutter.email }}",
+    "use_ruff": "{{ cookiecutter.use_ruff }}",
+    "use_mypy": "{{ cookiecutter.use_mypy }}",
+    "use_pytest": "{{ cookiecutter.use_pytest }}",
+    "use_coverage": "{{ cookiecutter.use_coverage }}",
+    "use_pre_commit": "{{ cookiecutter.use_pre_commit }}",
+    "use_bandit": "{{ cookiecutter.use_bandit }}",
+    "use_safety": "{{ cookiecutter.use_safety }}",
+    "use_github_actions": "{{ cookiecutter.use_github_actions }}",
+    "use_dependabot": "{{ cookiecutter.use_dependabot }}",
+    "use_tox": "{{ cookiecutter.use_tox }}",
+    "use_nox": "{{ cookiecutter.use_nox }}",
+    "use_benchmarks": "{{ cookiecutter.use_benchmarks }}",
+    "use_docker": "{{ cookiecutter.use_docker }}",
+    "build_backend": "{{ cookiecutter.build_backend }}",
+    "use_mypyc": "{{ cookiecutter.use_mypyc }}",
+    "create_changelog": "{{ cookiecutter.create_changelog }}",
+    "create_contributing": "{{ cookiecutter.create_contributing }}",
+    "create_code_of_conduct": "{{ cookiecutter.create_code_of_conduct }}",
+    "command_line_interface": "{{ cookiecutter.command_line_interface }}",
+}
 
-def remove_file(filepath: Path) -> None:
-    """Remove a file if it exists."""
-    if filepath.exists():
-        filepath.unlink()
 
+class FileSystem(Protocol):
+    """Filesystem operations used by the hook."""
 
-def remove_dir(dirpath: Path) -> None:
-    """Remove a directory if it exists."""
-    if dirpath.exists() and dirpath.is_dir():
-        shutil.rmtree(dirpath)
+    def is_file(self, path: Path) -> bool:
+        """Return True if ``path`` is an existing file."""
 
+    def is_dir(self, path: Path) -> bool:
+        """Return True if ``path`` is an existing directory."""
 
-def main() -> None:
-    """Main post-generation cleanup."""
-    try:
-        # Remove files based on configuration
-        if "{{ cookiecutter.use_pre_commit }}" != "y":
-            remove_file(PROJECT_DIRECTORY / ".pre-commit-config.yaml")
+    def remove_file(self, path: Path) -> None:
+        """Remove the file at ``path``."""
 
-        if "{{ cookiecutter.use_github_actions }}" != "y":
-            remove_dir(PROJECT_DIRECTORY / ".github")
+    def remove_tree(self, path: Path) -> None:
+        """Remove the directory at ``path`` and everything below it."""
 
-        if "{{ cookiecutter.use_tox }}" != "y":
-            remove_file(PROJECT_DIRECTORY / "tox.ini")
 
-        if "{{ cookiecutter.use_nox }}" != "y":
-            remove_file(PROJECT_DIRECTORY / "noxfile.py")
+class GitBackend(Protocol):
+    """Runs git commands for the hook."""
 
-        if "{{ cookiecutter.use_docker }}" != "y":
-            remove_file(PROJECT_DIRECTORY / "Dockerfile")
-            remove_file(PROJECT_DIRECTORY / "docker-compose.yml")
+    def run(self, args: list[str], cwd: Path) -> None:
+        """Run ``git <args>`` in ``cwd``, raising CalledProcessError on failure."""
 
-        if "{{ cookiecutter.create_changelog }}" != "y":
-            remove_file(PROJECT_DIRECTORY / "CHANGELOG.md")
 
-        if "{{ cookiecutter.create_contributing }}" != "y":
-            remove_file(PROJECT_DIRECTORY / "CONTRIBUTING.md")
+class LocalFileSystem:
+    """FileSystem implementation backed by the real disk."""
 
-        if "{{ cookiecutter.create_code_of_conduct }}" != "y":
-            remove_file(PROJECT_DIRECTORY / "CODE_OF_CONDUCT.md")
+    def is_file(self, path: Path) -> bool:
+        """Return True if ``path`` is an existing file."""
+        return path.is_file()
 
-        if "{{ cookiecutter.command_line_interface }}" == "none":
-            # Remove CLI-related test file if no CLI is wanted
-            cli_test_file = PROJECT_DIRECTORY / "tests" / "test_cli.py"
-            if cli_test_file.exists():
-                remove_file(cli_test_file)
+    def is_dir(self, path: Path) -> bool:
+        """Return True if ``path`` is an existing directory."""
+        return path.is_dir()
 
-        # Create initial git repository
-        try:
-            # Initialize git repository
-            subprocess.run(["git", "init"], check=True, cwd=PROJECT_DIRECTORY)
+    def remove_file(self, path: Path) -> None:
+        """Remove the file at ``path``."""
+        path.unlink()
 
-            # Configure git identity for the initial commit
-            subprocess.run(
-                ["git", "config", "user.name", "{{ cookiecutter.full_name }}"],
-                check=True,
-                cwd=PROJECT_DIRECTORY,
-            )
-            subprocess.run(
-                ["git", "config", "user.email", "{{ cookiecutter.email }}"],
-                check=True,
-                cwd=PROJECT_DIRECTORY,
-            )
+    def remove_tree(self, path: Path) -> None:
+        """Remove the directory at ``path`` and everything below it."""
+        shutil.rmtree(path)
 
-            # Add all files
-            subprocess.run(["git", "add", "."], check=True, cwd=PROJECT_DIRECTORY)
-
-            # Create initial commit
-            subprocess.run(
-                [
-                    "git",
-                    "commit",
-                    "-m",
-                    "Initial commit from cookiecutter-python-package",
-                ],
-                check=True,
-                cwd=PROJECT_DIRECTORY,
-            )
-            print("✓ Git repository initialized with initial commit")
 
-        except subprocess.CalledProcessError as e:
-            print(f"Warning: Git initialization failed: {e}")
-            print("You can initialize git manually later with:")
-            print("  git init")
-            print("  git add .")
-            print('  git commit -m "Initial commit"')
+class SubprocessGit:
+    """GitBackend implementation that shells out to the git executable."""
+
+    def run(self, args: list[str], cwd: Path) -> None:
+        """Run ``git <args>`` in ``cwd``, raising CalledProcessError on failure."""
+        subprocess.run(["git", *args], check=True, cwd=cwd)
+
 
-        print(
-            "\n*** Project '{ cookiecutter.project_name }' has been created successfully! ***"
+def remove_file(filepath: Path, fs: FileSystem | None = None) -> None:
+    """Remove a file if it exists."""
+    fs = fs or LocalFileSystem()
+    if fs.is_file(filepath):
+        fs.remove_file(filepath)
+
+
+def remove_dir(dirpath: Path, fs: FileSystem | None = None) -> None:
+    """Remove a directory if it exists."""
+    fs = fs or LocalFileSystem()
+    if fs.is_dir(dirpath):
+        fs.remove_tree(dirpath)
+
+
+def paths_to_remove(context: dict[str, Any]) -> tuple[list[str], list[str]]:
+    """Return the (files, directories) to remove for ``context``.
+
+    Paths are relative to the generated project root.
+    """
+    files: list[str] = []
+    dirs: list[str] = []
+
+    if context["use_pre_commit"] != "y":
+        files.append(".pre-commit-config.yaml")
+
+    if context["use_github_actions"] != "y":
+        dirs.append(".github")
+
+    if context["use_tox"] != "y":
+        files.append("tox.ini")
+
+    if context["use_nox"] != "y":
+        files.append("noxfile.py")
+
+    if context["use_docker"] != "y":
+        files.extend(["Dockerfile", "docker-compose.yml"])
+
+    if context["create_changelog"] != "y":
+        files.append("CHANGELOG.md")
+
+    if context["create_contributing"] != "y":
+        files.append("CONTRIBUTING.md")
+
+    if context["create_code_of_conduct"] != "y":
+        files.append("CODE_OF_CONDUCT.md")
+
+    if context["use_benchmarks"] != "y":
+        dirs.append("benchmarks")
+
+    if context["use_mypyc"] != "y" or context["build_backend"] not in (
+        "setuptools",
+        "hatchling",
+    ):
+        # flit and pdm builds stay pure-Python, so there is nothing to compare
+        # or to test apart
+        files.extend(["benchmarks/bench_mypyc.py", "scripts/test_compiled.py"])
+
+    if context["use_mypyc"] != "y" or context["build_backend"] != "setuptools":
+        # Only the setuptools mypyc build needs a setup.py
+        files.append("setup.py")
+
+    if context["command_line_interface"] == "none":
+        # Remove CLI-related files if no CLI is wanted
+        package = context["project_slug"].replace("-", "_")
+        files.extend(
+            [
+                "benchmarks/bench_formats.py",
+                "benchmarks/bench_jobs.py",
+                "benchmarks/bench_startup.py",
+                f"src/{package}/batch.py",
+                f"src/{package}/completion.py",
+                f"src/{package}/dispatch.py",
+                f"src/{package}/formats.py",
+                # Only reachable through the CLI's --profile option
+                f"src/{package}/profiling.py",
+                "tests/test_batch.py",
+                "tests/test_cli.py",
+                "tests/test_completion.py",
+                "tests/test_dispatch.py",
+                "tests/test_formats.py",
+                "tests/test_profiling.py",
+                "tests/test_zipapp.py",
+                # The zipapp runs the CLI
+                "scripts/build_zipapp.py",
+            ]
         )
-        print(f"Location: {PROJECT_DIRECTORY}")
-        print("\nNext steps:")
-        print("1. cd {{ cookiecutter.project_slug }}")
-        print("2. Create and activate a virtual environment")
-        print('3. pip install -e ".[dev]"')
 
-        if "{{ cookiecutter.use_pre_commit }}" == "y":
-            print("4. pre-commit install")
+    if "scripts/build_zipapp.py" in files and "scripts/test_compiled.py" in files:
+        dirs.append("scripts")
 
-        print("\nHappy coding!")
+    return files, dirs
 
-        # Print tool explanations
-        print("\nIncluded Tools and Their Importance:")
 
-        if "{{ cookiecutter.use_ruff }}" == "y":
-            print(
-                "* Ruff: Ultra-fast Python linter and formatter that replaces multiple tools (flake8, black, isort)"
-            )
+def init_git_repository(
+    context: dict[str, Any],
+    project_dir: Path,
+    git: GitBackend,
+    echo: Callable[[str], None] = print,
+) -> bool:
+    """Initialize a git repository with an initial commit.
 
-        if "{{ cookiecutter.use_mypy }}" == "y":
-            print(
-                "* MyPy: Static type checker that helps catch bugs early and improves code documentation"
-            )
+    Returns:
+        True if the repository was created, False if a git command failed.
+    """
+    try:
+        # Initialize git repository
+        git.run(["init"], project_dir)
 
-        if "{{ cookiecutter.use_pytest }}" == "y":
-            print(
-                "* pytest: Modern testing framework with powerful features and fixtures"
-            )
+        # Configure git identity for the initial commit
+        git.run(["config", "user.name", context["full_name"]], project_dir)
+        git.run(["config", "user.email", context["email"]], project_dir)
 
-        if "{{ cookiecutter.use_coverage }}" == "y":
-            print(
-                "* Coverage: Measures test coverage to ensure your tests are comprehensive"
-            )
+        # Add all files
+        git.run(["add", "."], project_dir)
 
-        if "{{ cookiecutter.use_pre_commit }}" == "y":
-            print(
-                "* pre-commit: Runs checks before commits to maintain code quality automatically"
-            )
+        # Create initial commit
+        git.run(
+            ["commit", "-m", "Initial commit from cookiecutter-python-package"],
+            project_dir,
+        )
+        echo("✓ Git repository initialized with initial commit")
+        return True
+
+    except subprocess.CalledProcessError as e:
+        echo(f"Warning: Git initialization failed: {e}")
+        echo("You can initialize git manually later with:")
+        echo("  git init")
+        echo("  git add .")
+        echo('  git commit -m "Initial commit"')
+        return False
+
+
+def print_summary(
+    context: dict[str, Any],
+    project_dir: Path,
+    echo: Callable[[str], None] = print,
+) -> None:
+    """Print next steps and an explanation of the selected tools."""
+    echo(
+        f"\n*** Project '{context['project_name']}' has been created successfully! ***"
+    )
+    echo(f"Location: {project_dir}")
+    echo("\nNext steps:")
+    echo(f"1. cd {context['project_slug']}")
+    echo("2. Create and activate a virtual environment")
+    echo('3. pip install -e ".[dev]"')
+
+    if context["use_pre_commit"] == "y":
+        echo("4. pre-commit install")
+
+    echo("\nHappy coding!")
+
+    # Print tool explanations
+    echo("\nIncluded Tools and Their Importance:")
+
+    if context["use_ruff"] == "y":
+        echo(
+            "* Ruff: Ultra-fast Python linter and formatter that replaces multiple tools (flake8, black, isort)"
+        )
 
-        if "{{ cookiecutter.use_bandit }}" == "y":
-            print(
-                "* Bandit: Security linter that finds common security issues in Python code"
-            )
+    if context["use_mypy"] == "y":
+        echo(
+            "* MyPy: Static type checker that helps catch bugs early and improves code documentation"
+        )
 
-        if "{{ cookiecutter.use_safety }}" == "y":
-            print("* Safety: Checks dependencies for known security vulnerabilities")
+    if context["use_pytest"] == "y":
+        echo("* pytest: Modern testing framework with powerful features and fixtures")
 
-        if "{{ cookiecutter.use_github_actions }}" == "y":
-            print(
-                "* GitHub Actions: Automated CI/CD pipelines for testing and deployment"
-            )
+    if context["use_coverage"] == "y":
+        echo(
+            "* Coverage: Measures test coverage to ensure your tests are comprehensive"
+        )
+
+    if context["use_pre_commit"] == "y":
+        echo(
+            "* pre-commit: Runs checks before commits to maintain code quality automatically"
+        )
 
-        if "{{ cookiecutter.use_dependabot }}" == "y":
-            print(
-                "* Dependabot: Automated dependency updates to keep your project secure"
+    if context["use_bandit"] == "y":
+        echo(
+            "* Bandit: Security linter that finds common security issues in Python code"
+        )
+
+    if context["use_safety"] == "y":
+        echo("* Safety: Checks dependencies for known security vulnerabilities")
+
+    if context["use_github_actions"] == "y":
+        echo("* GitHub Actions: Automated CI/CD pipelines for testing and deployment")
+
+    if context["use_dependabot"] == "y":
+        echo("* Dependabot: Automated dependency updates to keep your project secure")
+
+    if context["use_benchmarks"] == "y":
+        echo(
+            "* Benchmarks: Timing scripts with a per-commit history to catch "
+            "performance regressions (make bench)"
+        )
+
+    if context["use_mypyc"] == "y":
+        if context["build_backend"] in ("setuptools", "hatchling"):
+            echo("* mypyc: Compiles the core module to a C extension for faster code")
+        else:
+            echo(
+                f"* mypyc: Not supported by the {context['build_backend']} backend; "
+                "wheels stay pure Python (use setuptools or hatchling to compile)"
             )
 
+
+def run_hook(
+    context: dict[str, Any],
+    project_dir: Path,
+    fs: FileSystem | None = None,
+    git: GitBackend | None = None,
+    echo: Callable[[str], None] = print,
+) -> None:
+    """Apply the post-generation steps for ``context`` to ``project_dir``.
+
+    Args:
+        context: Cookiecutter options, with the keys of ``COOKIECUTTER_CONTEXT``.
+        project_dir: Root of the generated project.
+        fs: Filesystem backend. Defaults to the local disk.
+        git: Git backend. Defaults to running the git executable.
+        echo: Output function for user-facing messages.
+    """
+    fs = fs or LocalFileSystem()
+    git = git or SubprocessGit()
+
+    # Remove files based on configuration
+    files, dirs = paths_to_remove(context)
+    for name in files:
+        remove_file(project_dir / name, fs)
+    for name in dirs:
+        remove_dir(project_dir / name, fs)
+
+    # Create initial git repository
+    init_git_repository(context, project_dir, git, echo)
+
+    print_summary(context, project_dir, echo)
+
+
+def main() -> None:
+    """Main post-generation cleanup."""
+    try:
+        run_hook(COOKIECUTTER_CONTEXT, PROJECT_DIRECTORY)
     except Exception as e:
         print(f"Error during project setup: {e}")
         print("The project was created, but some cleanup steps may have failed.")
@@ -0,0 +1,250 @@
+"""Cold-start cost of the generated console script for each CLI flavour.
+
+Each ``command_line_interface`` flavour is baked and installed, with its
+dependencies, into a virtual environment of its own. Environments are kept in
+the pytest cache and rebuilt only when the template changes. The console script
+is then started repeatedly for each command through a small probe process that
+reports wall time and peak resident memory. The probe reads the peak from
+``wait4`` itself: on Linux a child's ``ru_maxrss`` also counts the memory of
+the process that spawned it, and the probe is smaller than any interpreter it
+measures, while pytest is not.
+
+Commands are compared with a bare interpreter start in the same environment,
+so the thresholds are the seconds and MiB each flavour and command may add to
+it. Loaded as a plugin from ``tests/conftest.py``, the module also prints the
+measurements of every flavour in the session as one comparison table.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pytest
+from cookiecutter.main import cookiecutter
+
+BASELINE = "python -c pass"
+
+# Command label -> arguments passed to the console script
+COMMANDS: dict[str, list[str]] = {
+    "--version": ["--version"],
+    "--help": ["--help"],
+    "greet": ["greet", "World"],
+}
+
+# Flavour -> command -> (seconds, MiB) the command may add to BASELINE.
+# --version and greet take the dispatch fast path and never import the
+# framework; --help builds the full CLI.
+THRESHOLDS: dict[str, dict[str, tuple[float, float]]] = {
+    "typer": {"--version": (0.1, 8), "--help": (0.6, 40), "greet": (0.1, 8)},
+    "click": {"--version": (0.1, 8), "--help": (0.25, 15), "greet": (0.1, 8)},
+    "argparse": {"--version": (0.1, 8), "--help": (0.15, 10), "greet": (0.1, 8)},
+}
+
+# Template files whose changes invalidate the cached environments
+TEMPLATE_INPUTS = ("{{cookiecutter.project_slug}}", "hooks", "cookiecutter.json")
+
+# Written into an environment once its project is installed
+COMPLETE = ".installed"
+
+# ru_maxrss is in bytes on macOS and in KiB elsewhere
+RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+# Run with ``python -I -S`` to stay small: spawns argv[1:] with stdout
+# discarded and prints its wall time, peak RSS and exit code
+PROBE = """\
+import os, sys, time
+devnull = os.open(os.devnull, os.O_WRONLY)
+actions = [(os.POSIX_SPAWN_DUP2, devnull, 1)]
+start = time.perf_counter()
+pid = os.posix_spawn(sys.argv[1], sys.argv[1:], os.environ, file_actions=actions)
+_, status, usage = os.wait4(pid, 0)
+print(time.perf_counter() - start, usage.ru_maxrss, os.waitstatus_to_exitcode(status))
+"""
+
+USER_PROPERTY = "cli_startup"
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """Best wall time and highest peak RSS over repeated runs of a command."""
+
+    seconds: float
+    peak_rss: int
+
+
+def template_key(template_dir: Path, context: dict[str, Any]) -> str:
+    """Return a digest of the template files, ``context`` and the Python version."""
+    digest = hashlib.sha256(json.dumps(context, sort_keys=True).encode())
+    digest.update(sys.version.encode())
+    for name in TEMPLATE_INPUTS:
+        root = template_dir / name
+        for path in sorted(root.rglob("*")) if root.is_dir() else [root]:
+            if path.is_file() and "__pycache__" not in path.parts:
+                digest.update(str(path.relative_to(template_dir)).encode())
+                digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def install_environment(
+    root: Path, template_dir: Path, context: dict[str, Any]
+) -> Path:
+    """Return a virtual environment with the project baked from ``context``.
+
+    Environments live in ``root``, one per flavour and template digest; building
+    a new one removes those of the same flavour from older digests.
+    """
+    cli = context["command_line_interface"]
+    env = root / f"{cli}-{template_key(template_dir, context)}"
+    if (env / COMPLETE).exists():
+        return env
+    for stale in root.glob(f"{cli}-*"):
+        shutil.rmtree(stale, ignore_errors=True)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        project = cookiecutter(
+            str(template_dir),
+            no_input=True,
+            extra_context=context,
+            output_dir=output_dir,
+        )
+        subprocess.run(
+            [sys.executable, "-m", "venv", str(env)], check=True, capture_output=True
+        )
+        result = subprocess.run(
+            [str(env / "bin" / "python"), "-m", "pip", "install", "--quiet", project],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+    if result.returncode != 0:
+        pytest.fail(f"Failed to install the {cli} project: {result.stderr}")
+    (env / COMPLETE).touch()
+    return env
+
+
+def measure(command: list[str], runs: int) -> Measurement:
+    """Run ``command`` ``runs`` times through the probe.
+
+    Raises:
+        subprocess.CalledProcessError: If ``command`` exits with an error
+    """
+    # A clean start: no PYTHONPATH or coverage hooks from the test run
+    env = {k: v for k, v in os.environ.items() if not k.startswith("PYTHON")}
+    best, peak = float("inf"), 0
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-I", "-S", "-c", PROBE, *command],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        seconds, rss, code = result.stdout.split()
+        if int(code) != 0:
+            raise subprocess.CalledProcessError(
+                int(code), command, result.stdout, result.stderr
+            )
+        best = min(best, float(seconds))
+        peak = max(peak, int(rss) * RSS_UNIT)
+    return Measurement(best, peak)
+
+
+def measure_environment(env: Path, script: str, runs: int) -> dict[str, Measurement]:
+    """Measure BASELINE and every command of ``script`` installed in ``env``."""
+    bin_dir = env / "bin"
+    results = {BASELINE: measure([str(bin_dir / "python"), "-c", "pass"], runs)}
+    for label, args in COMMANDS.items():
+        results[label] = measure([str(bin_dir / script), *args], runs)
+    return results
+
+
+def check_thresholds(cli: str, results: dict[str, Measurement]) -> list[str]:
+    """Return a message for every command of ``cli`` over its thresholds."""
+    baseline = results[BASELINE]
+    violations = []
+    for label, (seconds, mib) in THRESHOLDS[cli].items():
+        added = results[label].seconds - baseline.seconds
+        if added > seconds:
+            violations.append(
+                f"{cli} {label}: adds {added * 1e3:.1f}ms to interpreter startup, "
+                f"threshold {seconds * 1e3:.0f}ms"
+            )
+        added_rss = (results[label].peak_rss - baseline.peak_rss) / 2**20
+        if added_rss > mib:
+            violations.append(
+                f"{cli} {label}: adds {added_rss:.1f}MiB to interpreter peak RSS, "
+                f"threshold {mib:.0f}MiB"
+            )
+    return violations
+
+
+def format_table(results: dict[str, dict[str, Measurement]]) -> list[str]:
+    """Return table lines comparing the flavours in ``results`` command by command."""
+    lines = [
+        f"{'command':<15} {'flavour':<9} {'time':>9} {'added':>9} {'limit':>7}"
+        f" {'peak RSS':>9} {'added':>9} {'limit':>7}"
+    ]
+    for label in [BASELINE, *COMMANDS]:
+        for cli, measured in results.items():
+            measurement, baseline = measured[label], measured[BASELINE]
+            time_columns = rss_columns = f" {'':>9} {'':>7}"
+            if label != BASELINE:
+                seconds, mib = THRESHOLDS[cli][label]
+                added = (measurement.seconds - baseline.seconds) * 1e3
+                added_rss = (measurement.peak_rss - baseline.peak_rss) / 2**20
+                time_columns = f" {added:>+7.1f}ms {seconds * 1e3:>5.0f}ms"
+                rss_columns = f" {added_rss:>+6.1f}MiB {mib:>4.0f}MiB"
+            lines.append(
+                f"{label:<15} {cli:<9} {measurement.seconds * 1e3:>7.1f}ms"
+                f"{time_columns} {measurement.peak_rss / 2**20:>6.1f}MiB{rss_columns}"
+            )
+    return lines
+
+
+def as_property(cli: str, results: dict[str, Measurement]) -> dict[str, Any]:
+    """Return ``results`` as a test report property, which xdist can transfer."""
+    return {
+        "cli": cli,
+        "results": {k: [m.seconds, m.peak_rss] for k, m in results.items()},
+    }
+
+
+class CliStartupPlugin:
+    """Collects the measurements of each flavour and prints them side by side."""
+
+    def __init__(self) -> None:
+        self.results: dict[str, dict[str, Measurement]] = {}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Collect measurements, including those sent by xdist workers."""
+        if report.when != "call":
+            return
+        for name, value in report.user_properties:
+            if name == USER_PROPERTY and isinstance(value, dict):
+                self.results[value["cli"]] = {
+                    label: Measurement(*pair)
+                    for label, pair in value["results"].items()
+                }
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        """Print the comparison table of the flavours measured."""
+        if not self.results:
+            return
+        order = [cli for cli in THRESHOLDS if cli in self.results]
+        terminalreporter.section("cli startup")
+        for line in format_table({cli: self.results[cli] for cli in order}):
+            terminalreporter.write_line(line)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the comparison table plugin."""
+    config.pluginmanager.register(CliStartupPlugin(), "cli-startup-plugin")
@@ -13,6 +13,10 @@ from cookiecutter.main import cookiecutter
 # Explicitly tell pytest to ignore the template directory
 collect_ignore = ["../{{cookiecutter.project_slug}}"]
 
+# Per-marker cost tracking (--marker-report / --marker-budget) and the CLI
+# flavour startup comparison table
+pytest_plugins = ["marker_budgets", "cli_startup"]
+
 
 @pytest.fixture(scope="session")
 def template_dir() -> Path:
@@ -209,6 +213,7 @@ def pytest_configure(config: Any) -> None:
     config.addinivalue_line("markers", "security: mark test as security-related")
     config.addinivalue_line("markers", "performance: mark test as performance-related")
     config.addinivalue_line("markers", "quality: mark test as code quality-related")
+    config.addinivalue_line("markers", "serial: mark test as needing a non-xdist run")
 
 
 def pytest_collection_modifyitems(config: Any, items: list[Any]) -> None:
@@ -0,0 +1,274 @@
+"""Pytest plugin measuring what each test category costs.
+
+Every test is measured from setup to teardown for wall time, number of
+subprocesses started and bytes written by the test process. Totals are
+aggregated per marker and per test class, optionally written as a JSON report
+and compared against per-marker wall time budgets.
+
+Options:
+    --marker-report=PATH      Write the aggregated totals as JSON to PATH.
+    --marker-budget=M=SECONDS Fail the run when tests marked M take longer
+                              than SECONDS in total (repeatable).
+
+Budgets can also be set with the ``marker_budgets`` ini option, one
+``MARKER=SECONDS`` entry per line. Measurements travel with the test reports,
+so the totals are also correct under pytest-xdist.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+# Markers that describe how a test runs rather than what category it belongs to
+BUILTIN_MARKERS = {
+    "filterwarnings",
+    "parametrize",
+    "skip",
+    "skipif",
+    "usefixtures",
+    "xfail",
+}
+
+# Audit events raised when a test starts a child process
+SUBPROCESS_EVENTS = {"subprocess.Popen", "os.system"}
+
+USER_PROPERTY = "marker_budgets"
+
+
+class SubprocessCounter:
+    """Counts subprocess launches in this process through an audit hook."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.installed = False
+
+    def __call__(self, event: str, args: tuple[Any, ...]) -> None:
+        """Audit hook callback."""
+        if event in SUBPROCESS_EVENTS:
+            self.count += 1
+
+    def install(self) -> None:
+        """Register the audit hook; they cannot be removed, so only once."""
+        if not self.installed:
+            sys.addaudithook(self)
+            self.installed = True
+
+
+SUBPROCESS_COUNTER = SubprocessCounter()
+
+
+def _bytes_written() -> int | None:
+    """Return the bytes written by this process so far, if the OS reports it."""
+    try:
+        with open("/proc/self/io", "rb") as f:
+            for line in f:
+                if line.startswith(b"wchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def parse_budgets(entries: list[str]) -> dict[str, float]:
+    """Parse ``MARKER=SECONDS`` entries into a budget mapping."""
+    budgets: dict[str, float] = {}
+    for raw_entry in entries:
+        entry = raw_entry.strip()
+        if not entry:
+            continue
+        marker, sep, seconds = entry.partition("=")
+        if not sep:
+            raise pytest.UsageError(
+                f"Invalid marker budget {entry!r}, expected MARKER=SECONDS"
+            )
+        try:
+            budgets[marker.strip()] = float(seconds)
+        except ValueError:
+            raise pytest.UsageError(
+                f"Invalid marker budget {entry!r}, SECONDS must be a number"
+            ) from None
+    return budgets
+
+
+class Totals:
+    """Accumulated cost of a group of tests."""
+
+    def __init__(self) -> None:
+        self.tests = 0
+        self.wall_time = 0.0
+        self.subprocesses = 0
+        self.bytes_written: int | None = 0
+
+    def add(self, measurement: dict[str, Any]) -> None:
+        """Add the measurement of one test."""
+        self.tests += 1
+        self.wall_time += measurement["wall_time"]
+        self.subprocesses += measurement["subprocesses"]
+        if self.bytes_written is None or measurement["bytes_written"] is None:
+            self.bytes_written = None
+        else:
+            self.bytes_written += measurement["bytes_written"]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the totals as a JSON-serializable dict."""
+        return {
+            "tests": self.tests,
+            "wall_time": round(self.wall_time, 6),
+            "subprocesses": self.subprocesses,
+            "bytes_written": self.bytes_written,
+        }
+
+
+class MarkerBudgetPlugin:
+    """Collects per-test measurements and enforces marker budgets."""
+
+    def __init__(self, report_path: Path | None, budgets: dict[str, float]) -> None:
+        self.report_path = report_path
+        self.budgets = budgets
+        self.markers: dict[str, Totals] = defaultdict(Totals)
+        self.classes: dict[str, Totals] = defaultdict(Totals)
+        self.violations: list[str] = []
+        self._start: dict[str, tuple[float, int, int | None]] = {}
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item: pytest.Item) -> None:
+        """Take the starting counters before any fixture runs."""
+        self._start[item.nodeid] = (
+            time.perf_counter(),
+            SUBPROCESS_COUNTER.count,
+            _bytes_written(),
+        )
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(
+        self, item: pytest.Item, call: pytest.CallInfo[None]
+    ) -> Any:
+        """Attach the measurement to the item before the teardown report."""
+        if call.when == "teardown" and item.nodeid in self._start:
+            started, subprocesses, written = self._start.pop(item.nodeid)
+            now_written = _bytes_written()
+            markers = sorted(
+                {m.name for m in item.iter_markers()} - BUILTIN_MARKERS
+            ) or ["unmarked"]
+            item.user_properties.append(
+                (
+                    USER_PROPERTY,
+                    {
+                        "markers": markers,
+                        "group": item.nodeid.rsplit("::", 1)[0],
+                        "wall_time": time.perf_counter() - started,
+                        "subprocesses": SUBPROCESS_COUNTER.count - subprocesses,
+                        "bytes_written": None
+                        if written is None or now_written is None
+                        else now_written - written,
+                    },
+                )
+            )
+        yield
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Aggregate measurements, including those sent by xdist workers."""
+        if report.when != "teardown":
+            return
+        for name, measurement in report.user_properties:
+            if name != USER_PROPERTY or not isinstance(measurement, dict):
+                continue
+            for marker in measurement["markers"]:
+                self.markers[marker].add(measurement)
+            self.classes[measurement["group"]].add(measurement)
+
+    def check_budgets(self) -> list[str]:
+        """Return a message for every marker over its budget."""
+        violations = []
+        for marker, budget in sorted(self.budgets.items()):
+            totals = self.markers.get(marker)
+            if totals is not None and totals.wall_time > budget:
+                violations.append(
+                    f"{marker}: {totals.wall_time:.2f}s exceeds budget of {budget:.2f}s"
+                )
+        return violations
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the full report as a JSON-serializable dict."""
+        return {
+            "markers": {k: v.as_dict() for k, v in sorted(self.markers.items())},
+            "classes": {k: v.as_dict() for k, v in sorted(self.classes.items())},
+            "budgets": self.budgets,
+            "violations": self.violations,
+        }
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Write the report and fail the run on budget violations."""
+        if hasattr(session.config, "workerinput"):
+            # xdist workers only measure; the controller aggregates
+            return
+        self.violations = self.check_budgets()
+        if self.report_path is not None:
+            self.report_path.parent.mkdir(parents=True, exist_ok=True)
+            self.report_path.write_text(
+                json.dumps(self.as_dict(), indent=2) + "\n", encoding="utf-8"
+            )
+        if self.violations and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        """Print the per-marker totals and any budget violations."""
+        if not self.markers:
+            return
+        terminalreporter.section("marker budgets")
+        for marker, totals in sorted(self.markers.items()):
+            budget = self.budgets.get(marker)
+            limit = f" / {budget:.2f}s" if budget is not None else ""
+            terminalreporter.write_line(
+                f"{marker:<12} {totals.tests:>5} tests "
+                f"{totals.wall_time:>9.2f}s{limit:<11} "
+                f"{totals.subprocesses:>6} subprocesses"
+            )
+        for violation in self.violations:
+            terminalreporter.write_line(f"BUDGET EXCEEDED {violation}", red=True)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the marker budget options."""
+    group = parser.getgroup("marker-budgets", "per-marker cost tracking")
+    group.addoption(
+        "--marker-report",
+        default=None,
+        metavar="PATH",
+        help="Write per-marker and per-class test costs as JSON to PATH.",
+    )
+    group.addoption(
+        "--marker-budget",
+        action="append",
+        default=[],
+        metavar="MARKER=SECONDS",
+        help="Fail when tests with MARKER take more than SECONDS in total.",
+    )
+    parser.addini(
+        "marker_budgets",
+        type="linelist",
+        default=[],
+        help="Wall time budgets, one MARKER=SECONDS per line.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Activate the plugin when a report or budget is requested."""
+    budgets = parse_budgets(config.getini("marker_budgets"))
+    budgets.update(parse_budgets(config.getoption("marker_budget")))
+    report = config.getoption("marker_report")
+    if report is None and not budgets:
+        return
+
+    SUBPROCESS_COUNTER.install()
+    config.pluginmanager.register(
+        MarkerBudgetPlugin(Path(report) if report else None, budgets),
+        "marker-budgets-plugin",
+    )
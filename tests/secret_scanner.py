@@ -0,0 +1,138 @@
+"""Single-pass secret scanner for the template and generated projects.
+
+The tree is walked once, pruning VCS, virtualenv and cache directories. Every
+file with a scanned suffix is memory-mapped and searched with one combined
+compiled pattern, across a thread pool. Results are returned as
+:class:`Finding` records sorted by path and line.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+# Rule name -> pattern; matched case-insensitively against raw file bytes
+DEFAULT_RULES: dict[str, str] = {
+    "password": r"password\s*=\s*['\"][^'\"]+['\"]",
+    "api_key": r"api_key\s*=\s*['\"][^'\"]+['\"]",
+    "secret_key": r"secret_key\s*=\s*['\"][^'\"]+['\"]",
+    "token": r"token\s*=\s*['\"][^'\"]+['\"]",
+    "private_key": r"-----BEGIN [A-Z ]*PRIVATE KEY-----",
+}
+
+DEFAULT_SUFFIXES = frozenset({".py", ".yml", ".yaml", ".toml", ".md", ".txt"})
+
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".venv",
+        "venv",
+        ".tox",
+        ".nox",
+        "__pycache__",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".ruff_cache",
+        "htmlcov",
+        "node_modules",
+    }
+)
+
+
+@dataclass(frozen=True, order=True)
+class Finding:
+    """A potential secret found in a file."""
+
+    path: str
+    line: int
+    rule: str
+    text: str
+
+
+def compile_rules(rules: dict[str, str]) -> re.Pattern[bytes]:
+    """Combine ``rules`` into one bytes pattern with a named group per rule."""
+    combined = "|".join(f"(?P<{name}>{pattern})" for name, pattern in rules.items())
+    return re.compile(combined.encode(), re.IGNORECASE)
+
+
+def iter_files(
+    root: Path,
+    suffixes: Iterable[str] = DEFAULT_SUFFIXES,
+    skip_dirs: Iterable[str] = SKIP_DIRS,
+) -> Iterator[Path]:
+    """Yield files under ``root`` with a matching suffix in a single walk."""
+    suffixes = frozenset(suffixes)
+    skip_dirs = frozenset(skip_dirs)
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [
+            d for d in dirnames if d not in skip_dirs and not d.endswith(".egg-info")
+        ]
+        for filename in filenames:
+            if os.path.splitext(filename)[1] in suffixes:
+                yield Path(dirpath, filename)
+
+
+def scan_file(path: Path, pattern: re.Pattern[bytes], root: Path) -> list[Finding]:
+    """Return the findings of ``pattern`` in one file."""
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                findings = []
+                line, line_pos = 1, 0
+                for match in pattern.finditer(data):
+                    # Count newlines incrementally; matches arrive in order
+                    line += data[line_pos : match.start()].count(b"\n")
+                    line_pos = match.start()
+                    findings.append(
+                        Finding(
+                            path=path.relative_to(root).as_posix(),
+                            line=line,
+                            rule=match.lastgroup or "",
+                            text=match.group().decode("utf-8", errors="replace"),
+                        )
+                    )
+                return findings
+    except (OSError, ValueError):
+        # Unreadable files and special files that cannot be mapped
+        return []
+
+
+def scan_tree(
+    root: Path,
+    rules: dict[str, str] = DEFAULT_RULES,
+    suffixes: Iterable[str] = DEFAULT_SUFFIXES,
+    exclude: Iterable[str] = (),
+    workers: int | None = None,
+) -> list[Finding]:
+    """Scan every matching file under ``root`` for secrets.
+
+    Args:
+        root: Directory to scan, e.g. the template or a baked project.
+        rules: Rule name to regular expression mapping.
+        suffixes: File suffixes to scan.
+        exclude: Relative paths (or fragments of them) to skip, for files
+            that contain example secrets on purpose.
+        workers: Thread pool size. Defaults to the executor's default.
+
+    Returns:
+        The findings, sorted by path and line.
+    """
+    root = Path(root)
+    pattern = compile_rules(rules)
+    exclude = tuple(exclude)
+    files = [
+        path
+        for path in iter_files(root, suffixes)
+        if not any(entry in path.relative_to(root).as_posix() for entry in exclude)
+    ]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda path: scan_file(path, pattern, root), files)
+        return sorted(finding for findings in results for finding in findings)
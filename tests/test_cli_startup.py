@@ -0,0 +1,74 @@
+"""Tests for the CLI cold-start measurement helpers."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+from cli_startup import (
+    BASELINE,
+    Measurement,
+    check_thresholds,
+    format_table,
+    measure,
+    template_key,
+)
+
+MIB = 2**20
+
+needs_posix_spawn = pytest.mark.skipif(
+    not hasattr(os, "posix_spawn"), reason="the probe uses posix_spawn and wait4"
+)
+
+
+@needs_posix_spawn
+def test_measure_reports_child_peak_memory_only() -> None:
+    """Test that the peak is the child's, not that of the test process."""
+    # Filled rather than zeroed, so that the pages are resident
+    held = b"1" * (256 * MIB)
+    small = measure([sys.executable, "-S", "-c", "pass"], runs=2)
+    large = measure([sys.executable, "-S", "-c", f"b = b'1' * {64 * MIB}"], runs=1)
+    assert len(held) == 256 * MIB
+    assert small.seconds > 0
+    assert small.peak_rss < 64 * MIB
+    assert large.peak_rss >= 64 * MIB
+
+
+@needs_posix_spawn
+def test_measure_raises_on_failure() -> None:
+    """Test that a failing command is reported with its exit code."""
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        measure([sys.executable, "-c", "raise SystemExit(3)"], runs=1)
+    assert excinfo.value.returncode == 3
+
+
+def test_thresholds_and_table() -> None:
+    """Test that commands are compared with the bare interpreter."""
+    results = {
+        BASELINE: Measurement(0.020, 10 * MIB),
+        "--version": Measurement(0.030, 11 * MIB),
+        "--help": Measurement(0.190, 60 * MIB),
+        "greet": Measurement(0.035, 11 * MIB),
+    }
+
+    assert check_thresholds("click", results) == [
+        "click --help: adds 50.0MiB to interpreter peak RSS, threshold 15MiB"
+    ]
+
+    lines = format_table({"click": results})
+    assert lines[0].split()[:3] == ["command", "flavour", "time"]
+    # The baseline row has no added or limit columns
+    assert lines[1].split() == ["python", "-c", "pass", "click", "20.0ms", "10.0MiB"]
+    assert lines[3].split()[3:] == ["+170.0ms", "250ms", "60.0MiB", "+50.0MiB", "15MiB"]
+
+
+def test_template_key_depends_on_context(
+    template_dir: Path, minimal_context: dict[str, Any]
+) -> None:
+    """Test that each flavour gets its own, stable environment key."""
+    typer = {**minimal_context, "command_line_interface": "typer"}
+    click = {**minimal_context, "command_line_interface": "click"}
+    assert template_key(template_dir, typer) == template_key(template_dir, typer)
+    assert template_key(template_dir, typer) != template_key(template_dir, click)
@@ -1,12 +1,67 @@
 """Tests for cookiecutter hooks."""
 
+import importlib.util
+import itertools
 import subprocess
 import tempfile
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+from types import ModuleType
+from typing import Any
 
 import pytest
 from cookiecutter.main import cookiecutter
 
+HOOK_FILE = Path(__file__).parent.parent / "hooks" / "post_gen_project.py"
+
+
+def load_hook_module() -> ModuleType:
+    """Import the unrendered post-gen hook as a module."""
+    spec = importlib.util.spec_from_file_location("post_gen_project", HOOK_FILE)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class InMemoryFileSystem:
+    """FileSystem backend holding a project tree as a set of file paths."""
+
+    def __init__(self, files: list[str]) -> None:
+        self.files = {PurePosixPath(f) for f in files}
+
+    def is_file(self, path: PurePosixPath) -> bool:
+        return PurePosixPath(path) in self.files
+
+    def is_dir(self, path: PurePosixPath) -> bool:
+        path = PurePosixPath(path)
+        return any(path in f.parents for f in self.files)
+
+    def remove_file(self, path: PurePosixPath) -> None:
+        self.files.remove(PurePosixPath(path))
+
+    def remove_tree(self, path: PurePosixPath) -> None:
+        path = PurePosixPath(path)
+        self.files = {f for f in self.files if path not in f.parents}
+
+
+@pytest.fixture(scope="module")
+def hook() -> ModuleType:
+    """Return the hook module loaded from the unrendered template."""
+    return load_hook_module()
+
+
+class RecordingGit:
+    """GitBackend that records commands instead of running them."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.calls: list[list[str]] = []
+        self.fail = fail
+
+    def run(self, args: list[str], cwd: PurePosixPath) -> None:
+        self.calls.append(args)
+        if self.fail:
+            raise subprocess.CalledProcessError(1, ["git", *args])
+
 
 class TestPostGenHook:
     """Test the post-generation hook."""
@@ -352,3 +407,196 @@ class TestPostGenHook:
             assert project_path.exists(), (
                 "Project should be created successfully even with special characters"
             )
+
+
+class TestPostGenHookInProcess:
+    """Exercise the hook logic directly, without baking a project."""
+
+    PROJECT_FILES = [
+        ".pre-commit-config.yaml",
+        ".github/workflows/ci.yml",
+        ".github/dependabot.yml",
+        "tox.ini",
+        "noxfile.py",
+        "Dockerfile",
+        "CHANGELOG.md",
+        "CONTRIBUTING.md",
+        "README.md",
+        "pyproject.toml",
+        "src/test_package/__init__.py",
+        "src/test_package/batch.py",
+        "src/test_package/completion.py",
+        "src/test_package/dispatch.py",
+        "src/test_package/formats.py",
+        "src/test_package/profiling.py",
+        "src/test_package/server.py",
+        "tests/test_batch.py",
+        "tests/test_cli.py",
+        "tests/test_completion.py",
+        "tests/test_dispatch.py",
+        "tests/test_formats.py",
+        "tests/test_profiling.py",
+        "tests/test_zipapp.py",
+        "tests/test_core.py",
+        "tests/test_server.py",
+        "setup.py",
+        "benchmarks/harness.py",
+        "benchmarks/bench_mypyc.py",
+        "benchmarks/bench_jobs.py",
+        "benchmarks/bench_formats.py",
+        "benchmarks/bench_startup.py",
+        "scripts/build_zipapp.py",
+        "scripts/test_compiled.py",
+    ]
+
+    TOGGLES = {
+        "use_pre_commit": [".pre-commit-config.yaml"],
+        "use_github_actions": [".github/workflows/ci.yml", ".github/dependabot.yml"],
+        "use_tox": ["tox.ini"],
+        "use_nox": ["noxfile.py"],
+        "use_benchmarks": ["benchmarks/harness.py"],
+        "use_docker": ["Dockerfile"],
+        "create_changelog": ["CHANGELOG.md"],
+        "create_contributing": ["CONTRIBUTING.md"],
+    }
+
+    @staticmethod
+    def make_context(**overrides: str) -> dict[str, Any]:
+        """Build a hook context with every feature enabled."""
+        context = {
+            "project_name": "Test Package",
+            "project_slug": "test_package",
+            "full_name": "Test User",
+            "email": "test@example.com",
+            "use_ruff": "y",
+            "use_mypy": "y",
+            "use_pytest": "y",
+            "use_coverage": "y",
+            "use_pre_commit": "y",
+            "use_bandit": "y",
+            "use_safety": "y",
+            "use_github_actions": "y",
+            "use_dependabot": "y",
+            "use_tox": "y",
+            "use_nox": "y",
+            "use_benchmarks": "y",
+            "use_docker": "y",
+            "build_backend": "setuptools",
+            "use_mypyc": "y",
+            "create_changelog": "y",
+            "create_contributing": "y",
+            "create_code_of_conduct": "y",
+            "command_line_interface": "typer",
+        }
+        context.update(overrides)
+        return context
+
+    def test_context_covers_hook_options(self, hook: ModuleType) -> None:
+        """Test that the rendered context lists every option the hook reads."""
+        assert set(self.make_context()) == set(hook.COOKIECUTTER_CONTEXT)
+
+    def test_all_toggle_combinations(self, hook: ModuleType) -> None:
+        """Test file removal for every combination of the file toggles."""
+        names = list(self.TOGGLES)
+        for values in itertools.product("yn", repeat=len(names)):
+            context = self.make_context(**dict(zip(names, values)))
+            fs = InMemoryFileSystem(self.PROJECT_FILES)
+
+            hook.run_hook(
+                context,
+                PurePosixPath("."),
+                fs=fs,
+                git=RecordingGit(),
+                echo=lambda message: None,
+            )
+
+            for name, value in zip(names, values):
+                for path in self.TOGGLES[name]:
+                    assert (PurePosixPath(path) in fs.files) == (value == "y"), (
+                        f"{path} with {name}={value}"
+                    )
+            assert PurePosixPath("pyproject.toml") in fs.files
+            assert PurePosixPath("tests/test_cli.py") in fs.files
+
+    @pytest.mark.parametrize("backend", ["setuptools", "hatchling", "flit", "pdm"])
+    @pytest.mark.parametrize("use_mypyc", ["y", "n"])
+    def test_mypyc_files(self, hook: ModuleType, backend: str, use_mypyc: str) -> None:
+        """Test that mypyc build files are kept only for backends that use them."""
+        fs = InMemoryFileSystem(self.PROJECT_FILES)
+        context = self.make_context(build_backend=backend, use_mypyc=use_mypyc)
+        output: list[str] = []
+
+        hook.run_hook(
+            context, PurePosixPath("."), fs=fs, git=RecordingGit(), echo=output.append
+        )
+
+        keep_setup = use_mypyc == "y" and backend == "setuptools"
+        compiled = use_mypyc == "y" and backend in ("setuptools", "hatchling")
+        assert (PurePosixPath("setup.py") in fs.files) == keep_setup
+        assert (PurePosixPath("benchmarks/bench_mypyc.py") in fs.files) == compiled
+        assert (PurePosixPath("scripts/test_compiled.py") in fs.files) == compiled
+        if use_mypyc == "y" and backend in ("flit", "pdm"):
+            assert any("Not supported" in line for line in output)
+
+    def test_no_cli_removes_cli_tests(self, hook: ModuleType) -> None:
+        """Test that the CLI files are removed when no CLI is selected."""
+        fs = InMemoryFileSystem(self.PROJECT_FILES)
+        context = self.make_context(command_line_interface="none")
+
+        hook.run_hook(context, PurePosixPath("."), fs=fs, git=RecordingGit())
+
+        assert PurePosixPath("benchmarks/bench_formats.py") not in fs.files
+        assert PurePosixPath("benchmarks/bench_jobs.py") not in fs.files
+        assert PurePosixPath("src/test_package/batch.py") not in fs.files
+        assert PurePosixPath("src/test_package/completion.py") not in fs.files
+        assert PurePosixPath("src/test_package/dispatch.py") not in fs.files
+        assert PurePosixPath("src/test_package/formats.py") not in fs.files
+        assert PurePosixPath("src/test_package/profiling.py") not in fs.files
+        assert PurePosixPath("tests/test_batch.py") not in fs.files
+        assert PurePosixPath("tests/test_cli.py") not in fs.files
+        assert PurePosixPath("tests/test_completion.py") not in fs.files
+        assert PurePosixPath("tests/test_dispatch.py") not in fs.files
+        assert PurePosixPath("tests/test_formats.py") not in fs.files
+        assert PurePosixPath("tests/test_profiling.py") not in fs.files
+        assert PurePosixPath("tests/test_zipapp.py") not in fs.files
+        assert PurePosixPath("benchmarks/bench_startup.py") not in fs.files
+        assert PurePosixPath("scripts/build_zipapp.py") not in fs.files
+        # The server is library API, started with server.serve()
+        assert PurePosixPath("src/test_package/server.py") in fs.files
+        assert PurePosixPath("tests/test_server.py") in fs.files
+        # The compiled wheel is still tested without a CLI
+        assert PurePosixPath("scripts/test_compiled.py") in fs.files
+        assert PurePosixPath("tests/test_core.py") in fs.files
+
+    def test_git_commands(self, hook: ModuleType) -> None:
+        """Test that the hook initializes git with the configured identity."""
+        git = RecordingGit()
+        context = self.make_context()
+
+        hook.run_hook(
+            context,
+            PurePosixPath("."),
+            fs=InMemoryFileSystem([]),
+            git=git,
+            echo=lambda message: None,
+        )
+
+        assert git.calls[0] == ["init"]
+        assert ["config", "user.name", "Test User"] in git.calls
+        assert ["config", "user.email", "test@example.com"] in git.calls
+        assert git.calls[-1][0] == "commit"
+
+    def test_git_failure_is_reported(self, hook: ModuleType) -> None:
+        """Test that a failing git backend produces a warning, not an error."""
+        messages: list[str] = []
+
+        hook.run_hook(
+            self.make_context(),
+            PurePosixPath("."),
+            fs=InMemoryFileSystem([]),
+            git=RecordingGit(fail=True),
+            echo=messages.append,
+        )
+
+        assert any("Git initialization failed" in m for m in messages)
+        assert any("created successfully" in m for m in messages)
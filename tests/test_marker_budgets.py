@@ -0,0 +1,80 @@
+"""Tests for the marker budget pytest plugin."""
+
+import json
+
+import pytest
+from marker_budgets import Totals, parse_budgets
+
+pytest_plugins = ["pytester"]
+
+SAMPLE_TESTS = """
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.bake
+def test_spawns():
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+
+
+class TestGroup:
+    def test_plain(self):
+        pass
+"""
+
+
+class TestParseBudgets:
+    """Test parsing of MARKER=SECONDS entries."""
+
+    def test_valid_entries(self) -> None:
+        """Test that entries are parsed into floats, ignoring blanks."""
+        assert parse_budgets(["bake=120", " slow = 2.5 ", ""]) == {
+            "bake": 120.0,
+            "slow": 2.5,
+        }
+
+    @pytest.mark.parametrize("entry", ["bake", "bake=fast"])
+    def test_invalid_entries(self, entry: str) -> None:
+        """Test that malformed entries are reported as usage errors."""
+        with pytest.raises(pytest.UsageError):
+            parse_budgets([entry])
+
+
+def test_totals_unknown_bytes() -> None:
+    """Test that one unmeasured test makes the byte total unknown."""
+    totals = Totals()
+    totals.add({"wall_time": 1.0, "subprocesses": 2, "bytes_written": 10})
+    totals.add({"wall_time": 0.5, "subprocesses": 0, "bytes_written": None})
+
+    assert totals.as_dict() == {
+        "tests": 2,
+        "wall_time": 1.5,
+        "subprocesses": 2,
+        "bytes_written": None,
+    }
+
+
+def test_report_and_budget(pytester: pytest.Pytester) -> None:
+    """Test the JSON report contents and failing on an exceeded budget."""
+    pytester.makepyfile(test_sample=SAMPLE_TESTS)
+    pytester.makeini("[pytest]\nmarkers =\n    bake: bakes projects\n")
+
+    result = pytester.runpytest(
+        "-p",
+        "marker_budgets",
+        "--marker-report=report.json",
+        "--marker-budget=bake=0",
+    )
+
+    result.assert_outcomes(passed=2)
+    assert result.ret == pytest.ExitCode.TESTS_FAILED
+    result.stdout.fnmatch_lines(["*BUDGET EXCEEDED bake*"])
+
+    report = json.loads((pytester.path / "report.json").read_text())
+    assert report["markers"]["bake"]["tests"] == 1
+    assert report["markers"]["bake"]["subprocesses"] == 1
+    assert report["markers"]["unmarked"]["subprocesses"] == 0
+    assert "test_sample.py::TestGroup" in report["classes"]
+    assert report["violations"]
@@ -1,11 +1,23 @@
 """Performance and stress tests for the cookiecutter template."""
 
+import os
+import subprocess
 import tempfile
 import time
 from pathlib import Path
 from typing import Any
 
 import pytest
+from cli_startup import (
+    COMMANDS,
+    THRESHOLDS,
+    USER_PROPERTY,
+    as_property,
+    check_thresholds,
+    install_environment,
+    measure,
+    measure_environment,
+)
 from cookiecutter.main import cookiecutter
 
 
@@ -158,6 +170,78 @@ class TestPerformance:
             assert file_count > 20, f"Expected > 20 files, got {file_count}"
 
 
+@pytest.fixture(scope="module")
+def cli_environments(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Return the directory keeping one installed environment per CLI flavour."""
+    cache = getattr(request.config, "cache", None)
+    if cache is None:
+        # Without the cache provider, environments last for the session
+        return tmp_path_factory.mktemp("cli-startup")
+    return Path(cache.mkdir("cli-startup"))
+
+
+@pytest.mark.serial
+@pytest.mark.skipif(
+    "PYTEST_XDIST_WORKER" in os.environ,
+    reason="cold-start thresholds need a serial run (pytest -n 0)",
+)
+class TestCliStartup:
+    """Compare console script cold starts across CLI flavours."""
+
+    # Runs of each command per flavour; the best time is kept
+    RUNS = 10
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(
+        not hasattr(os, "posix_spawn"), reason="the probe uses posix_spawn and wait4"
+    )
+    @pytest.mark.parametrize("cli", list(THRESHOLDS))
+    def test_cli_startup(
+        self,
+        template_dir: Path,
+        minimal_context: dict[str, Any],
+        cli_environments: Path,
+        record_property: Any,
+        cli: str,
+    ) -> None:
+        """Test that commands stay within their flavour's thresholds.
+
+        ``--version`` and ``greet`` must also take the dispatch fast path,
+        which never imports the CLI framework or the core module.
+        """
+        context = {**minimal_context, "command_line_interface": cli}
+        env = install_environment(cli_environments, template_dir, context)
+        package = context["project_slug"]
+        results = measure_environment(env, package, self.RUNS)
+        record_property(USER_PROPERTY, as_property(cli, results))
+
+        violations = check_thresholds(cli, results)
+        assert not violations, "\n".join(violations)
+
+        python = str(env / "bin" / "python")
+        if cli != "argparse":
+            for label in ("--version", "greet"):
+                command = [python, "-m", f"{package}.cli", *COMMANDS[label]]
+                full = measure(command, self.RUNS)
+                assert results[label].seconds < full.seconds, (
+                    f"{cli} {label}: fast path is not faster than the full CLI"
+                )
+
+        result = subprocess.run(
+            [python, "-X", "importtime", "-m", f"{package}.dispatch", "--version"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        imported = {
+            line.rpartition("|")[2].strip() for line in result.stderr.splitlines()
+        }
+        assert cli not in imported
+        assert f"{package}.core" not in imported
+
+
 class TestStress:
     """Stress tests for edge cases and unusual inputs."""
 
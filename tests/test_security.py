@@ -1,5 +1,6 @@
 """Security and quality tests for the cookiecutter template."""
 
+import ast
 import json
 import re
 import subprocess
@@ -10,6 +11,7 @@ from typing import Any
 
 import pytest
 from cookiecutter.main import cookiecutter
+from secret_scanner import scan_tree
 
 
 class TestSecurity:
@@ -59,57 +61,29 @@ class TestSecurity:
 
     def test_no_hardcoded_secrets(self, template_dir: Path) -> None:
         """Test that template files don't contain hardcoded secrets."""
-        # Common patterns that might indicate secrets
-        secret_patterns = [
-            r"password\s*=\s*['\"][^'\"]+['\"]",
-            r"api_key\s*=\s*['\"][^'\"]+['\"]",
-            r"secret_key\s*=\s*['\"][^'\"]+['\"]",
-            r"token\s*=\s*['\"][^'\"]+['\"]",
-            r"-----BEGIN .* PRIVATE KEY-----",
-        ]
-
-        template_files: list[Path] = []
-        for pattern in [
-            "**/*.py",
-            "**/*.yml",
-            "**/*.yaml",
-            "**/*.toml",
-            "**/*.md",
-            "**/*.txt",
-        ]:
-            template_files.extend(template_dir.rglob(pattern))
-
-        for file_path in template_files:
-            if file_path.is_file():
-                # Skip test files and documentation that might contain pattern examples
-                file_path_str = str(file_path.relative_to(template_dir)).replace(
-                    "\\", "/"
-                )
-                skip_files = [
-                    "test_security.py",
-                    "docs/tools/security.md",  # Contains example code with mock passwords
-                ]
-
-                # Check if any skip file path matches
-                should_skip = False
-                for skip_file in skip_files:
-                    if skip_file in file_path_str or file_path_str.endswith(skip_file):
-                        should_skip = True
-                        break
-
-                if should_skip:
-                    continue
-
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-                    for pattern in secret_patterns:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        assert not matches, (
-                            f"Potential secret found in {file_path}: {matches}"
-                        )
-                except (UnicodeDecodeError, PermissionError):
-                    # Skip binary files or files we can't read
-                    continue
+        findings = scan_tree(
+            template_dir,
+            # Files that contain secret patterns or mock passwords on purpose
+            exclude=[
+                "test_security.py",
+                "test_secret_scanner.py",
+                "docs/tools/security.md",
+            ],
+        )
+
+        assert not findings, "Potential secrets found:\n" + "\n".join(
+            f"{f.path}:{f.line}: [{f.rule}] {f.text}" for f in findings
+        )
+
+    def test_generated_project_has_no_secrets(
+        self, generated_full_project: Path
+    ) -> None:
+        """Test that a baked project with every feature contains no secrets."""
+        findings = scan_tree(generated_full_project)
+
+        assert not findings, "Potential secrets found:\n" + "\n".join(
+            f"{f.path}:{f.line}: [{f.rule}] {f.text}" for f in findings
+        )
 
     def test_github_actions_security(
         self, template_dir: Path, secure_context: dict[str, Any]
@@ -365,15 +339,15 @@ class TestQuality:
                     or "from __future__ import annotations" in content
                 ), "Should import typing for type hints"
 
-                # Should have function annotations
-                function_lines = [
-                    line for line in content.split("\n") if "def " in line
-                ]
-                for line in function_lines:
-                    if not line.strip().startswith("#") and "def __" not in line:
+                # Should have function annotations, including on signatures
+                # that span several lines
+                for node in ast.walk(ast.parse(content)):
+                    if isinstance(
+                        node, (ast.FunctionDef, ast.AsyncFunctionDef)
+                    ) and not node.name.startswith("__"):
                         # Public functions should have type hints
-                        assert "->" in line or line.endswith(":"), (
-                            f"Function should have return type hint: {line}"
+                        assert node.returns is not None, (
+                            f"Function should have return type hint: {node.name}"
                         )
 
     def test_test_coverage_setup(
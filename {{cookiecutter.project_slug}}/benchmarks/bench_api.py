@@ -0,0 +1,105 @@
+"""Benchmark the public API and CLI startup.
+
+These are the benchmarks ``benchmarks/run.py`` records per commit; run this
+file directly with ``python benchmarks/bench_api.py`` for a one-off table.
+"""
+
+from __future__ import annotations
+
+import collections
+import io
+import itertools
+{%- if cookiecutter.command_line_interface != "none" %}
+import subprocess
+import sys
+from collections.abc import Callable, Iterable
+{%- else %}
+from collections.abc import Iterable
+{%- endif %}
+
+from harness import Benchmarks, run
+
+from {{ cookiecutter.project_slug.replace('-', '_') }}.core import (
+    {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }},
+    add_numbers,
+    greet_lines,
+    hello_world,
+)
+
+COUNT = 200_000
+NAMES = [f"user{i}" for i in range(COUNT)]
+FLOATS = [float(i) for i in range(COUNT)]
+NAME_LINES = "".join(f"{name}\n" for name in NAMES).encode()
+INSTANCES = [{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}(name) for name in NAMES]
+{%- if cookiecutter.command_line_interface != "none" %}
+# Each CLI run starts a fresh interpreter, so a few runs are enough
+CLI_RUNS = 5
+{%- endif %}
+
+# Group name -> (benchmarks, items processed per call)
+Suites = dict[str, tuple[Benchmarks, int]]
+
+
+def consume(iterable: Iterable[object]) -> None:
+    """Exhaust ``iterable`` without storing its items."""
+    collections.deque(iterable, maxlen=0)
+{%- if cookiecutter.command_line_interface != "none" %}
+
+
+def cli(*args: str) -> Callable[[], object]:
+    """Return a benchmark running the CLI with ``args`` CLI_RUNS times."""
+    command = [sys.executable, "-m", "{{ cookiecutter.project_slug.replace('-', '_') }}.dispatch", *args]
+
+    def startup() -> None:
+        for _ in range(CLI_RUNS):
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+    return startup
+{%- endif %}
+
+
+def suites() -> Suites:
+    """Return the benchmark groups, in display order."""
+    groups: Suites = {
+        "hello_world": (
+            {"hello_world": lambda: consume(map(hello_world, NAMES))},
+            COUNT,
+        ),
+        "add_numbers": (
+            {
+                "add_numbers": lambda: consume(
+                    itertools.starmap(add_numbers, zip(FLOATS, FLOATS))
+                )
+            },
+            COUNT,
+        ),
+        "greet_lines": (
+            {"greet_lines": lambda: greet_lines(io.BytesIO(NAME_LINES), io.BytesIO())},
+            COUNT,
+        ),
+        "class": (
+            {
+                "create": lambda: consume(map({{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}, NAMES)),
+                "greet": lambda: consume(map({{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}.greet, INSTANCES)),
+            },
+            COUNT,
+        ),
+    }
+{%- if cookiecutter.command_line_interface != "none" %}
+    groups["cli"] = (
+        {"--version": cli("--version"), "greet": cli("greet", "World")},
+        CLI_RUNS,
+    )
+{%- endif %}
+    return groups
+
+
+def main() -> None:
+    """Print a table for each benchmark group."""
+    for group, (benchmarks, items) in suites().items():
+        print(f"\n[{group}]")
+        run(benchmarks, items=items)
+
+
+if __name__ == "__main__":
+    main()
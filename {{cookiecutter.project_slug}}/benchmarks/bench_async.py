@@ -0,0 +1,95 @@
+"""Measure event loop latency while greeting large batches concurrently.
+
+A heartbeat task asks to wake up every millisecond and records how late it
+actually runs, while several consumers each greet a large batch of names at
+the same time. Greeting with the synchronous core function blocks the loop
+for the whole batch; ``agreet_many`` bounds the stall to about one chunk per
+consumer. Worker threads (``concurrency=N``) still take turns with the loop
+for the GIL, so on a standard CPython build they raise throughput but not
+responsiveness. Run with
+``python benchmarks/bench_async.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from harness import percentile
+
+from {{ cookiecutter.project_slug.replace('-', '_') }}.aio import agreet_many
+from {{ cookiecutter.project_slug.replace('-', '_') }}.core import hello_world_many
+
+CONSUMERS = 8
+COUNT = 250_000
+NAMES = [f"user{i}" for i in range(COUNT)]
+INTERVAL = 0.001
+
+Consumer = Callable[[], Awaitable[int]]
+
+
+async def blocking() -> int:
+    """Greet the whole batch with the synchronous core function."""
+    return len(list(hello_world_many(NAMES)))
+
+
+async def chunked() -> int:
+    """Greet the batch in cooperative chunks on the event loop."""
+    return len([greeting async for greeting in agreet_many(NAMES)])
+
+
+async def threaded() -> int:
+    """Greet the batch in worker threads, up to four chunks at a time."""
+    return len([g async for g in agreet_many(NAMES, concurrency=4, chunk_size=8192)])
+
+
+async def measure(consumer: Consumer) -> tuple[float, list[float]]:
+    """Run CONSUMERS copies of ``consumer`` next to a heartbeat task.
+
+    Returns:
+        The total wall time and the heartbeat lateness samples, in seconds.
+    """
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        while not done.is_set():
+            expected = time.perf_counter() + INTERVAL
+            await asyncio.sleep(INTERVAL)
+            lags.append(max(0.0, time.perf_counter() - expected))
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await asyncio.gather(*(consumer() for _ in range(CONSUMERS)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await beat
+    return elapsed, lags
+
+
+def main() -> None:
+    """Print loop latency percentiles and throughput for each consumer."""
+    consumers: dict[str, Consumer] = {
+        "core.hello_world_many (blocking)": blocking,
+        "agreet_many (event loop)": chunked,
+        "agreet_many (concurrency=4)": threaded,
+    }
+    print(f"{CONSUMERS} concurrent consumers x {COUNT:,} names each\n")
+    print(
+        f"{'consumer':<34} {'total (s)':>9} {'items/s':>12} "
+        f"{'p50 lag':>9} {'p99 lag':>9} {'max lag':>9}"
+    )
+    for label, consumer in consumers.items():
+        elapsed, lags = asyncio.run(measure(consumer))
+        print(
+            f"{label:<34} {elapsed:>9.2f} {CONSUMERS * COUNT / elapsed:>12,.0f} "
+            f"{percentile(lags, 0.5) * 1e3:>7.2f}ms "
+            f"{percentile(lags, 0.99) * 1e3:>7.2f}ms "
+            f"{max(lags, default=0.0) * 1e3:>7.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
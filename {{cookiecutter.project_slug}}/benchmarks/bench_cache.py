@@ -0,0 +1,60 @@
+"""Benchmark the cost of cache hits and misses against uncached greetings.
+
+``hello_world`` is a single f-string, so a cache lookup (hashing, locking,
+LRU bookkeeping) costs more than recomputing it; the numbers show how large
+that overhead is. Caching pays off once the greeting function does real work.
+Run with ``python benchmarks/bench_cache.py``.
+"""
+
+from __future__ import annotations
+
+import collections
+import random
+from collections.abc import Callable
+
+from harness import Benchmarks, run
+
+from {{ cookiecutter.project_slug.replace('-', '_') }}.cache import memoize
+from {{ cookiecutter.project_slug.replace('-', '_') }}.core import hello_world
+
+COUNT = 200_000
+DISTINCT = 50_000
+MAXSIZE = 4096
+
+# Heavy-tailed traffic: a few names are greeted very often, most rarely
+rng = random.Random(42)
+TRAFFIC = [f"user{int(rng.paretovariate(1.2)) % DISTINCT}" for _ in range(COUNT)]
+HOT = ["user0"] * COUNT
+UNIQUE = [f"user{i}" for i in range(COUNT)]
+
+cached = memoize(maxsize=MAXSIZE)(hello_world)
+
+
+def consume(names: list[str], func: Callable[[str], str]) -> None:
+    """Call ``func`` on every name, discarding the results."""
+    collections.deque(map(func, names), maxlen=0)
+
+
+def bypassed(name: str) -> str:
+    """Call the cached wrapper with the cache bypassed."""
+    return cached(name, bypass_cache=True)
+
+
+BENCHMARKS: Benchmarks = {
+    "hello_world (uncached)": lambda: consume(TRAFFIC, hello_world),
+    "cached, heavy-tailed traffic": lambda: consume(TRAFFIC, cached),
+    "cached, all hits": lambda: consume(HOT, cached),
+    "cached, all misses": lambda: consume(UNIQUE, cached),
+    "cached, bypass_cache=True": lambda: consume(TRAFFIC, bypassed),
+}
+
+
+if __name__ == "__main__":
+    run(BENCHMARKS, items=COUNT)
+    cached.cache_clear()
+    consume(TRAFFIC, cached)
+    info = cached.cache_info()
+    print(
+        f"\nheavy-tailed hit rate with maxsize={MAXSIZE}: {info.hit_rate:.1%} "
+        f"({info.evictions:,} evictions)"
+    )
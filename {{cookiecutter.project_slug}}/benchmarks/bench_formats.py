@@ -0,0 +1,41 @@
+"""Measure the encoding cost per record of each ``greet --format``.
+
+The same names are written in every output format with ``write_records``,
+as ``greet --input`` does, into an in-memory sink. ``text`` joins the
+greetings as bytes without decoding anything; the structured formats also
+decode each block of names and encode a record per name, and the extra time
+per record is printed after the table. Run with
+``python benchmarks/bench_formats.py``.
+"""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Callable
+
+from harness import Benchmarks, run
+
+from {{ cookiecutter.project_slug.replace('-', '_') }}.formats import FORMATS, write_records
+
+COUNT = 1_000_000
+NAME_LINES = "".join(f"user{i}\n" for i in range(COUNT)).encode()
+
+
+def encode(fmt: str) -> Callable[[], object]:
+    """Return a benchmark writing a record in ``fmt`` for each name."""
+    return lambda: write_records(io.BytesIO(NAME_LINES), io.BytesIO(), fmt)
+
+
+def main() -> None:
+    """Time each format, then print its overhead per record over text."""
+    print(f"{COUNT:,} names\n")
+    benchmarks: Benchmarks = {fmt: encode(fmt) for fmt in FORMATS}
+    results = run(benchmarks, items=COUNT)
+    print()
+    for fmt, seconds in results.items():
+        overhead = (seconds - results["text"]) / COUNT * 1e9
+        print(f"{fmt:<8} {overhead:>6.0f} ns/record over text")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark the batch greeting API against a per-item loop.
+
+Run with ``python benchmarks/bench_greetings.py``.
+"""
+
+from __future__ import annotations
+
+import collections
+import io
+
+from harness import Benchmarks, run
+
+from {{ cookiecutter.project_slug.replace('-', '_') }}.core import (
+    greetings_nbytes,
+    hello_world,
+    hello_world_many,
+    write_greetings,
+    write_greetings_into,
+)
+
+NAMES = [f"user{i}" for i in range(200_000)]
+BUFFER = bytearray(greetings_nbytes(NAMES))
+
+
+def loop_list() -> list[str]:
+    """Per-item loop building a list of greetings."""
+    return [hello_world(name) for name in NAMES]
+
+
+def many_iterate() -> None:
+    """Consume hello_world_many without storing the greetings."""
+    collections.deque(hello_world_many(NAMES), maxlen=0)
+
+
+def loop_write_text() -> None:
+    """Per-item loop writing each greeting to a text sink."""
+    sink = io.StringIO()
+    for name in NAMES:
+        sink.write(hello_world(name) + "\n")
+
+
+def write_greetings_text() -> None:
+    """Buffered block writes to a text sink."""
+    write_greetings(NAMES, io.StringIO())
+
+
+def loop_write_binary() -> None:
+    """Per-item loop encoding and writing each greeting to a binary sink."""
+    sink = io.BytesIO()
+    for name in NAMES:
+        sink.write((hello_world(name) + "\n").encode())
+
+
+def write_greetings_binary() -> None:
+    """Buffered block writes to a binary sink."""
+    write_greetings(NAMES, io.BytesIO())
+
+
+def loop_pack_buffer() -> list[int]:
+    """Per-item loop encoding each greeting and copying it into a buffer."""
+    offsets = [0]
+    position = 0
+    for name in NAMES:
+        data = (hello_world(name) + "\n").encode()
+        BUFFER[position : position + len(data)] = data
+        position += len(data)
+        offsets.append(position)
+    return offsets
+
+
+def write_greetings_buffer() -> None:
+    """Block-encoded writes straight into the buffer, with offsets."""
+    write_greetings_into(NAMES, BUFFER)
+
+
+# Each group starts with the per-item loop it is compared against
+BENCHMARKS: dict[str, Benchmarks] = {
+    "iterate": {
+        "hello_world loop -> list": loop_list,
+        "hello_world_many": many_iterate,
+    },
+    "text sink": {
+        "hello_world loop -> text sink": loop_write_text,
+        "write_greetings -> text sink": write_greetings_text,
+    },
+    "binary sink": {
+        "hello_world loop -> binary sink": loop_write_binary,
+        "write_greetings -> binary sink": write_greetings_binary,
+    },
+    "buffer + offsets": {
+        "hello_world loop -> bytearray": loop_pack_buffer,
+        "write_greetings_into -> bytearray": write_greetings_buffer,
+    },
+}
+
+
+if __name__ == "__main__":
+    for group, benchmarks in BENCHMARKS.items():
+        print(f"\n[{group}]")
+        run(benchmarks, items=len(NAMES))
@@ -0,0 +1,131 @@
+"""Benchmark reading ``greet --input FILE`` against buffered text iteration.
+
+A file of generated names is greeted, output discarded, by three readers:
+Python text I/O iterating over decoded lines, as a hand-written loop would;
+``greet_lines`` reading the file as a stream, as it reads a pipe; and
+``greet_lines`` on the file itself, which it memory-maps. Each reader runs
+in a fresh process that reports its own peak resident memory, at two input
+sizes: the memory-mapped reader should use the same memory for both. POSIX
+only. Run with ``python benchmarks/bench_input.py [--size-mb 4096]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import BinaryIO, cast
+
+from harness import write_names
+
+from {{ cookiecutter.project_slug.replace('-', '_') }}.core import greet_lines, write_greetings
+
+# ru_maxrss is in bytes on macOS and in KiB elsewhere
+RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+class Stream:
+    """A binary file without ``fileno``, so that it is read like a pipe."""
+
+    def __init__(self, path: str) -> None:
+        """Open ``path`` for binary reading."""
+        self._file = open(path, "rb")  # noqa: SIM115 - closed by close
+        self.read = self._file.read
+        self.read1 = self._file.read1
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+
+def text_iteration(path: str) -> None:
+    """Greet decoded lines from a text file object."""
+    with open(path, encoding="utf-8") as source, open(os.devnull, "w") as sink:
+        write_greetings((line.rstrip("\n") for line in source), sink)
+
+
+def stream_blocks(path: str) -> None:
+    """Greet the file read in blocks, as a pipe would be."""
+    source = Stream(path)
+    with open(os.devnull, "wb") as sink:
+        greet_lines(cast("BinaryIO", source), sink)
+    source.close()
+
+
+def memory_mapped(path: str) -> None:
+    """Greet the memory-mapped file."""
+    with open(path, "rb") as source, open(os.devnull, "wb") as sink:
+        greet_lines(source, sink)
+
+
+READERS: dict[str, Callable[[str], None]] = {
+    "text iteration": text_iteration,
+    "greet_lines, stream": stream_blocks,
+    "greet_lines, mmap": memory_mapped,
+}
+
+
+def peak_rss() -> int:
+    """Return this process's peak resident memory in bytes."""
+    # On Linux ru_maxrss also counts the parent's memory at fork time
+    with contextlib.suppress(OSError), open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) << 10
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RSS_UNIT
+
+
+def measure(reader: str, path: Path) -> tuple[float, int]:
+    """Run ``reader`` on ``path`` in a fresh process.
+
+    Returns:
+        The elapsed seconds and the peak resident memory in bytes
+    """
+    command = [sys.executable, __file__, "--reader", reader, str(path)]
+    result = subprocess.run(command, check=True, capture_output=True, text=True)
+    seconds, peak = result.stdout.split()
+    return float(seconds), int(peak)
+
+
+def main() -> None:
+    """Print the time and peak memory of each reader at two input sizes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--size-mb", type=int, default=512, help="Largest input in MB (default: 512)"
+    )
+    parser.add_argument("--reader", choices=READERS, help=argparse.SUPPRESS)
+    parser.add_argument("path", nargs="?", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.reader:
+        # Child process: time one reader and report its peak memory
+        started = time.perf_counter()
+        READERS[args.reader](args.path)
+        elapsed = time.perf_counter() - started
+        print(elapsed, peak_rss())
+        return
+
+    print(f"{'input':>8} {'reader':<20} {'time':>8} {'speedup':>8} {'peak RSS':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size_mb in (args.size_mb // 8, args.size_mb):
+            path = Path(directory) / "names.txt"
+            write_names(path, size_mb << 20)
+            baseline = None
+            for reader in READERS:
+                seconds, peak = measure(reader, path)
+                baseline = baseline or seconds
+                print(
+                    f"{size_mb:>5} MB {reader:<20} {seconds:>7.2f}s "
+                    f"{baseline / seconds:>7.1f}x {peak / 2**20:>6.0f} MB"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark ``greet --input FILE --jobs N`` scaling with the number of workers.
+
+A file of generated names is written once, then greeted by the CLI with a
+growing number of worker processes, output discarded. Each run is a fresh
+process, so the timings include interpreter and pool startup, as in real
+use; they are negligible for inputs of a few hundred MB and more. Run with
+``python benchmarks/bench_jobs.py [--size-mb 4096]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+from harness import Benchmarks, run, write_names
+
+
+def greet(path: Path, jobs: int) -> Callable[[], object]:
+    """Return a benchmark greeting every line of ``path`` with ``jobs`` workers."""
+    command = [
+        sys.executable,
+        "-m",
+        "{{ cookiecutter.project_slug.replace('-', '_') }}.dispatch",
+        "greet",
+        "--input",
+        str(path),
+        "--jobs",
+        str(jobs),
+    ]
+    return lambda: subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+
+def main() -> None:
+    """Time the CLI with 1 worker, then with growing worker counts."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--size-mb", type=int, default=256, help="Input size in MB (default: 256)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed runs per benchmark (best kept)"
+    )
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    # Powers of two up to the CPU count, plus the CPU count itself
+    counts = sorted({1 << i for i in range(cpus.bit_length())} | {cpus})
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "names.txt"
+        lines = write_names(path, args.size_mb << 20)
+        print(f"{lines:,} lines, {path.stat().st_size / 2**20:,.0f} MB")
+        benchmarks: Benchmarks = {
+            f"--jobs {jobs}": greet(path, jobs) for jobs in counts
+        }
+        run(benchmarks, items=lines, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
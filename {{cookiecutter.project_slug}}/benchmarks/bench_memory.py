@@ -0,0 +1,86 @@
+"""Benchmark memory use and bulk greeting speed for many instances.
+
+Compares a plain ``__dict__`` class, the ``__slots__`` main class and the
+columnar collection. The collection keeps no string object per name, so it
+trades some greeting speed (each name is sliced out of the buffer on demand)
+for a much smaller footprint. Run with ``python benchmarks/bench_memory.py``.
+"""
+
+from __future__ import annotations
+
+import collections
+import tracemalloc
+from collections.abc import Callable
+
+from harness import Benchmarks, run
+
+from {{ cookiecutter.project_slug.replace('-', '_') }}.core import (
+    {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }},
+    {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}Collection,
+    hello_world,
+)
+
+COUNT = 1_000_000
+NAMES = [f"user{i}" for i in range(COUNT)]
+
+
+class DictInstance:
+    """Equivalent of the main class without __slots__, for comparison."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def greet(self) -> str:
+        return hello_world(self.name)
+
+
+def measure(build: Callable[[], object]) -> int:
+    """Return the bytes still allocated by the object ``build`` returns."""
+    tracemalloc.start()
+    try:
+        obj = build()
+        current, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del obj
+    return current
+
+
+def print_memory() -> None:
+    """Print the memory used to hold COUNT names in each representation."""
+    sizes = {
+        "list of __dict__ instances": measure(
+            lambda: [DictInstance(name) for name in NAMES]
+        ),
+        "list of __slots__ instances": measure(
+            lambda: [{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}(name) for name in NAMES]
+        ),
+        "columnar collection": measure(lambda: {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}Collection(NAMES)),
+    }
+    # The name strings themselves are shared with NAMES and not counted
+    print(f"{'representation':<32} {'MiB':>10} {'bytes/name':>12}")
+    for label, size in sizes.items():
+        print(f"{label:<32} {size / 2**20:>10.1f} {size / COUNT:>12.1f}")
+
+
+dict_instances = [DictInstance(name) for name in NAMES]
+slots_instances = [{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}(name) for name in NAMES]
+collection = {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}Collection(NAMES)
+
+BENCHMARKS: Benchmarks = {
+    "greet() over __dict__ instances": lambda: collections.deque(
+        (obj.greet() for obj in dict_instances), maxlen=0
+    ),
+    "greet() over __slots__ instances": lambda: collections.deque(
+        (obj.greet() for obj in slots_instances), maxlen=0
+    ),
+    "collection.greet_all()": lambda: collections.deque(
+        collection.greet_all(), maxlen=0
+    ),
+}
+
+
+if __name__ == "__main__":
+    print_memory()
+    print()
+    run(BENCHMARKS, items=COUNT)
@@ -0,0 +1,50 @@
+"""Benchmark parallel_map scaling with the number of worker processes.
+
+Each item greets a block of names with ``hello_world_many``, a CPU-bound
+task large enough that pickling an item and its result is cheap by
+comparison. The best of three runs is reported, so pool startup (paid once
+per worker count, on the first run) is excluded, as in a long-running job.
+Run with ``python benchmarks/bench_parallel.py``.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+
+from harness import Benchmarks, run
+
+from {{ cookiecutter.project_slug.replace('-', '_') }}.core import hello_world_many, parallel_map, shutdown_pool
+
+BLOCKS = 256
+BLOCK_SIZE = 20_000
+STARTS = range(0, BLOCKS * BLOCK_SIZE, BLOCK_SIZE)
+
+
+def greet_block(start: int) -> int:
+    """Greet BLOCK_SIZE generated names and return the total length."""
+    names = (f"user{i}" for i in range(start, start + BLOCK_SIZE))
+    return sum(map(len, hello_world_many(names)))
+
+
+def parallel(workers: int) -> Callable[[], object]:
+    """Return a benchmark running parallel_map with ``workers`` processes."""
+    return lambda: sum(parallel_map(greet_block, STARTS, workers=workers))
+
+
+def main() -> None:
+    """Time a serial map, then parallel_map with growing worker counts."""
+    cpus = os.cpu_count() or 1
+    # Powers of two up to the CPU count, plus the CPU count itself
+    counts = sorted({1 << i for i in range(cpus.bit_length())} | {cpus})
+    benchmarks: Benchmarks = {"map (serial)": lambda: sum(map(greet_block, STARTS))}
+    for workers in counts:
+        benchmarks[f"parallel_map workers={workers}"] = parallel(workers)
+    try:
+        run(benchmarks, items=BLOCKS * BLOCK_SIZE, repeat=3)
+    finally:
+        shutdown_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Load-test the HTTP/JSON server and report latency percentiles.
+
+The server runs in a process of its own, as ``serve --port 0`` would start
+it, while CONNECTIONS keep-alive client connections send it requests back to
+back for a few seconds per scenario: one request at a time, or a pipelined
+burst written at once. Latency runs from writing a request to reading the
+end of its response, so pipelined requests include the time queued behind
+the rest of their burst. The clients share the machine with the server, so
+compare scenarios and commits with each other rather than with other hosts.
+Run with ``python benchmarks/bench_server.py [--connections 64] [--duration 5]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from harness import percentile
+
+# Scenario -> (path, JSON body, requests written at once per connection)
+SCENARIOS: dict[str, tuple[str, dict[str, Any], int]] = {
+    "/hello": ("/hello", {"name": "Ada"}, 1),
+    "/hello, pipelined x16": ("/hello", {"name": "Ada"}, 16),
+    "/add": ("/add", {"a": 2, "b": 3}, 1),
+    "/greet, 100 names": ("/greet", {"names": [f"user{i}" for i in range(100)]}, 1),
+}
+SERVER = "from {{ cookiecutter.project_slug.replace('-', '_') }}.server import serve; serve(port=0)"
+
+
+def encode_request(path: str, payload: dict[str, Any]) -> bytes:
+    """Return a raw HTTP/1.1 POST request carrying ``payload`` as JSON."""
+    body = json.dumps(payload).encode()
+    head = f"POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}"
+    return head.encode() + b"\r\n\r\n" + body
+
+
+async def read_response(reader: asyncio.StreamReader) -> None:
+    """Read one response, which must be a 200."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    if not head.startswith(b"HTTP/1.1 200 "):
+        raise RuntimeError(head.decode("latin-1"))
+    length = head.partition(b"Content-Length: ")[2].partition(b"\r\n")[0]
+    await reader.readexactly(int(length))
+
+
+async def client(
+    port: int, burst: bytes, depth: int, deadline: float, latencies: list[float]
+) -> None:
+    """Send ``burst``, ``depth`` requests at once, until ``deadline``."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    while time.perf_counter() < deadline:
+        sent = time.perf_counter()
+        writer.write(burst)
+        for _ in range(depth):
+            await read_response(reader)
+            latencies.append(time.perf_counter() - sent)
+    writer.close()
+    await writer.wait_closed()
+
+
+async def load(
+    port: int, request: bytes, depth: int, connections: int, duration: float
+) -> tuple[float, list[float]]:
+    """Run ``connections`` clients for ``duration`` seconds.
+
+    Returns:
+        The elapsed time and the latency of every request, in seconds.
+    """
+    latencies: list[float] = []
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(
+        *(
+            client(port, request * depth, depth, deadline, latencies)
+            for _ in range(connections)
+        )
+    )
+    return time.perf_counter() - started, latencies
+
+
+@contextmanager
+def running_server() -> Iterator[int]:
+    """Start the server in a subprocess and yield its port."""
+    process = subprocess.Popen(
+        [sys.executable, "-c", SERVER], stderr=subprocess.PIPE, text=True
+    )
+    assert process.stderr is not None
+    try:
+        # "Serving on http://127.0.0.1:PORT"
+        yield int(process.stderr.readline().rsplit(":", 1)[1])
+    finally:
+        process.terminate()
+        process.wait()
+        process.stderr.close()
+
+
+def main() -> None:
+    """Print throughput and latency percentiles for each scenario."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--connections", type=int, default=64, help="Concurrent client connections"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=5.0, help="Seconds of load per scenario"
+    )
+    args = parser.parse_args()
+
+    print(f"{args.connections} keep-alive connections, {args.duration:g}s each\n")
+    print(
+        f"{'scenario':<24} {'requests/s':>11} {'p50':>9} {'p90':>9} "
+        f"{'p99':>9} {'p99.9':>9} {'max':>9}"
+    )
+    with running_server() as port:
+        for label, (path, payload, depth) in SCENARIOS.items():
+            request = encode_request(path, payload)
+            elapsed, latencies = asyncio.run(
+                load(port, request, depth, args.connections, args.duration)
+            )
+            columns = [
+                percentile(latencies, fraction) * 1e3
+                for fraction in (0.5, 0.9, 0.99, 0.999)
+            ]
+            columns.append(max(latencies, default=0.0) * 1e3)
+            print(
+                f"{label:<24} {len(latencies) / elapsed:>11,.0f} "
+                + " ".join(f"{ms:>7.2f}ms" for ms in columns)
+            )
+
+
+if __name__ == "__main__":
+    main()
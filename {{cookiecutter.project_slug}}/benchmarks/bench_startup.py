@@ -0,0 +1,78 @@
+"""Benchmark CLI startup: installed entry point vs ``python -m`` vs zipapp.
+
+Each launcher runs a few commands in fresh interpreters, output discarded:
+the ``{{ cookiecutter.project_slug }}`` console script, ``python -m {{ cookiecutter.project_slug.replace('-', '_') }}`` with and without
+its bytecode cache, and the single-file zipapp built by
+``scripts/build_zipapp.py``, which carries its own bytecode. The zipapp is built into a
+temporary directory with its dependencies, which needs pip to reach the
+package index, unless ``--pyz`` points at an existing one. Times are the
+best of ``--repeat`` runs, after the files involved are in the page cache.
+Run with ``python benchmarks/bench_startup.py [--pyz dist/{{ cookiecutter.project_slug }}.pyz]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+from harness import Benchmarks, run
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "build_zipapp.py"
+COMMANDS = (["--version"], ["greet", "Ada"], ["greet", "--help"])
+
+
+def launch(command: list[str]) -> Callable[[], object]:
+    """Return a benchmark running ``command`` once."""
+    return lambda: subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+
+def launchers(pyz: Path, scratch: Path) -> dict[str, list[str]]:
+    """Return the command prefix of each launcher, in display order."""
+    prefixes = {}
+    entry_point = shutil.which("{{ cookiecutter.project_slug }}")
+    if entry_point is None:
+        print("{{ cookiecutter.project_slug }} is not installed; skipping the entry point\n")
+    else:
+        prefixes["entry point"] = [entry_point]
+    module = [sys.executable, "-m", "{{ cookiecutter.project_slug.replace('-', '_') }}"]
+    prefixes["python -m"] = module
+    # An empty bytecode cache that is never written: every module is compiled
+    # on each start, as in an image built with PYTHONDONTWRITEBYTECODE
+    no_cache = ["-B", "-X", f"pycache_prefix={scratch / 'no-cache'}"]
+    prefixes["python -m, no .pyc"] = [module[0], *no_cache, *module[1:]]
+    prefixes["zipapp"] = [sys.executable, str(pyz)]
+    return prefixes
+
+
+def main() -> None:
+    """Print a startup comparison table for each command."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pyz", type=Path, help="Existing zipapp to time")
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="Timed runs per benchmark (best kept)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        pyz = args.pyz
+        if pyz is None:
+            pyz = Path(directory) / "{{ cookiecutter.project_slug }}.pyz"
+            subprocess.run(
+                [sys.executable, str(SCRIPT), "--output", str(pyz)], check=True
+            )
+        prefixes = launchers(pyz, Path(directory))
+        for command in COMMANDS:
+            print(f"\n{' '.join(command)}")
+            benchmarks: Benchmarks = {
+                name: launch([*prefix, *command]) for name, prefix in prefixes.items()
+            }
+            run(benchmarks, items=1, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Minimal timing harness shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+# Benchmark name -> zero-argument callable running one full iteration
+Benchmarks = dict[str, Callable[[], object]]
+
+# Names written per block by write_names
+BLOCK_LINES = 100_000
+
+
+def run(benchmarks: Benchmarks, items: int, repeat: int = 5) -> dict[str, float]:
+    """Time each benchmark and print a comparison table.
+
+    Speedups are relative to the first benchmark.
+
+    Args:
+        benchmarks: Benchmarks to run, in display order.
+        items: Number of items processed per call, for the throughput column.
+        repeat: Number of timed runs; the best one is reported.
+
+    Returns:
+        The best wall time in seconds for each benchmark.
+    """
+    results: dict[str, float] = {}
+    for name, func in benchmarks.items():
+        results[name] = min(timeit.repeat(func, number=1, repeat=repeat))
+
+    baseline = next(iter(results.values()))
+    print(f"{'benchmark':<32} {'best (ms)':>10} {'items/s':>14} {'speedup':>8}")
+    for name, seconds in results.items():
+        print(
+            f"{name:<32} {seconds * 1e3:>10.2f} {items / seconds:>14,.0f} "
+            f"{baseline / seconds:>7.2f}x"
+        )
+    return results
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Return the ``fraction`` percentile of ``samples``, 0 if there are none."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def write_names(path: Path, size: int) -> int:
+    """Write generated names, one per line, to ``path`` until it holds ``size`` bytes.
+
+    Returns:
+        The number of lines written
+    """
+    lines = 0
+    with path.open("wb") as f:
+        while f.tell() < size:
+            block = "".join(f"user{lines + i}\n" for i in range(BLOCK_LINES))
+            f.write(block.encode())
+            lines += BLOCK_LINES
+    return lines
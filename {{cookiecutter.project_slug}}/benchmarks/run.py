@@ -0,0 +1,197 @@
+"""Record benchmark results per git commit and compare them.
+
+Usage::
+
+    python benchmarks/run.py record                  # run bench_api.py, store results
+    python benchmarks/run.py compare [BASE] [HEAD]   # default: last two records
+    python benchmarks/run.py list
+
+Results are kept in ``.benchmarks/history.json`` (ignored by git), one entry
+per commit: recording again on the same commit replaces its entry, and a tree
+with uncommitted changes is recorded as ``<commit>-dirty``. ``compare``
+accepts anything ``git rev-parse`` understands (``main``, ``HEAD~1``, a hash)
+and exits with status 1 when a benchmark got slower than ``--threshold``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from bench_api import suites
+from harness import run
+
+ROOT = Path(__file__).resolve().parents[1]
+HISTORY = ROOT / ".benchmarks" / "history.json"
+# Percentage slowdown reported as a regression by ``compare``
+DEFAULT_THRESHOLD = 10.0
+
+Record = dict[str, Any]
+
+
+def git(*args: str) -> str:
+    """Run a git command in the project root and return its stripped output."""
+    result = subprocess.run(
+        ["git", *args], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def current_commit() -> str:
+    """Return the short hash of HEAD, marked ``-dirty`` if the tree has changes."""
+    try:
+        commit = git("rev-parse", "--short", "HEAD")
+        dirty = git("status", "--porcelain", "--untracked-files=no")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def load_history() -> list[Record]:
+    """Return the recorded runs, oldest first."""
+    if not HISTORY.exists():
+        return []
+    with HISTORY.open(encoding="utf-8") as f:
+        records: list[Record] = json.load(f)
+    return records
+
+
+def save_history(records: list[Record]) -> None:
+    """Write the recorded runs, replacing the history file atomically."""
+    HISTORY.parent.mkdir(parents=True, exist_ok=True)
+    temporary = HISTORY.with_suffix(".tmp")
+    with temporary.open("w", encoding="utf-8") as f:
+        json.dump(records, f, indent=2)
+        f.write("\n")
+    os.replace(temporary, HISTORY)
+
+
+def find_record(records: list[Record], ref: str) -> Record:
+    """Return the latest record for ``ref``, a git revision or recorded commit."""
+    try:
+        commit = git("rev-parse", "--short", ref)
+    except (OSError, subprocess.CalledProcessError):
+        commit = ref
+    for record in reversed(records):
+        if record["commit"] in (ref, commit, f"{commit}-dirty"):
+            return record
+    raise SystemExit(f"No benchmark results recorded for {ref!r}")
+
+
+def record_command(args: argparse.Namespace) -> int:
+    """Run the benchmarks and store their results for the current commit."""
+    results: dict[str, dict[str, float]] = {}
+    for group, (benchmarks, items) in suites().items():
+        print(f"\n[{group}]")
+        for name, seconds in run(benchmarks, items=items, repeat=args.repeat).items():
+            results[f"{group}/{name}"] = {"seconds": seconds, "items": items}
+
+    commit = current_commit()
+    records = [r for r in load_history() if r["commit"] != commit]
+    records.append(
+        {
+            "commit": commit,
+            "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }
+    )
+    save_history(records)
+    print(f"\nRecorded {len(results)} results for {commit} in {HISTORY}")
+    return 0
+
+
+def compare_command(args: argparse.Namespace) -> int:
+    """Print the change between two records and flag regressions."""
+    records = load_history()
+    if not records:
+        raise SystemExit("No benchmark results recorded; run 'record' first")
+    head = find_record(records, args.head) if args.head else records[-1]
+    if args.base:
+        base = find_record(records, args.base)
+    elif records.index(head) > 0:
+        base = records[records.index(head) - 1]
+    else:
+        raise SystemExit(f"No run recorded before {head['commit']} to compare with")
+
+    print(f"{'benchmark':<32} {base['commit']:>14} {head['commit']:>14} {'change':>8}")
+    regressions = []
+    for name, result in head["results"].items():
+        before = base["results"].get(name)
+        if before is None:
+            print(f"{name:<32} {'-':>14} {result['seconds'] * 1e3:>12.2f}ms {'new':>8}")
+            continue
+        change = (result["seconds"] / before["seconds"] - 1) * 100
+        flag = ""
+        if change > args.threshold:
+            regressions.append(name)
+            flag = "  slower"
+        print(
+            f"{name:<32} {before['seconds'] * 1e3:>12.2f}ms "
+            f"{result['seconds'] * 1e3:>12.2f}ms {change:>+7.1f}%{flag}"
+        )
+
+    if regressions:
+        print(
+            f"\n{len(regressions)} benchmark(s) slower by more than {args.threshold}%"
+        )
+        return 1
+    return 0
+
+
+def list_command(_args: argparse.Namespace) -> int:
+    """Print the recorded runs, oldest first."""
+    for record in load_history():
+        print(
+            f"{record['commit']:<16} {record['recorded_at']}  "
+            f"Python {record['python']}  {len(record['results'])} results"
+        )
+    return 0
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the command line parser."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="Run and record the benchmarks")
+    record.add_argument(
+        "--repeat", type=int, default=5, help="Timed runs per benchmark (best kept)"
+    )
+    record.set_defaults(func=record_command)
+
+    compare = commands.add_parser("compare", help="Compare two recorded runs")
+    compare.add_argument(
+        "base", nargs="?", help="Baseline revision (default: previous)"
+    )
+    compare.add_argument("head", nargs="?", help="Revision to check (default: latest)")
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Slowdown in percent reported as a regression (default: {DEFAULT_THRESHOLD})",
+    )
+    compare.set_defaults(func=compare_command)
+
+    commands.add_parser("list", help="List the recorded runs").set_defaults(
+        func=list_command
+    )
+    return parser
+
+
+def main() -> int:
+    """Run the selected command."""
+    args = create_parser().parse_args()
+    return int(args.func(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
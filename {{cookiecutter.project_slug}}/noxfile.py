@@ -82,6 +82,45 @@ def build(session: nox.Session) -> None:
     session.run("python", "-m", "build")
 
 
+{%- if cookiecutter.use_mypyc == "y" and cookiecutter.build_backend in ["setuptools", "hatchling"] %}
+@nox.session(python=PYTHON_VERSIONS)
+def tests_compiled(session: nox.Session) -> None:
+    """Run the tests against the mypyc-compiled wheel, not the source tree."""
+    session.run("python", "scripts/test_compiled.py", *session.posargs)
+{%- endif %}
+
+
+{%- if cookiecutter.command_line_interface != "none" %}
+@nox.session
+def zipapp(session: nox.Session) -> None:
+    """Build a single-file zipapp; the bytecode matches the session's Python."""
+    session.install("tomli>=1.1; python_version < '3.11'")
+    session.run("python", "scripts/build_zipapp.py", *session.posargs)
+
+
+@nox.session
+def completions(session: nox.Session) -> None:
+    """Write static shell completion scripts to dist/completions/."""
+    session.install(".")
+    session.run(
+        "python",
+        "-m",
+        "{{ cookiecutter.project_slug.replace('-', '_') }}.completion",
+        "--output",
+        "dist/completions",
+    )
+{%- endif %}
+
+
+{%- if cookiecutter.use_benchmarks == "y" %}
+@nox.session
+def bench(session: nox.Session) -> None:
+    """Record the benchmarks; ``nox -s bench -- compare`` compares records."""
+    session.install("-e", ".")
+    session.run("python", "benchmarks/run.py", *(session.posargs or ["record"]))
+{%- endif %}
+
+
 {%- if cookiecutter.use_coverage == "y" and cookiecutter.use_pytest == "y" %}
 @nox.session
 def coverage(session: nox.Session) -> None:
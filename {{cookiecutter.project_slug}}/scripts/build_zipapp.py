@@ -0,0 +1,130 @@
+"""Build {{ cookiecutter.project_slug }} into a single-file zipapp.
+
+The archive holds the package and its pure-Python dependencies, compiled
+ahead of time, so it runs on any host with the same Python version, with no
+virtual environment or install step::
+
+    python dist/{{ cookiecutter.project_slug }}.pyz greet Ada
+
+Modules are stored as bytecode only, in the ``module.pyc`` layout zipimport
+reads: zipimport never writes bytecode, so sources alone would be compiled
+again on every start. Bytecode only runs on the Python version that wrote
+it, so build with the interpreter the archive will run on. It is compiled at
+optimization level 1, which strips assertions; level 2 would also strip the
+docstrings the CLI shows as help. Dependencies with extension modules cannot
+be imported from a zip file and are refused.
+
+Run with ``python scripts/build_zipapp.py [--output PATH] [--no-deps]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import compileall
+import shutil
+import subprocess
+import sys
+import tempfile
+import zipapp
+from pathlib import Path
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+PROJECT = Path(__file__).resolve().parents[1]
+PACKAGE = "{{ cookiecutter.project_slug.replace('-', '_') }}"
+OUTPUT = PROJECT / "dist" / "{{ cookiecutter.project_slug }}.pyz"
+OPTIMIZE = 1
+INTERPRETER = "/usr/bin/env python3"
+# Files that cannot be imported from a zip file
+EXTENSIONS = (".so", ".pyd")
+
+
+def dependencies() -> list[str]:
+    """Return the runtime requirements declared in pyproject.toml."""
+    with (PROJECT / "pyproject.toml").open("rb") as f:
+        requirements: list[str] = tomllib.load(f)["project"]["dependencies"]
+    return requirements
+
+
+def stage(staging: Path, *, with_deps: bool) -> None:
+    """Copy the package, and install its dependencies, into ``staging``."""
+    shutil.copytree(
+        PROJECT / "src" / PACKAGE,
+        staging / PACKAGE,
+        # Leftovers of in-place compiled builds, such as hatch-mypyc's
+        ignore=shutil.ignore_patterns(
+            "__pycache__", "*.pyc", "*.c", *(f"*{suffix}" for suffix in EXTENSIONS)
+        ),
+    )
+    requirements = dependencies() if with_deps else []
+    if requirements:
+        command = [sys.executable, "-m", "pip", "install", "--quiet"]
+        command += ["--no-compile", "--target", str(staging), *requirements]
+        subprocess.run(command, check=True)
+        # Console scripts of the dependencies, useless inside the archive
+        shutil.rmtree(staging / "bin", ignore_errors=True)
+
+    extensions = sorted(p for p in staging.rglob("*") if p.suffix in EXTENSIONS)
+    if extensions:
+        names = ", ".join(str(p.relative_to(staging)) for p in extensions)
+        raise SystemExit(f"cannot bundle extension modules: {names}")
+
+
+def compile_sources(staging: Path, optimize: int) -> None:
+    """Replace every module in ``staging`` with its bytecode."""
+    if not compileall.compile_dir(
+        staging, quiet=1, legacy=True, optimize=optimize, workers=0
+    ):
+        raise SystemExit("compilation failed")
+    for source in staging.rglob("*.py"):
+        source.unlink()
+
+
+def build(output: Path, *, with_deps: bool = True, optimize: int = OPTIMIZE) -> Path:
+    """Build the zipapp at ``output`` and return its path."""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory() as directory:
+        staging = Path(directory)
+        stage(staging, with_deps=with_deps)
+        compile_sources(staging, optimize)
+        zipapp.create_archive(
+            staging,
+            output,
+            interpreter=INTERPRETER,
+            main=f"{PACKAGE}.__main__:main",
+            compressed=True,
+        )
+    return output
+
+
+def main() -> None:
+    """Build the zipapp and print its path and size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--output", type=Path, default=OUTPUT, help=f"Archive path (default: {OUTPUT})"
+    )
+    parser.add_argument(
+        "--no-deps",
+        dest="with_deps",
+        action="store_false",
+        help="Leave the dependencies to the host instead of bundling them",
+    )
+    parser.add_argument(
+        "--optimize",
+        type=int,
+        choices=(0, 1, 2),
+        default=OPTIMIZE,
+        help=f"Bytecode optimization level (default: {OPTIMIZE})",
+    )
+    args = parser.parse_args()
+
+    output = build(args.output, with_deps=args.with_deps, optimize=args.optimize)
+    size = output.stat().st_size
+    print(f"Built {output} ({size / 2**10:,.0f} KiB), Python {sys.version.split()[0]}")
+
+
+if __name__ == "__main__":
+    main()
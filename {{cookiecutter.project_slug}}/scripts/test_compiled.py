@@ -0,0 +1,71 @@
+"""Run the test suite against the mypyc-compiled wheel of {{ cookiecutter.project_slug }}.
+
+The source tree and editable installs hold the interpreted ``core.py``, so a
+plain ``pytest`` run never imports the compiled module. This builds a wheel
+from a copy of the project, since hatch-mypyc compiles in place and would
+leave extension modules in ``src/`` to shadow the sources, installs it with
+the ``dev`` extra into a fresh virtual environment, checks that the installed
+core is the C extension, and runs the tests with that environment's
+interpreter. They run from the project root, whose ``src/`` directory is not
+on ``sys.path``, so every import resolves to the wheel.
+
+Run with ``python scripts/test_compiled.py [TEST_ARGS...]``.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import venv
+from pathlib import Path
+
+PROJECT = Path(__file__).resolve().parents[1]
+PACKAGE = "{{ cookiecutter.project_slug.replace('-', '_') }}"
+# Fails when the wheel was built without the extension, e.g. with the
+# pure-Python fallback switch left set in the environment
+CHECK = (
+    f"import {PACKAGE}.core as core; "
+    "assert not core.__file__.endswith('.py'), f'{core.__file__} is not compiled'"
+)
+# Left out of the copy the wheel is built from
+IGNORE = shutil.ignore_patterns(
+    ".git", ".nox", ".tox", ".venv", "build", "dist", "__pycache__", "*.so", "*.pyd"
+)
+
+
+def create_environment(directory: Path) -> Path:
+    """Create a virtual environment in ``directory`` and return its interpreter."""
+    venv.create(directory, with_pip=True)
+    scripts = "Scripts" if sys.platform == "win32" else "bin"
+    return directory / scripts / "python"
+
+
+def main() -> int:
+    """Build and install the wheel, then return the exit code of its test run."""
+    with tempfile.TemporaryDirectory() as directory:
+        python = create_environment(Path(directory) / "venv")
+        source = shutil.copytree(PROJECT, Path(directory) / "project", ignore=IGNORE)
+        dist = Path(directory) / "dist"
+        command = [str(python), "-m", "pip", "wheel", "--no-deps", "--quiet"]
+        subprocess.run([*command, "--wheel-dir", str(dist), str(source)], check=True)
+        (wheel,) = dist.glob("*.whl")
+        subprocess.run(
+            [str(python), "-m", "pip", "install", "--quiet", f"{wheel}[dev]"],
+            check=True,
+        )
+        subprocess.run([str(python), "-c", CHECK], check=True)
+{%- if cookiecutter.use_pytest == "y" and cookiecutter.use_coverage == "y" %}
+        # Coverage cannot trace the extension, and would overwrite the reports
+        tests = [str(python), "-m", "pytest", "--no-cov", *sys.argv[1:]]
+{%- elif cookiecutter.use_pytest == "y" %}
+        tests = [str(python), "-m", "pytest", *sys.argv[1:]]
+{%- else %}
+        tests = [str(python), "-m", "unittest", "discover", "tests", *sys.argv[1:]]
+{%- endif %}
+        return subprocess.run(tests, cwd=PROJECT, check=False).returncode
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""Build script compiling the core module with mypyc.
+
+All project metadata lives in pyproject.toml; this file only adds the
+extension module. Set {{ cookiecutter.project_slug.replace('-', '_').upper() }}_PURE_PYTHON=1 to build the pure-Python
+fallback wheel instead.
+"""
+
+import os
+
+from setuptools import setup
+
+if os.environ.get("{{ cookiecutter.project_slug.replace('-', '_').upper() }}_PURE_PYTHON") == "1":
+    ext_modules = []
+else:
+    from mypyc.build import mypycify
+
+    # mypyc only compiles core.py, so the tests.* mypy override would be
+    # reported as unused and, with warn_unused_configs, fail the build
+    ext_modules = mypycify(
+        [
+            "--no-warn-unused-configs",
+            "src/{{ cookiecutter.project_slug.replace('-', '_') }}/core.py",
+        ],
+        opt_level="3",
+    )
+
+setup(ext_modules=ext_modules)
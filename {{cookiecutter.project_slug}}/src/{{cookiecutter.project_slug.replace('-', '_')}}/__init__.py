@@ -1,10 +1,126 @@
 """{{ cookiecutter.project_name }}.
 
 {{ cookiecutter.project_short_description }}
+
+Public names are loaded from their submodule on first access (PEP 562), so
+importing the package and reading ``__version__`` imports no submodule.
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "{{ cookiecutter.version }}"
 __author__ = "{{ cookiecutter.full_name }}"
 __email__ = "{{ cookiecutter.email }}"
 
-__all__ = ["__version__", "__author__", "__email__"]
+# Public name -> submodule defining it
+_LAZY_ATTRS = {
+    "{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}": "core",
+    "{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}Collection": "core",
+    "add_many": "core",
+    "add_numbers": "core",
+    "greet_chunks": "core",
+    "greet_lines": "core",
+    "greetings_nbytes": "core",
+    "hello_world": "core",
+    "hello_world_many": "core",
+    "iter_buffer_chunks": "core",
+    "iter_line_blocks": "core",
+    "iter_line_chunks": "core",
+    "parallel_map": "core",
+    "shutdown_pool": "core",
+    "write_greetings": "core",
+    "write_greetings_into": "core",
+    "Cached{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}": "cache",
+    "LRUCache": "cache",
+    "cached_hello_world": "cache",
+    "memoize": "cache",
+    "aadd_numbers": "aio",
+    "agreet_many": "aio",
+    "ahello_world": "aio",
+}
+
+# Submodules reachable as attributes, e.g. {{ cookiecutter.project_slug.replace('-', '_') }}.core
+_LAZY_SUBMODULES = {"aio", "cache", "core", "instrumentation"}
+
+if TYPE_CHECKING:
+    # Keep static type checkers and IDEs aware of the lazy names
+    from . import aio as aio
+    from . import cache as cache
+    from . import core as core
+    from . import instrumentation as instrumentation
+    from .aio import aadd_numbers, agreet_many, ahello_world
+    from .cache import (
+        Cached{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }},
+        LRUCache,
+        cached_hello_world,
+        memoize,
+    )
+    from .core import (
+        {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }},
+        {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}Collection,
+        add_many,
+        add_numbers,
+        greet_chunks,
+        greet_lines,
+        greetings_nbytes,
+        hello_world,
+        hello_world_many,
+        iter_buffer_chunks,
+        iter_line_blocks,
+        iter_line_chunks,
+        parallel_map,
+        shutdown_pool,
+        write_greetings,
+        write_greetings_into,
+    )
+
+# Spelled out rather than derived from _LAZY_ATTRS so type checkers can read it
+__all__ = [
+    "__version__",
+    "__author__",
+    "__email__",
+    "{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}",
+    "{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}Collection",
+    "add_many",
+    "add_numbers",
+    "greet_chunks",
+    "greet_lines",
+    "greetings_nbytes",
+    "hello_world",
+    "hello_world_many",
+    "iter_buffer_chunks",
+    "iter_line_blocks",
+    "iter_line_chunks",
+    "parallel_map",
+    "shutdown_pool",
+    "write_greetings",
+    "write_greetings_into",
+    "Cached{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}",
+    "LRUCache",
+    "cached_hello_world",
+    "memoize",
+    "aadd_numbers",
+    "agreet_many",
+    "ahello_world",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule providing ``name`` on first access."""
+    import importlib
+
+    if name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRS:
+        module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache it so that __getattr__ is not called again for this name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names, including those not loaded yet."""
+    return sorted({*globals(), *_LAZY_ATTRS, *_LAZY_SUBMODULES})
@@ -0,0 +1,28 @@
+"""Run {{ cookiecutter.project_name }} with ``python -m {{ cookiecutter.project_slug.replace('-', '_') }}``.
+{%- if cookiecutter.command_line_interface != "none" %}
+
+The same entry point as the ``{{ cookiecutter.project_slug }}`` console script, for hosts where
+only the package is on the path: containers, zipapps and ``PYTHONPATH``
+checkouts.
+"""
+
+from .dispatch import main
+
+if __name__ == "__main__":
+    main()
+{%- else %}
+
+The project has no command line interface, so this prints its version.
+"""
+
+from . import __version__
+
+
+def main() -> None:
+    """Print the project name and version."""
+    print(f"{{ cookiecutter.project_name }} v{__version__}")
+
+
+if __name__ == "__main__":
+    main()
+{%- endif %}
@@ -0,0 +1,128 @@
+"""Asyncio counterparts of the core functions.
+
+The core functions are synchronous and CPU-bound: greeting a million names in
+one call keeps the event loop busy for the whole batch. :func:`agreet_many`
+instead works through its input one chunk at a time and yields to the loop
+between chunks, or hands chunks to worker threads. Input is only read as the
+caller consumes greetings, so a slow consumer never makes it buffer more than
+a few chunks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+
+from {{ cookiecutter.project_slug.replace('-', '_') }}.core import add_numbers, hello_world, hello_world_many
+
+# Number of names greeted between two yields to the event loop
+DEFAULT_CHUNK_SIZE = 1024
+
+
+async def ahello_world(name: str = "World") -> str:
+    """Return a greeting message; awaitable version of ``core.hello_world``.
+
+    Example:
+        >>> asyncio.run(ahello_world("Python"))
+        'Hello, Python!'
+    """
+    return hello_world(name)
+
+
+async def aadd_numbers(a: float, b: float) -> float:
+    """Add two numbers together; awaitable version of ``core.add_numbers``."""
+    return add_numbers(a, b)
+
+
+def _greet_block(block: list[str]) -> list[str]:
+    """Return the greetings for one chunk of names."""
+    return list(hello_world_many(block))
+
+
+async def _iter_blocks(
+    names: Iterable[str] | AsyncIterable[str], chunk_size: int
+) -> AsyncIterator[list[str]]:
+    """Yield lists of up to ``chunk_size`` names from a sync or async iterable."""
+    if isinstance(names, AsyncIterable):
+        block: list[str] = []
+        async for name in names:
+            block.append(name)
+            if len(block) == chunk_size:
+                yield block
+                block = []
+        if block:
+            yield block
+        return
+
+    remaining = iter(names)
+    while block := list(itertools.islice(remaining, chunk_size)):
+        yield block
+
+
+async def agreet_many(
+    names: Iterable[str] | AsyncIterable[str],
+    *,
+    concurrency: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[str]:
+    """Asynchronously yield a greeting for each name, in input order.
+
+    Without ``concurrency``, each chunk of names is greeted on the event loop
+    and control returns to the loop before the next chunk, so other tasks
+    wait at most one chunk. With ``concurrency=N``, chunks are greeted in the
+    default executor's threads, at most ``N`` at a time; the next chunk is
+    only read from ``names`` once one of them is done. Threads still share
+    the GIL with the loop, so measure both modes (``benchmarks/bench_async.py``)
+    before choosing; the threaded mode pays off on free-threaded builds.
+
+    Cancelling the consuming task, or closing the iterator, cancels the
+    chunks still pending. Wrap the iterator in ``contextlib.aclosing`` when
+    breaking out of the loop early to release them immediately.
+
+    Args:
+        names: The names to greet, as a regular or asynchronous iterable.
+        concurrency: Maximum number of chunks greeted in worker threads at
+            once, or None to greet on the event loop itself.
+        chunk_size: Number of names greeted per step.
+
+    Yields:
+        Greeting messages, in input order.
+
+    Raises:
+        ValueError: If ``concurrency`` or ``chunk_size`` is less than 1.
+
+    Example:
+        >>> async def main():
+        ...     return [greeting async for greeting in agreet_many(["Alice", "Bob"])]
+        >>> asyncio.run(main())
+        ['Hello, Alice!', 'Hello, Bob!']
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if concurrency is not None and concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    if concurrency is None:
+        async for block in _iter_blocks(names, chunk_size):
+            for greeting in _greet_block(block):
+                yield greeting
+            # Let other tasks run before greeting the next chunk
+            await asyncio.sleep(0)
+        return
+
+    pending: deque[asyncio.Future[list[str]]] = deque()
+    try:
+        async for block in _iter_blocks(names, chunk_size):
+            greeted = asyncio.to_thread(_greet_block, block)
+            pending.append(asyncio.ensure_future(greeted))
+            if len(pending) >= concurrency:
+                for greeting in await pending.popleft():
+                    yield greeting
+        while pending:
+            for greeting in await pending.popleft():
+                yield greeting
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,249 @@
+"""Opt-in memoization for greetings.
+
+Nothing in :mod:`{{ cookiecutter.project_slug.replace('-', '_') }}.core` is cached by default. Workloads that greet the
+same names over and over can use :func:`cached_hello_world` or
+:class:`Cached{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}` instead, or wrap their own functions with
+:func:`memoize`. Caches are bounded LRUs with optional time-to-live and are
+safe to share between threads.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, Generic, NamedTuple, TypeVar, cast
+
+from {{ cookiecutter.project_slug.replace('-', '_') }} import core
+from {{ cookiecutter.project_slug.replace('-', '_') }}.core import {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}
+
+T = TypeVar("T")
+
+# Default number of entries kept by the ready-made greeting caches
+DEFAULT_MAXSIZE = 4096
+
+# Separates positional from keyword arguments in cache keys
+_KWARGS_MARK = object()
+
+# Default passed to LRUCache.get so that None results can be cached too
+_MISSING: Any = object()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of an :class:`LRUCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    maxsize: int
+    currsize: int
+    ttl: float | None
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups that were hits (0.0 without lookups)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(Generic[T]):
+    """Thread-safe bounded mapping with least-recently-used eviction.
+
+    When full, adding an entry evicts the least recently used one. With a
+    ``ttl``, entries older than ``ttl`` seconds are treated as missing and
+    dropped when looked up.
+
+    Example:
+        >>> cache: LRUCache[str] = LRUCache(maxsize=2)
+        >>> cache.put("a", "A")
+        >>> cache.get("a")
+        'A'
+        >>> cache.get("b") is None
+        True
+        >>> cache.cache_info().hits
+        1
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: float | None = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries, at least 1
+            ttl: Seconds an entry stays valid after being stored, or None to
+                keep entries until they are evicted
+            timer: Clock used for expiry, in seconds
+
+        Raises:
+            ValueError: If ``maxsize`` or ``ttl`` is not positive
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        # key -> (value, expiry time or None), least recently used first
+        self._entries: OrderedDict[Hashable, tuple[T, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def get(self, key: Hashable, default: T | None = None) -> T | None:
+        """Return the value for ``key``, or ``default`` if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > self._timer():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+                self._expirations += 1
+            self._misses += 1
+            return default
+
+    def put(self, key: Hashable, value: T) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entry if full."""
+        expires = None if self.ttl is None else self._timer() + self.ttl
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Return a snapshot of the cache statistics."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+                ttl=self.ttl,
+            )
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones."""
+        return len(self._entries)
+
+
+class CachedFunction(Generic[T]):
+    """Callable wrapping a function with an :class:`LRUCache`.
+
+    Calls are looked up by their arguments, which must be hashable. Passing
+    ``bypass_cache=True`` calls the wrapped function directly, without
+    reading, storing or counting anything. Concurrent misses for the same
+    key may each call the function; the last result stored wins.
+    """
+
+    def __init__(self, func: Callable[..., T], cache: LRUCache[T]) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            func: The function to cache, which should be pure
+            cache: The cache holding its results
+        """
+        self.__wrapped__ = func
+        self.cache = cache
+        self.__name__ = getattr(func, "__name__", type(func).__name__)
+        self.__doc__ = func.__doc__
+
+    def __call__(self, *args: Any, bypass_cache: bool = False, **kwargs: Any) -> T:
+        """Return the cached result of ``func(*args, **kwargs)``."""
+        if bypass_cache:
+            return self.__wrapped__(*args, **kwargs)
+        key: Hashable = args
+        if kwargs:
+            key = (*args, _KWARGS_MARK, *kwargs.items())
+        value = self.cache.get(key, _MISSING)
+        if value is _MISSING:
+            result = self.__wrapped__(*args, **kwargs)
+            self.cache.put(key, result)
+            return result
+        return cast("T", value)
+
+    def cache_info(self) -> CacheInfo:
+        """Return the statistics of the underlying cache."""
+        return self.cache.cache_info()
+
+    def cache_clear(self) -> None:
+        """Remove all cached results and reset the statistics."""
+        self.cache.clear()
+
+    def __repr__(self) -> str:
+        """Return string representation of the wrapper."""
+        return f"<cached function {self.__name__} {self.cache_info()}>"
+
+
+def memoize(
+    maxsize: int = DEFAULT_MAXSIZE, ttl: float | None = None
+) -> Callable[[Callable[..., T]], CachedFunction[T]]:
+    """Decorate a function with a bounded, optionally expiring LRU cache.
+
+    Args:
+        maxsize: Maximum number of cached results
+        ttl: Seconds a result stays valid, or None for no expiry
+
+    Returns:
+        A decorator returning a :class:`CachedFunction`
+
+    Example:
+        >>> @memoize(maxsize=128)
+        ... def shout(name: str) -> str:
+        ...     return name.upper()
+        >>> shout("hi"), shout("hi"), shout("hi", bypass_cache=True)
+        ('HI', 'HI', 'HI')
+        >>> shout.cache_info().hits
+        1
+    """
+
+    def decorator(func: Callable[..., T]) -> CachedFunction[T]:
+        return CachedFunction(func, LRUCache(maxsize=maxsize, ttl=ttl))
+
+    return decorator
+
+
+@functools.wraps(core.hello_world)
+def _hello_world(name: str = "World") -> str:
+    # Looked up on every miss, so that the timing wrapper instrumentation.enable()
+    # binds to core.hello_world records the calls the cache passes through
+    return core.hello_world(name)
+
+
+# Shared by cached_hello_world and Cached{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}.greet
+cached_hello_world: CachedFunction[str] = memoize()(_hello_world)
+
+
+class Cached{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}({{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}):
+    """Main class whose greetings come from :func:`cached_hello_world`."""
+
+    __slots__ = ()
+
+    def greet(self, *, bypass_cache: bool = False) -> str:
+        """Return a greeting from this instance, cached by name.
+
+        Args:
+            bypass_cache: Compute the greeting without using the cache
+
+        Returns:
+            A personalized greeting
+        """
+        return cached_hello_world(self.name, bypass_cache=bypass_cache)
@@ -2,17 +2,43 @@
 """Command line interface for {{ cookiecutter.project_name }}."""
 {%- if cookiecutter.command_line_interface == "typer" %}
 
-from typing import Annotated
+from typing import Annotated, Optional
 
 import typer
+from typer.core import TyperGroup
 
 from . import __version__
+from .batch import greet_stream
 from .core import hello_world
+from .formats import FORMATS, format_records
+from .instrumentation import instrument
+from .profiling import DEFAULT_PATH, SORT_KEYS, expand_profile_flag, profiled
+
+# Defaults of server.serve; the server module is only imported by the serve
+# command, since asyncio alone takes longer to import than the rest of the CLI
+SERVE_HOST = "127.0.0.1"
+SERVE_PORT = 8000
+MAX_PORT = 65535
+
+
+class ProfileGroup(TyperGroup):
+    """Command group accepting a bare ``--profile`` before the command name."""
+
+    # typer.Context, since typer 0.27 bundles its own click instead of the
+    # click package; both are subclasses of the Context the base class takes
+    def parse_args(self, ctx: typer.Context, args: list[str]) -> list[str]:  # type: ignore[override]
+        """Give a bare ``--profile`` its default path, then parse ``args``."""
+        return super().parse_args(ctx, expand_profile_flag(args))
+
 
 app = typer.Typer(
     name="{{ cookiecutter.project_slug }}",
     help="{{ cookiecutter.project_short_description }}",
     no_args_is_help=True,
+    cls=ProfileGroup,
+    # Static scripts from the completion module replace typer's completion,
+    # which runs the program on every TAB press
+    add_completion=False,
 )
 
 
@@ -25,7 +51,8 @@ def version_callback(value: bool) -> None:
 
 @app.callback()
 def main(
-    version: Annotated[
+    ctx: typer.Context,
+    version: Annotated[  # noqa: ARG001 (handled by version_callback)
         bool,
         typer.Option(
             "--version",
@@ -35,20 +62,106 @@ def main(
             help="Show version and exit.",
         ),
     ] = False,
+    profile: Annotated[
+        Optional[str],
+        typer.Option(
+            "--profile",
+            metavar="[=PATH]",
+            help=(
+                "Profile the command with cProfile, writing PATH "
+                f"(default: {DEFAULT_PATH}) and collapsed stacks next to it."
+            ),
+            show_default=False,
+        ),
+    ] = None,
+    profile_sort: Annotated[
+        Optional[str],
+        typer.Option(
+            "--profile-sort",
+            metavar="KEY",
+            help=f"Profile and print the top functions by KEY: {', '.join(SORT_KEYS)}.",
+            autocompletion=lambda: SORT_KEYS,
+            show_default=False,
+        ),
+    ] = None,
 ) -> None:
     """{{ cookiecutter.project_short_description }}"""
+    if profile_sort is not None and profile_sort not in SORT_KEYS:
+        raise typer.BadParameter(
+            f"must be one of {', '.join(SORT_KEYS)}", param_hint="--profile-sort"
+        )
+    ctx.with_resource(profiled(profile, profile_sort))
 
 
 @app.command()
+@instrument
 def greet(
+    ctx: typer.Context,
     name: Annotated[
         str,
         typer.Argument(help="Name to greet"),
     ] = "World",
+    input_file: Annotated[
+        Optional[typer.FileBinaryRead],
+        typer.Option(
+            "--input",
+            "-i",
+            metavar="FILE",
+            help="Greet each line of FILE instead, or of standard input for '-'.",
+            show_default=False,
+        ),
+    ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=0,
+            help="Worker processes for a large --input file; 0 uses every CPU.",
+        ),
+    ] = 1,
+    output_format: Annotated[
+        str,
+        typer.Option(
+            "--format",
+            "-f",
+            metavar="FORMAT",
+            help=f"Output format: {', '.join(FORMATS)}.",
+            autocompletion=lambda: FORMATS,
+        ),
+    ] = "text",
 ) -> None:
     """Greet someone."""
+    if output_format not in FORMATS:
+        raise typer.BadParameter(
+            f"must be one of {', '.join(FORMATS)}", param_hint="--format"
+        )
+    if input_file is not None:
+        # Compared by name for the same reason as ProfileGroup.parse_args
+        source = ctx.get_parameter_source("name")
+        if getattr(source, "name", None) != "DEFAULT":
+            raise typer.BadParameter(
+                "cannot be combined with --input", param_hint="NAME"
+            )
+        raise typer.Exit(greet_stream(input_file, jobs, output_format))
     message = hello_world(name)
-    typer.echo(message)
+    typer.echo(format_records([(name, message)], output_format), nl=False)
+
+
+@app.command()
+def serve(
+    host: Annotated[str, typer.Option(help="Address to listen on.")] = SERVE_HOST,
+    port: Annotated[
+        int,
+        typer.Option(
+            min=0, max=MAX_PORT, help="Port to listen on; 0 picks a free one."
+        ),
+    ] = SERVE_PORT,
+) -> None:
+    """Serve hello_world, batch greeting and add_numbers over HTTP/JSON."""
+    from . import server
+
+    server.serve(host, port)
 
 
 if __name__ == "__main__":
@@ -56,26 +169,120 @@ if __name__ == "__main__":
 
 {%- elif cookiecutter.command_line_interface == "click" %}
 
+from typing import BinaryIO, Optional
+
 import click
+from click.core import ParameterSource
 
 from . import __version__
+from .batch import greet_stream
 from .core import hello_world
-
-
-@click.group()
-@click.version_option(version=__version__)
+from .formats import FORMATS, format_records
+from .instrumentation import instrument
+from .profiling import DEFAULT_PATH, SORT_KEYS, expand_profile_flag, profiled
+
+# Defaults of server.serve; the server module is only imported by the serve
+# command, since asyncio alone takes longer to import than the rest of the CLI
+SERVE_HOST = "127.0.0.1"
+SERVE_PORT = 8000
+MAX_PORT = 65535
+
+
+class ProfileGroup(click.Group):
+    """Command group accepting a bare ``--profile`` before the command name."""
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        """Give a bare ``--profile`` its default path, then parse ``args``."""
+        return super().parse_args(ctx, expand_profile_flag(args))
+
+
+@click.group(cls=ProfileGroup)
+@click.version_option(version=__version__, prog_name="{{ cookiecutter.project_slug }}")
+@click.option(
+    "--profile",
+    metavar="[=PATH]",
+    help=(
+        "Profile the command with cProfile, writing PATH "
+        f"(default: {DEFAULT_PATH}) and collapsed stacks next to it."
+    ),
+)
+@click.option(
+    "--profile-sort",
+    type=click.Choice(SORT_KEYS),
+    help="Profile and print the top functions by this key.",
+)
 @click.pass_context
-def main(ctx: click.Context) -> None:
+def main(
+    ctx: click.Context, profile: Optional[str], profile_sort: Optional[str]
+) -> None:
     """{{ cookiecutter.project_short_description }}"""
     ctx.ensure_object(dict)
+    ctx.with_resource(profiled(profile, profile_sort))
 
 
 @main.command()
 @click.argument("name", default="World")
-def greet(name: str) -> None:
+@click.option(
+    "--input",
+    "-i",
+    "input_file",
+    type=click.File("rb"),
+    metavar="FILE",
+    help="Greet each line of FILE instead, or of standard input for '-'.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Worker processes for a large --input file; 0 uses every CPU.",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(FORMATS),
+    default="text",
+    show_default=True,
+    help="Output format.",
+)
+@click.pass_context
+@instrument
+def greet(
+    ctx: click.Context,
+    name: str,
+    input_file: Optional[BinaryIO],
+    jobs: int,
+    output_format: str,
+) -> None:
     """Greet someone."""
+    if input_file is not None:
+        if ctx.get_parameter_source("name") is not ParameterSource.DEFAULT:
+            raise click.BadParameter(
+                "cannot be combined with --input", param_hint="NAME"
+            )
+        ctx.exit(greet_stream(input_file, jobs, output_format))
     message = hello_world(name)
-    click.echo(message)
+    click.echo(format_records([(name, message)], output_format), nl=False)
+
+
+@main.command()
+@click.option(
+    "--host", default=SERVE_HOST, show_default=True, help="Address to listen on."
+)
+@click.option(
+    "--port",
+    type=click.IntRange(0, MAX_PORT),
+    default=SERVE_PORT,
+    show_default=True,
+    help="Port to listen on; 0 picks a free one.",
+)
+def serve(host: str, port: int) -> None:
+    """Serve hello_world, batch greeting and add_numbers over HTTP/JSON."""
+    from . import server
+
+    server.serve(host, port)
 
 
 if __name__ == "__main__":
@@ -87,7 +294,17 @@ import argparse
 import sys
 
 from . import __version__
+from .batch import greet_stream, open_input
 from .core import hello_world
+from .formats import FORMATS, format_records
+from .instrumentation import instrument
+from .profiling import DEFAULT_PATH, SORT_KEYS, expand_profile_flag, profiled
+
+# Defaults of server.serve; the server module is only imported by the serve
+# command, since asyncio alone takes longer to import than the rest of the CLI
+SERVE_HOST = "127.0.0.1"
+SERVE_PORT = 8000
+MAX_PORT = 65535
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -101,6 +318,20 @@ def create_parser() -> argparse.ArgumentParser:
         action="version",
         version=f"{{ cookiecutter.project_name }} v{__version__}",
     )
+    parser.add_argument(
+        "--profile",
+        metavar="[=PATH]",
+        help=(
+            "Profile the command with cProfile, writing PATH "
+            f"(default: {DEFAULT_PATH}) and collapsed stacks next to it"
+        ),
+    )
+    parser.add_argument(
+        "--profile-sort",
+        choices=SORT_KEYS,
+        metavar="KEY",
+        help=f"Profile and print the top functions by KEY: {', '.join(SORT_KEYS)}",
+    )
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
@@ -109,24 +340,86 @@ def create_parser() -> argparse.ArgumentParser:
     greet_parser.add_argument(
         "name",
         nargs="?",
-        default="World",
         help="Name to greet (default: World)",
     )
+    greet_parser.add_argument(
+        "--input",
+        "-i",
+        metavar="FILE",
+        help="Greet each line of FILE instead, or of standard input for '-'",
+    )
+    greet_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Worker processes for a large --input file; 0 uses every CPU (default: 1)",
+    )
+    greet_parser.add_argument(
+        "--format",
+        "-f",
+        dest="output_format",
+        choices=FORMATS,
+        default="text",
+        help="Output format (default: text)",
+    )
+
+    # Serve command
+    serve_parser = subparsers.add_parser(
+        "serve", help="Serve hello_world, batch greeting and add_numbers over HTTP/JSON"
+    )
+    serve_parser.add_argument(
+        "--host",
+        default=SERVE_HOST,
+        help=f"Address to listen on (default: {SERVE_HOST})",
+    )
+    serve_parser.add_argument(
+        "--port",
+        type=int,
+        default=SERVE_PORT,
+        help=f"Port to listen on; 0 picks a free one (default: {SERVE_PORT})",
+    )
 
     return parser
 
 
+@instrument
+def greet(name: str, output_format: str = "text") -> None:
+    """Greet someone."""
+    message = hello_world(name)
+    print(format_records([(name, message)], output_format), end="")
+
+
 def main() -> None:
     """Main entry point."""
     parser = create_parser()
-    args = parser.parse_args()
-
-    if args.command == "greet":
-        message = hello_world(args.name)
-        print(message)
-    else:
-        parser.print_help()
-        sys.exit(1)
+    args = parser.parse_args(expand_profile_flag(sys.argv[1:]))
+
+    with profiled(args.profile, args.profile_sort):
+        if args.command == "greet" and args.input is not None:
+            if args.name is not None:
+                parser.error("NAME cannot be combined with --input")
+            if args.jobs < 0:
+                parser.error("--jobs must be at least 0")
+            try:
+                source = open_input(args.input)
+            except OSError as exc:
+                parser.error(f"cannot read {args.input}: {exc.strerror}")
+            with source:
+                status = greet_stream(source, args.jobs, args.output_format)
+            sys.exit(status)
+        elif args.command == "greet":
+            greet("World" if args.name is None else args.name, args.output_format)
+        elif args.command == "serve":
+            if not 0 <= args.port <= MAX_PORT:
+                parser.error(f"--port must be between 0 and {MAX_PORT}")
+            from . import server
+
+            server.serve(args.host, args.port)
+        else:
+            parser.print_help()
+            sys.exit(1)
 
 
 if __name__ == "__main__":
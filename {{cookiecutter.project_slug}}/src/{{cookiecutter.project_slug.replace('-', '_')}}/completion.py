@@ -0,0 +1,409 @@
+"""Static shell completion scripts for {{ cookiecutter.project_name }}.
+
+Framework completion runs the program, imports included, on every TAB
+press. The scripts written here are generated once, by an explicit build
+step (``make completions``), from the command tree of :mod:`.cli`, and
+complete commands, options and option values without starting Python. Choices are written into the
+scripts, and file arguments use the shell's own file completion, so no
+value needs the program to compute it. ``--profile`` takes its path only
+after ``=``, so it completes as a flag.
+
+Print one script, or write all three into a directory laid out like the
+shells' completion directories::
+
+    python -m {{ cookiecutter.project_slug.replace('-', '_') }}.completion bash > ~/.local/share/bash-completion/completions/{{ cookiecutter.project_slug }}
+    python -m {{ cookiecutter.project_slug.replace('-', '_') }}.completion --output dist/completions
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+{%- if cookiecutter.command_line_interface == "typer" %}
+
+from typer.core import TyperCommand as Command
+from typer.core import TyperGroup as Group
+from typer.core import TyperOption as Option
+from typer.main import get_command
+
+from .cli import app
+{%- elif cookiecutter.command_line_interface == "click" %}
+
+from click import Command, Group, Option
+
+from .cli import main as cli_main
+{%- else %}
+
+from .cli import create_parser
+{%- endif %}
+
+PROG = "{{ cookiecutter.project_slug }}"
+{%- if cookiecutter.command_line_interface == "argparse" %}
+# argparse has no value types: these metavars name file arguments
+FILE_METAVARS = ("FILE", "PATH")
+{%- endif %}
+# Options whose value can only be attached with "=", like --profile[=PATH]
+ATTACHED_METAVAR = "[=PATH]"
+
+
+@dataclass(frozen=True)
+class OptionSpec:
+    """An option as the completion scripts see it."""
+
+    flags: tuple[str, ...]
+    help: str = ""
+    takes_value: bool = False
+    choices: tuple[str, ...] = ()
+    files: bool = False
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """A command, its options and its subcommands."""
+
+    name: str
+    help: str = ""
+    options: tuple[OptionSpec, ...] = ()
+    commands: tuple[CommandSpec, ...] = ()
+
+
+def _summary(text: str | None) -> str:
+    """Return the first line of a help text, without its final period."""
+    lines = (text or "").strip().splitlines()
+    return lines[0].rstrip(".") if lines else ""
+{%- if cookiecutter.command_line_interface == "argparse" %}
+
+
+def _describe_parser(
+    parser: argparse.ArgumentParser, name: str, help_text: str
+) -> CommandSpec:
+    """Return the options and subcommands of ``parser``."""
+    options = []
+    commands = []
+    for action in parser._actions:
+        if action.help == argparse.SUPPRESS:
+            continue
+        if isinstance(action, argparse._SubParsersAction):
+            helps = {a.dest: a.help for a in action._choices_actions}
+            commands += [
+                _describe_parser(sub, sub_name, _summary(helps.get(sub_name)))
+                for sub_name, sub in action.choices.items()
+            ]
+        elif action.option_strings:
+            options.append(
+                OptionSpec(
+                    flags=tuple(action.option_strings),
+                    help=_summary(action.help),
+                    takes_value=action.nargs != 0
+                    and action.metavar != ATTACHED_METAVAR,
+                    choices=tuple(action.choices or ()),
+                    files=action.metavar in FILE_METAVARS,
+                )
+            )
+    return CommandSpec(name, help_text, tuple(options), tuple(commands))
+
+
+def describe() -> CommandSpec:
+    """Return the command tree of the CLI."""
+    parser = create_parser()
+    return _describe_parser(parser, PROG, _summary(parser.description))
+{%- else %}
+
+
+def _describe_command(name: str, command: Command | Group) -> CommandSpec:
+    """Return the options and subcommands of ``command``."""
+    ctx = command.context_class(command, info_name=name)
+    options = []
+    # Read apart: typer's help option is not always a TyperOption
+    help_option = command.get_help_option(ctx)
+    help_names = command.get_help_option_names(ctx)
+    for param in command.get_params(ctx):
+        if not isinstance(param, Option) or param.hidden:
+            continue
+        if not {*param.opts}.isdisjoint(help_names):
+            continue
+        # The values the framework's own completion would offer
+        items = param.shell_complete(ctx, "")
+        options.append(
+            OptionSpec(
+                flags=(*param.opts, *param.secondary_opts),
+                help=_summary(param.help),
+                takes_value=not param.is_flag and param.metavar != ATTACHED_METAVAR,
+                choices=tuple(item.value for item in items if item.type == "plain"),
+                files=any(item.type in ("file", "dir") for item in items),
+            )
+        )
+    if help_option is not None:
+        options.append(
+            OptionSpec(flags=tuple(help_option.opts), help=_summary(help_option.help))
+        )
+    commands = []
+    if isinstance(command, Group):
+        for sub_name, sub in command.commands.items():
+            if isinstance(sub, (Command, Group)) and not sub.hidden:
+                commands.append(_describe_command(sub_name, sub))
+    return CommandSpec(name, _summary(command.help), tuple(options), tuple(commands))
+
+
+def describe() -> CommandSpec:
+    """Return the command tree of the CLI."""
+{%- if cookiecutter.command_line_interface == "typer" %}
+    command = get_command(app)
+    if not isinstance(command, (Command, Group)):
+        raise TypeError(f"expected a command group, got {type(command).__name__}")
+    return _describe_command(PROG, command)
+{%- else %}
+    return _describe_command(PROG, cli_main)
+{%- endif %}
+{%- endif %}
+
+
+def _function_name(prog: str) -> str:
+    """Return the shell function name completing ``prog``."""
+    return "_" + re.sub(r"\W", "_", prog)
+
+
+def _bash_case(options: tuple[OptionSpec, ...], words: list[str]) -> list[str]:
+    """Return the body of one command's case in the bash script."""
+    lines = ["            case $prev in"]
+    for option in options:
+        if not option.takes_value:
+            continue
+        if option.files:
+            # Marks the replies as file names: directories get a trailing slash
+            reply = "compopt -o filenames 2>/dev/null; "
+            reply += 'COMPREPLY=($(compgen -f -- "$cur"))'
+        elif option.choices:
+            reply = f'COMPREPLY=($(compgen -W "{" ".join(option.choices)}" -- "$cur"))'
+        else:
+            # A free value: nothing to offer
+            reply = ":"
+        lines.append(f"                {'|'.join(option.flags)}) {reply}; return ;;")
+    lines.append("            esac")
+    lines.append(f'            COMPREPLY=($(compgen -W "{" ".join(words)}" -- "$cur"))')
+    return lines
+
+
+def bash_script(spec: CommandSpec) -> str:
+    """Return a bash completion script for ``spec``."""
+    function = _function_name(spec.name)
+    names = [command.name for command in spec.commands]
+    lines = [
+        f"# bash completion for {spec.name}, generated from its CLI definition",
+        "",
+        function + "() {",
+        "    local cur=${COMP_WORDS[COMP_CWORD]} prev=${COMP_WORDS[COMP_CWORD-1]}",
+        "    # --option=value is split at the '=' by COMP_WORDBREAKS",
+        '    if [[ $cur == "=" ]]; then',
+        '        cur=""',
+        '    elif [[ $prev == "=" ]]; then',
+        "        prev=${COMP_WORDS[COMP_CWORD-2]}",
+        "    fi",
+        '    local command="" word',
+        '    for word in "${COMP_WORDS[@]:1:COMP_CWORD-1}"; do',
+        "        case $word in",
+        f"            {'|'.join(names)}) command=$word; break ;;",
+        "        esac",
+        "    done",
+        "    COMPREPLY=()",
+        "    case $command in",
+    ]
+    for command in spec.commands:
+        flags = [flag for option in command.options for flag in option.flags]
+        lines.append(f"        {command.name})")
+        lines += _bash_case(command.options, flags)
+        lines.append("            ;;")
+    flags = [flag for option in spec.options for flag in option.flags]
+    lines.append("        *)")
+    lines += _bash_case(spec.options, [*flags, *names])
+    lines += [
+        "            ;;",
+        "    esac",
+        "}",
+        "",
+        f"complete -F {function} {spec.name}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _zsh_quote(text: str) -> str:
+    """Escape ``text`` for an ``_arguments`` description in single quotes."""
+    text = text.replace("\\", "\\\\").replace("'", "'\\''")
+    return re.sub(r"([\[\]:])", r"\\\1", text)
+
+
+def _zsh_arguments(options: tuple[OptionSpec, ...], indent: str) -> list[str]:
+    """Return the ``_arguments`` specs of ``options``, one per line."""
+    specs = []
+    for option in options:
+        description = f"[{_zsh_quote(option.help)}]"
+        if len(option.flags) > 1:
+            flags = " ".join(option.flags)
+            # zsh brace expansion: one spec per flag, excluding each other
+            spec = f"'({flags})'" + "{" + ",".join(option.flags) + "}'" + description
+        else:
+            spec = f"'{option.flags[0]}{description}"
+        if option.takes_value:
+            long_flags = [flag for flag in option.flags if flag.startswith("--")]
+            message = (long_flags or option.flags)[0].lstrip("-").upper()
+            if option.files:
+                action = "_files"
+            elif option.choices:
+                action = f"({' '.join(option.choices)})"
+            else:
+                action = " "
+            spec += f":{message}:{action}"
+        specs.append(f"{indent}{spec}' \\")
+    return specs
+
+
+def zsh_script(spec: CommandSpec) -> str:
+    """Return a zsh completion script for ``spec``."""
+    function = _function_name(spec.name)
+    lines = [
+        f"#compdef {spec.name}",
+        f"# zsh completion for {spec.name}, generated from its CLI definition",
+        "",
+        function + "() {",
+        "    local curcontext=$curcontext state line",
+        "    typeset -A opt_args",
+        "    _arguments -C \\",
+        *_zsh_arguments(spec.options, "        "),
+        "        '1:command:->command' \\",
+        "        '*::argument:->argument'",
+        "    case $state in",
+        "        command)",
+        "            local -a commands=(",
+        *(
+            f"                '{command.name}:{_zsh_quote(command.help)}'"
+            for command in spec.commands
+        ),
+        "            )",
+        "            _describe command commands",
+        "            ;;",
+        "        argument)",
+        "            case $line[1] in",
+    ]
+    for command in spec.commands:
+        lines.append(f"                {command.name})")
+        if command.options:
+            lines.append("                    _arguments \\")
+            lines += _zsh_arguments(command.options, "                        ")
+            # The last spec ends the command: drop its line continuation
+            lines[-1] = lines[-1].removesuffix(" \\")
+        lines.append("                    ;;")
+    lines += [
+        "            esac",
+        "            ;;",
+        "    esac",
+        "}",
+        "",
+        "if [[ $zsh_eval_context[-1] == loadautofunc ]]; then",
+        f'    {function} "$@"',
+        "else",
+        f"    compdef {function} {spec.name}",
+        "fi",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _fish_quote(text: str) -> str:
+    """Quote ``text`` as a fish single-quoted string."""
+    return "'" + text.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _fish_option(prog: str, condition: str, option: OptionSpec) -> str:
+    """Return the ``complete`` command for one option."""
+    parts = [f"complete -c {prog} -n {_fish_quote(condition)}"]
+    for flag in option.flags:
+        if flag.startswith("--"):
+            parts.append(f"-l {flag[2:]}")
+        elif len(flag) == 2:  # noqa: PLR2004 - a dash and one letter
+            parts.append(f"-s {flag[1]}")
+        else:
+            parts.append(f"-o {flag[1:]}")
+    if option.files:
+        parts.append("-r -F")
+    elif option.choices:
+        parts.append(f"-x -a {_fish_quote(' '.join(option.choices))}")
+    elif option.takes_value:
+        parts.append("-x")
+    if option.help:
+        parts.append(f"-d {_fish_quote(option.help)}")
+    return " ".join(parts)
+
+
+def fish_script(spec: CommandSpec) -> str:
+    """Return a fish completion script for ``spec``."""
+    names = " ".join(command.name for command in spec.commands)
+    top_level = f"not __fish_seen_subcommand_from {names}"
+    lines = [
+        f"# fish completion for {spec.name}, generated from its CLI definition",
+        "",
+        "# No file names unless an option asks for them",
+        f"complete -c {spec.name} -f",
+    ]
+    for command in spec.commands:
+        description = f" -d {_fish_quote(command.help)}" if command.help else ""
+        lines.append(
+            f"complete -c {spec.name} -n {_fish_quote(top_level)}"
+            f" -a {command.name}{description}"
+        )
+    lines += [_fish_option(spec.name, top_level, option) for option in spec.options]
+    for command in spec.commands:
+        condition = f"__fish_seen_subcommand_from {command.name}"
+        lines += [
+            _fish_option(spec.name, condition, option) for option in command.options
+        ]
+    return "\n".join(lines) + "\n"
+
+
+# Shell -> (script renderer, path of the script in an output directory)
+SCRIPTS: dict[str, tuple[Callable[[CommandSpec], str], str]] = {
+    "bash": (bash_script, f"bash/{PROG}"),
+    "zsh": (zsh_script, f"zsh/_{PROG}"),
+    "fish": (fish_script, f"fish/{PROG}.fish"),
+}
+
+
+def write_scripts(directory: Path, spec: CommandSpec | None = None) -> list[Path]:
+    """Write the script of every shell under ``directory`` and return their paths."""
+    spec = describe() if spec is None else spec
+    paths = []
+    for render, name in SCRIPTS.values():
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(render(spec), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print the completion script of one shell, or write all of them."""
+    parser = argparse.ArgumentParser(
+        prog=f"python -m {__name__}", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("shell", nargs="?", choices=SCRIPTS, help="Shell to print")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        metavar="DIR",
+        help="Write every script under DIR: bash/, zsh/ and fish/",
+    )
+    args = parser.parse_args(argv)
+    if (args.shell is None) == (args.output is None):
+        parser.error("give either a shell or --output")
+
+    if args.output is not None:
+        for path in write_scripts(args.output):
+            print(f"Wrote {path}")
+    else:
+        render, _ = SCRIPTS[args.shell]
+        print(render(describe()), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,68 @@
 
 from __future__ import annotations
 
+import functools
+import io
+import itertools
+import mmap
+import operator
+import os
+import signal
+import stat
+import sys
+import threading
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sized
+from typing import IO, TYPE_CHECKING, Any, BinaryIO, Literal, TypeVar, cast
 
+{%- if cookiecutter.use_mypyc == "y" %}
+
+from mypy_extensions import mypyc_attr
+{%- endif %}
+
+from {{ cookiecutter.project_slug.replace('-', '_') }}.instrumentation import instrument
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Operands accepted by add_many: scalars, sequences, array.array, memoryview
+# and numpy.ndarray. Typed loosely so that NumPy stays an optional dependency.
+ArrayLike = Any
+
+# Number of elements processed per step by pure-Python batch loops
+_CHUNK_SIZE = 65536
+
+# add_many's out must be a buffer, which both implementations write in place
+_OUT_TYPE_ERROR = "out must be a writable buffer, not {}"
+# struct byte-order prefixes that still mean native order, which array holds
+_NATIVE_ORDER = "@=<" if sys.byteorder == "little" else "@=>!"
+
+# Number of greetings joined into a single write by write_greetings
+_GREETINGS_PER_WRITE = 8192
+
+# Bytes requested per read, or scanned per chunk of a mapped file, by
+# iter_line_chunks
+_READ_SIZE = 1 << 20
+
+# Advice for mapped files, not available on Windows: read ahead further, and
+# release the pages already scanned
+_MADV_SEQUENTIAL: int | None = getattr(mmap, "MADV_SEQUENTIAL", None)
+_MADV_DONTNEED: int | None = getattr(mmap, "MADV_DONTNEED", None)
+
+# parallel_map: chunks per worker for sized inputs, and the first chunk size
+# when the input length is unknown (chunks then double up to _CHUNK_SIZE)
+_CHUNKS_PER_WORKER = 4
+_FIRST_CHUNK_SIZE = 64
+
+# parallel_map: chunks submitted but not yet consumed, per worker
+_PENDING_PER_WORKER = 2
+
+
+@instrument
 def hello_world(name: str = "World") -> str:
     """Return a greeting message.
 
@@ -21,6 +82,402 @@ def hello_world(name: str = "World") -> str:
     return f"Hello, {name}!"
 
 
+@instrument
+def hello_world_many(names: Iterable[str]) -> Iterator[str]:
+    """Lazily return a greeting for each name.
+
+    Greetings are produced one at a time as the result is iterated, so
+    arbitrarily large inputs (including generators) never build a list.
+
+    Args:
+        names: The names to greet.
+
+    Yields:
+        A greeting message for each name, in input order.
+
+    Example:
+        >>> list(hello_world_many(["Alice", "Bob"]))
+        ['Hello, Alice!', 'Hello, Bob!']
+    """
+    # A generator function rather than a generator expression: mypyc compiles
+    # returned generator expressions to lists, which would not be lazy
+    for name in names:
+        yield f"Hello, {name}!"
+
+
+@instrument
+def write_greetings(
+    names: Iterable[str],
+    sink: IO[str] | IO[bytes],
+    *,
+    chunk_size: int = _GREETINGS_PER_WRITE,
+    binary: bool | None = None,
+    encoding: str = "utf-8",
+) -> int:
+    """Write one greeting per line to a text or binary sink.
+
+    Names are read in blocks of ``chunk_size`` and each block is formatted
+    with a single ``str.join``, so the sink receives a few large writes
+    instead of one write per name. Only one block is held in memory at a
+    time.
+
+    Args:
+        names: The names to greet.
+        sink: A writable text or binary file-like object.
+        chunk_size: Number of greetings per write call.
+        binary: Whether ``sink`` expects bytes. Detected from the sink type
+            when not given.
+        encoding: Encoding used for binary sinks.
+
+    Returns:
+        The number of greetings written.
+
+    Example:
+        >>> import io
+        >>> buffer = io.StringIO()
+        >>> write_greetings(["Alice", "Bob"], buffer)
+        2
+        >>> buffer.getvalue()
+        'Hello, Alice!\\nHello, Bob!\\n'
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if binary is None:
+        binary = isinstance(sink, (io.RawIOBase, io.BufferedIOBase))
+
+    remaining = iter(names)
+    count = 0
+    while block := list(itertools.islice(remaining, chunk_size)):
+        count += len(block)
+        # Same format as hello_world, one greeting per line
+        text = "Hello, " + "!\nHello, ".join(block) + "!\n"
+        if binary:
+            cast("IO[bytes]", sink).write(text.encode(encoding))
+        else:
+            cast("IO[str]", sink).write(text)
+    return count
+
+
+def iter_line_chunks(
+    source: BinaryIO, *, read_size: int = _READ_SIZE
+) -> Iterator[bytes]:
+    """Yield the lines of a binary stream in chunks of whole lines.
+
+    Each chunk holds one or more complete lines, each ending in ``\\n``:
+    ``\\r\\n`` line endings become ``\\n`` and a last line without a newline
+    gets one. Empty lines are kept like any other.
+
+    A regular file, including standard input redirected from one, is
+    memory-mapped and scanned by :func:`iter_buffer_chunks`, so no read
+    buffer is filled and copied first. Other streams are read in blocks of
+    up to ``read_size`` bytes, using ``read1`` where available so that a slow
+    pipe is processed as data arrives, and only the unterminated last line
+    is carried over to the next block. Either way memory use is bounded by
+    ``read_size`` plus the longest line, whatever the size of the input, and
+    nothing is decoded.
+
+    Args:
+        source: A readable binary file-like object, e.g. ``sys.stdin.buffer``.
+        read_size: Approximate number of bytes per chunk.
+
+    Yields:
+        Non-empty chunks of whole lines, in input order.
+
+    Raises:
+        ValueError: If ``read_size`` is less than 1.
+
+    Example:
+        >>> list(iter_line_chunks(io.BytesIO(b"Alice\\nBob\\r\\n")))
+        [b'Alice\\nBob\\n']
+    """
+    if read_size < 1:
+        raise ValueError("read_size must be at least 1")
+    mapping = _map_file(source)
+    if mapping is not None:
+        with mapping:
+            yield from iter_buffer_chunks(mapping, source.tell(), chunk_size=read_size)
+        # Leave the stream where reading it to the end would have
+        source.seek(0, io.SEEK_END)
+        return
+
+    read = getattr(source, "read1", source.read)
+    # Unterminated last line of the previous block
+    tail = b""
+    while block := read(read_size):
+        end = block.rfind(b"\n") + 1
+        if not end:
+            tail += block
+            continue
+        yield _whole_lines(tail + block[:end])
+        tail = block[end:]
+    if tail:
+        yield _whole_lines(tail)
+
+
+def _map_file(source: BinaryIO) -> mmap.mmap | None:
+    """Return a read-only mapping of ``source``, if it is a non-empty regular file."""
+    try:
+        fileno = source.fileno()
+        info = os.fstat(fileno)
+        if not stat.S_ISREG(info.st_mode) or source.tell() >= info.st_size:
+            return None
+        mapping = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        # No file descriptor, or one that cannot be mapped: read it instead
+        return None
+    if _MADV_SEQUENTIAL is not None:
+        mapping.madvise(_MADV_SEQUENTIAL)
+    return mapping
+
+
+def iter_buffer_chunks(
+    buffer: bytes | mmap.mmap,
+    start: int = 0,
+    stop: int | None = None,
+    *,
+    chunk_size: int = _READ_SIZE,
+) -> Iterator[bytes]:
+    """Yield the lines of a buffer that start in ``[start, stop)``, in chunks.
+
+    The buffer is scanned for newlines in place and each chunk is copied out
+    once, ending at the first newline past ``chunk_size`` bytes: the line
+    running into ``stop`` is finished. Line endings are normalized as by
+    :func:`iter_line_chunks`. Once a chunk of a memory-mapped file is yielded
+    its pages are released where the platform allows, so the resident memory
+    stays flat however large the file.
+
+    Args:
+        buffer: The bytes to scan, e.g. a read-only ``mmap.mmap`` of a file.
+        start: Offset of the first line; it must be the start of a line.
+        stop: Offset at which no new line starts; the end by default.
+        chunk_size: Approximate number of bytes per chunk.
+
+    Yields:
+        Non-empty chunks of whole lines, in order.
+
+    Example:
+        >>> list(iter_buffer_chunks(b"Alice\\nBob\\nCy", 0, 7))
+        [b'Alice\\nBob\\n']
+    """
+    size = len(buffer)
+    stop = size if stop is None else min(stop, size)
+    mapped = buffer if isinstance(buffer, mmap.mmap) else None
+    # Start of the mapped pages not yet released
+    released = start - start % mmap.PAGESIZE
+    while start < stop:
+        newline = buffer.find(b"\n", min(start + chunk_size, stop) - 1)
+        end = size if newline < 0 else newline + 1
+        yield _whole_lines(buffer[start:end])
+        start = end
+        if mapped is not None and _MADV_DONTNEED is not None:
+            done = start - start % mmap.PAGESIZE
+            if done > released:
+                # The pages stay in the page cache; only this process lets go
+                mapped.madvise(_MADV_DONTNEED, released, done - released)
+                released = done
+
+
+def _whole_lines(chunk: bytes) -> bytes:
+    """Return ``chunk`` with ``\\n`` line endings, ending in a newline."""
+    if b"\r" in chunk:
+        chunk = chunk.replace(b"\r\n", b"\n")
+    if not chunk.endswith(b"\n"):
+        chunk = b"".join((chunk.removesuffix(b"\r"), b"\n"))
+    return chunk
+
+
+def iter_line_blocks(
+    source: BinaryIO, *, read_size: int = _READ_SIZE
+) -> Iterator[list[bytes]]:
+    """Yield the lines of a binary stream in blocks, without line endings.
+
+    The chunks of :func:`iter_line_chunks`, split into lists of lines.
+
+    Args:
+        source: A readable binary file-like object, e.g. ``sys.stdin.buffer``.
+        read_size: Approximate number of bytes per block.
+
+    Yields:
+        Non-empty lists of lines, in input order.
+
+    Raises:
+        ValueError: If ``read_size`` is less than 1.
+
+    Example:
+        >>> list(iter_line_blocks(io.BytesIO(b"Alice\\nBob\\r\\n")))
+        [[b'Alice', b'Bob']]
+    """
+    for chunk in iter_line_chunks(source, read_size=read_size):
+        yield chunk[:-1].split(b"\n")
+
+
+@instrument
+def greet_chunks(chunks: Iterable[bytes], sink: BinaryIO) -> int:
+    """Write a greeting for each line of chunks of whole lines to a binary sink.
+
+    Each chunk, as yielded by :func:`iter_line_chunks`, becomes its
+    greetings in a single bytes replace, without splitting it into lines or
+    decoding it, so any ASCII-compatible encoding passes through unchanged.
+
+    Args:
+        chunks: Chunks of lines, each ending in ``\\n``.
+        sink: A writable binary file-like object.
+
+    Returns:
+        The number of greetings written.
+
+    Example:
+        >>> import io
+        >>> sink = io.BytesIO()
+        >>> greet_chunks([b"Alice\\n", b"Bob\\n"], sink)
+        2
+        >>> sink.getvalue()
+        b'Hello, Alice!\\nHello, Bob!\\n'
+    """
+    count = 0
+    for chunk in chunks:
+        count += chunk.count(b"\n")
+        # Same format as hello_world, one greeting per line. Joined rather
+        # than concatenated: mypyc 1.x leaks the result of chained bytes +
+        greeting = (b"Hello, ", chunk[:-1].replace(b"\n", b"!\nHello, "), b"!\n")
+        sink.write(b"".join(greeting))
+    return count
+
+
+def greet_lines(
+    source: BinaryIO, sink: BinaryIO, *, read_size: int = _READ_SIZE
+) -> int:
+    """Write a greeting for each line of a binary stream to a binary sink.
+
+    Lines are read in chunks by :func:`iter_line_chunks`, memory-mapping
+    regular files, and greeted by :func:`greet_chunks`.
+
+    Args:
+        source: A readable binary file-like object, e.g. ``sys.stdin.buffer``.
+        sink: A writable binary file-like object.
+        read_size: Approximate number of bytes per chunk.
+
+    Returns:
+        The number of greetings written.
+
+    Example:
+        >>> import io
+        >>> sink = io.BytesIO()
+        >>> greet_lines(io.BytesIO(b"Alice\\nBob\\r\\n"), sink)
+        2
+        >>> sink.getvalue()
+        b'Hello, Alice!\\nHello, Bob!\\n'
+    """
+    return greet_chunks(iter_line_chunks(source, read_size=read_size), sink)
+
+
+def _encoded_lengths(block: list[str], text: str) -> Iterable[int]:
+    """Return the UTF-8 length of each name in ``block``.
+
+    ``text`` is the block's joined greetings; when it is ASCII, character
+    counts are byte counts and no name needs to be encoded on its own.
+    Otherwise every name in the block is encoded once to measure it, which
+    is still faster than counting code points by range in Python.
+    """
+    if text.isascii():
+        return map(len, block)
+    return [len(name.encode()) for name in block]
+
+
+@instrument
+def greetings_nbytes(names: Iterable[str], *, terminator: str = "\n") -> int:
+    """Return the number of bytes :func:`write_greetings_into` needs for ``names``.
+
+    Use it to size a ``bytearray`` or ``mmap`` before writing.
+
+    Example:
+        >>> greetings_nbytes(["Alice", "Bob"])
+        26
+    """
+    overhead = len(f"Hello, !{terminator}".encode())
+    total = 0
+    remaining = iter(names)
+    while block := list(itertools.islice(remaining, _GREETINGS_PER_WRITE)):
+        joined = "".join(block)
+        total += sum(_encoded_lengths(block, joined)) + overhead * len(block)
+    return total
+
+
+@instrument
+def write_greetings_into(
+    names: Iterable[str],
+    buffer: Any,
+    offset: int = 0,
+    *,
+    terminator: str = "\n",
+) -> array[int]:
+    """Encode greetings as UTF-8 directly into a writable buffer.
+
+    Greetings are laid out back to back from ``offset``, each followed by
+    ``terminator`` (use ``"\\0"`` for C strings). Every block of names is
+    joined and encoded once and copied into the buffer in a single slice
+    assignment. For blocks of ASCII names, offsets are computed from the
+    name lengths without creating a ``str`` or ``bytes`` object per name; a
+    block with any non-ASCII name encodes each of its names once more to
+    measure its offsets.
+
+    Args:
+        names: The names to greet.
+        buffer: A writable, contiguous buffer: ``bytearray``, ``memoryview``
+            or ``mmap.mmap``. It is never resized; see :func:`greetings_nbytes`.
+        offset: Byte position of the first greeting.
+        terminator: Text appended to every greeting.
+
+    Returns:
+        An ``array("Q")`` with one more entry than there are names:
+        greeting ``i`` occupies ``buffer[offsets[i]:offsets[i + 1]]``.
+
+    Raises:
+        TypeError: If ``buffer`` is read-only.
+        ValueError: If the greetings do not fit. Blocks that fit before the
+            overflow have already been written.
+
+    Example:
+        >>> buffer = bytearray(32)
+        >>> write_greetings_into(["Alice", "Bob"], buffer).tolist()
+        [0, 14, 26]
+        >>> bytes(buffer[:26])
+        b'Hello, Alice!\\nHello, Bob!\\n'
+    """
+    view = memoryview(buffer).cast("B")
+    if view.readonly:
+        raise TypeError("buffer must be writable")
+    if not 0 <= offset <= len(view):
+        raise ValueError(f"offset {offset} is outside the buffer")
+
+    separator = f"!{terminator}Hello, "
+    overhead = len(f"Hello, !{terminator}".encode())
+    offsets = array("Q", [offset])
+    position = offset
+    remaining = iter(names)
+    while block := list(itertools.islice(remaining, _GREETINGS_PER_WRITE)):
+        text = "Hello, " + separator.join(block) + "!" + terminator
+        data = text.encode()
+        end = position + len(data)
+        if end > len(view):
+            raise ValueError(
+                f"buffer too small: greetings need at least {end} bytes, "
+                f"buffer has {len(view)}"
+            )
+        view[position:end] = data
+        sizes = map(
+            operator.add,
+            _encoded_lengths(block, text),
+            itertools.repeat(overhead),
+        )
+        ends = itertools.accumulate(sizes, initial=position)
+        # Skip the initial value: it is already the last stored offset
+        offsets.extend(itertools.islice(ends, 1, None))
+        position = end
+    return offsets
+
+
+@instrument
 def add_numbers(a: float, b: float) -> float:
     """Add two numbers together.
 
@@ -40,9 +497,368 @@ def add_numbers(a: float, b: float) -> float:
     return a + b
 
 
+@functools.cache
+def _load_numpy() -> Any:
+    """Return the numpy module, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@instrument
+def add_many(a: ArrayLike, b: ArrayLike, out: ArrayLike | None = None) -> ArrayLike:
+    """Add two arrays element-wise in one call.
+
+    Operands may be scalars, sequences, ``array.array``, ``memoryview`` or
+    NumPy arrays, and are broadcast against each other. With NumPy installed
+    (the ``numpy`` extra) the addition is a single vectorized ``numpy.add``;
+    otherwise a pure-Python fallback processes one-dimensional operands in
+    fixed-size chunks.
+
+    Args:
+        a: First operand
+        b: Second operand
+        out: Optional writable buffer (``array.array``, ``memoryview``,
+            ``numpy.ndarray``, ...) that receives the result instead of a
+            newly allocated array
+
+    Returns:
+        ``out`` if given, otherwise a new ``numpy.ndarray`` (with NumPy) or
+        ``array.array("d")`` (without). Two scalar operands also give a
+        one-element array, never a scalar.
+
+    Raises:
+        TypeError: If ``out`` is not a buffer, e.g. a list, or, without
+            NumPy, holds items ``array.array`` cannot write, such as
+            non-native byte order
+        ValueError: If the operands cannot be broadcast together
+
+    Example:
+        >>> add_many(array("d", [1.0, 2.0]), 10).tolist()
+        [11.0, 12.0]
+    """
+    numpy = _load_numpy()
+    if numpy is None:
+        return _add_many_python(a, b, out)
+    if out is None:
+        # numpy.add returns a NumPy scalar for two scalars
+        return numpy.atleast_1d(numpy.add(a, b))
+    # asarray wraps buffer-protocol objects without copying them, but copies
+    # anything else, which would receive the result in place of ``out``
+    target = numpy.asarray(out)
+    if target.size and not numpy.shares_memory(target, out):
+        raise TypeError(_OUT_TYPE_ERROR.format(type(out).__name__))
+    numpy.add(a, b, out=target)
+    return out
+
+
+def _operand_length(value: ArrayLike) -> int | None:
+    """Return the length of a one-dimensional operand, or None for a scalar."""
+    if isinstance(value, (int, float)):
+        return None
+    if isinstance(value, memoryview) and value.ndim != 1:
+        raise ValueError("Only one-dimensional buffers are supported without NumPy")
+    return len(value)
+
+
+def _chunk(value: ArrayLike, length: int | None, lo: int, hi: int) -> Iterable[Any]:
+    """Return elements ``lo:hi`` of an operand, broadcasting if needed."""
+    if length is None:
+        return itertools.repeat(value, hi - lo)
+    if length == 1:
+        return itertools.repeat(value[0], hi - lo)
+    # Slicing a memoryview is zero-copy; other sequences copy one chunk
+    chunk: Iterable[Any] = value[lo:hi]
+    return chunk
+
+
+def _out_items(out: ArrayLike) -> array[Any] | memoryview:
+    """Return ``out`` as an ``array`` or a memoryview ``array`` items can fill."""
+    if isinstance(out, array):
+        return out
+    try:
+        view = memoryview(out)
+    except TypeError:
+        raise TypeError(_OUT_TYPE_ERROR.format(type(out).__name__)) from None
+    # struct formats may start with a byte order, e.g. "<d" from ctypes, which
+    # memoryview cannot assign to
+    typecode = view.format
+    if typecode[0] in _NATIVE_ORDER:
+        typecode = typecode[1:]
+    try:
+        fits = array(typecode).itemsize == view.itemsize
+    except (TypeError, ValueError):
+        fits = False
+    if not fits:
+        raise TypeError(f"out has items of format {view.format!r}, not held by array")
+    if typecode == view.format:
+        return view
+    # typeshed only accepts literal formats
+    native_view: memoryview = view.cast("B").cast(typecode)  # type: ignore[call-overload]
+    return native_view
+
+
+def _add_many_python(a: ArrayLike, b: ArrayLike, out: ArrayLike | None) -> ArrayLike:
+    """Pure-Python implementation of add_many for one-dimensional operands."""
+    a_len, b_len = _operand_length(a), _operand_length(b)
+    lengths = {n for n in (a_len, b_len) if n is not None}
+    if len(lengths - {1}) > 1:
+        raise ValueError(
+            f"Operands could not be broadcast together with lengths {a_len} and {b_len}"
+        )
+    size = max(lengths, default=1)
+
+    if out is None:
+        out = array("d", bytes(size * array("d").itemsize))
+    items = _out_items(out)
+    if len(items) != size:
+        raise ValueError(f"Output buffer has length {len(items)}, expected {size}")
+
+    typecode = items.typecode if isinstance(items, array) else items.format
+    for start in range(0, size, _CHUNK_SIZE):
+        stop = min(start + _CHUNK_SIZE, size)
+        items[start:stop] = array(
+            typecode,
+            map(
+                operator.add,
+                _chunk(a, a_len, start, stop),
+                _chunk(b, b_len, start, stop),
+            ),
+        )
+    return out
+
+
+def _ignore_sigint() -> None:
+    """Pool initializer: leave Ctrl+C handling to the parent process."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _map_chunk(func: Callable[[T], R], items: list[T]) -> list[R]:
+    """Apply ``func`` to one chunk of items inside a worker process."""
+    return list(map(func, items))
+
+
+class _WarmPool:
+    """Process pools kept alive between parallel_map calls.
+
+    Running calls with the same worker count share one pool. A call with
+    another count starts a new pool; the one it replaces is shut down once
+    the last call still submitting to it is done.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._workers = 0
+        # Running parallel_map calls per pool
+        self._users: dict[ProcessPoolExecutor, int] = {}
+
+    def get(self, workers: int) -> ProcessPoolExecutor:
+        """Return the pool, (re)starting it if the worker count changed."""
+        with self._lock:
+            return self._current(workers)
+
+    def acquire(self, workers: int) -> ProcessPoolExecutor:
+        """Return the pool for ``workers`` and count the caller as its user."""
+        with self._lock:
+            executor = self._current(workers)
+            self._users[executor] = self._users.get(executor, 0) + 1
+            return executor
+
+    def release(self, executor: ProcessPoolExecutor) -> None:
+        """Stop counting a user of ``executor``; stop it if it was replaced."""
+        with self._lock:
+            users = self._users.pop(executor) - 1
+            if users:
+                self._users[executor] = users
+                return
+            if executor is self._executor:
+                return
+        executor.shutdown(wait=False)
+
+    def _current(self, workers: int) -> ProcessPoolExecutor:
+        """Return the pool for ``workers``; the caller holds the lock."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        if self._executor is None or self._workers != workers:
+            replaced = self._executor
+            if replaced is not None and replaced not in self._users:
+                replaced.shutdown(wait=False)
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=_ignore_sigint
+            )
+            self._workers = workers
+        return self._executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the pool; the next parallel_map call starts a new one."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def terminate(self, executor: ProcessPoolExecutor) -> None:
+        """Kill the workers of ``executor`` without letting running chunks finish."""
+        with self._lock:
+            if executor is self._executor:
+                self._executor = None
+        if sys.version_info >= (3, 14):
+            executor.terminate_workers()
+            return
+        # No public way to kill the workers before 3.14: _processes maps pids
+        # to processes, and is None once shut down (checked on CPython 3.9-3.13)
+        for process in list((executor._processes or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+_WARM_POOL = _WarmPool()
+
+
+def shutdown_pool(wait: bool = True) -> None:
+    """Stop the worker processes kept alive by :func:`parallel_map`.
+
+    Args:
+        wait: Whether to wait for the workers to exit
+    """
+    _WARM_POOL.shutdown(wait=wait)
+
+
+def _iter_chunks(
+    items: Iterable[T], chunksize: int | Literal["auto"], workers: int
+) -> Iterator[list[T]]:
+    """Split ``items`` into lists, sizing them for ``workers`` processes."""
+    if chunksize == "auto":
+        if not isinstance(items, Sized):
+            # Unknown length: start small so workers get busy quickly, then
+            # grow to amortize the per-chunk pickling overhead
+            remaining = iter(items)
+            step = _FIRST_CHUNK_SIZE
+            while chunk := list(itertools.islice(remaining, step)):
+                yield chunk
+                step = min(step * 2, _CHUNK_SIZE)
+            return
+        per_chunk = -(-len(items) // (workers * _CHUNKS_PER_WORKER))
+        step = min(max(per_chunk, 1), _CHUNK_SIZE)
+    else:
+        step = chunksize
+
+    remaining = iter(items)
+    while chunk := list(itertools.islice(remaining, step)):
+        yield chunk
+
+
+def parallel_map(
+    func: Callable[[T], R],
+    iterable: Iterable[T],
+    workers: int | None = None,
+    chunksize: int | Literal["auto"] = "auto",
+    *,
+    ordered: bool = True,
+) -> Iterator[R]:
+    """Apply ``func`` to every item in a pool of worker processes.
+
+    Items are sent to the workers in chunks rather than one at a time, and
+    only a few chunks per worker are in flight, so the input is consumed
+    lazily and memory stays bounded. The pool is kept warm between calls
+    with the same ``workers``; call :func:`shutdown_pool` to stop it.
+
+    On ``KeyboardInterrupt`` (the workers ignore Ctrl+C themselves), or if a
+    worker dies, the workers are terminated and the exception propagates;
+    the next call starts a fresh pool. Exceptions raised by ``func`` propagate to the
+    caller with the pool left intact.
+
+    Args:
+        func: A picklable function of one argument, e.g. defined at module level
+        iterable: The items to process
+        workers: Number of worker processes. Defaults to the CPU count.
+        chunksize: Items per chunk, or "auto" to split sized inputs evenly
+            across workers and to grow chunks gradually for iterators
+        ordered: Yield results in input order; when False, yield each chunk's
+            results as soon as it is done
+
+    Returns:
+        An iterator over the results
+
+    Raises:
+        ValueError: If ``workers`` or ``chunksize`` is less than 1
+
+    Example:
+        >>> list(parallel_map(hello_world, ["Alice", "Bob"], workers=2))
+        ['Hello, Alice!', 'Hello, Bob!']
+    """
+    workers = workers if workers is not None else os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if chunksize != "auto" and chunksize < 1:
+        raise ValueError("chunksize must be at least 1 or 'auto'")
+
+    chunks = _iter_chunks(iterable, chunksize, workers)
+    return _run_parallel(workers, func, chunks, ordered)
+
+
+def _take_finished(pending: deque[Future[list[R]]], ordered: bool) -> list[R]:
+    """Remove one chunk from ``pending`` and return its results.
+
+    In order, this waits for the oldest chunk; otherwise for whichever
+    chunk finishes first.
+    """
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    if ordered:
+        return pending.popleft().result()
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    future = done.pop()
+    pending.remove(future)
+    return future.result()
+
+
+def _run_parallel(
+    workers: int,
+    func: Callable[[T], R],
+    chunks: Iterator[list[T]],
+    ordered: bool,
+) -> Iterator[R]:
+    """Submit chunks to the warm pool, a few per worker at a time, and yield results.
+
+    The pool is taken on the first ``next()`` and held until the generator
+    finishes, so no other call shuts it down while chunks are still submitted.
+    """
+    from concurrent.futures import BrokenExecutor
+
+    executor = _WARM_POOL.acquire(workers)
+    max_pending = workers * _PENDING_PER_WORKER
+    pending: deque[Future[list[R]]] = deque()
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(_map_chunk, func, chunk))
+            if len(pending) >= max_pending:
+                yield from _take_finished(pending, ordered)
+        while pending:
+            yield from _take_finished(pending, ordered)
+    except (KeyboardInterrupt, BrokenExecutor):
+        # Leave no busy or half-dead pool behind for the next call
+        _WARM_POOL.terminate(executor)
+        raise
+    finally:
+        # Also reached when the caller stops iterating early
+        for future in pending:
+            future.cancel()
+        _WARM_POOL.release(executor)
+
+
+{% if cookiecutter.use_mypyc == "y" -%}
+# Compiled classes are final unless stated otherwise; cache.py subclasses this
+@mypyc_attr(allow_interpreted_subclasses=True)
+{% endif -%}
 class {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}:
     """Main class for {{ cookiecutter.project_name }}."""
 
+    # No per-instance __dict__: millions of instances stay small
+    __slots__ = ("name",)
+
     def __init__(self, name: str) -> None:
         """Initialize the class.
 
@@ -62,3 +878,118 @@ class {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().r
     def __repr__(self) -> str:
         """Return string representation of the instance."""
         return f"{self.__class__.__name__}(name='{self.name}')"
+
+
+class {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}Collection:
+    """Columnar collection of {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }} names.
+
+    All names are stored UTF-8 encoded in one contiguous ``bytearray``, with an
+    ``array`` of end offsets as the index. Holding millions of names this way
+    costs a few bytes of overhead per name instead of one Python object each,
+    and :meth:`greet_all` greets everything without creating instances.
+
+    Example:
+        >>> people = {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}Collection(["Alice", "Bob"])
+        >>> len(people)
+        2
+        >>> list(people.greet_all())
+        ['Hello, Alice!', 'Hello, Bob!']
+    """
+
+    __slots__ = ("_data", "_offsets")
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        """Initialize the collection.
+
+        Args:
+            names: Initial names to store
+        """
+        self._data = bytearray()
+        # _offsets[i] and _offsets[i + 1] delimit the i-th name in _data
+        self._offsets = array("Q", [0])
+        self.extend(names)
+
+    def append(self, name: str) -> None:
+        """Add one name to the end of the collection."""
+        self._data += name.encode()
+        self._offsets.append(len(self._data))
+
+    def extend(self, names: Iterable[str]) -> None:
+        """Add names to the end of the collection, one block at a time."""
+        remaining = iter(names)
+        while block := [
+            name.encode() for name in itertools.islice(remaining, _CHUNK_SIZE)
+        ]:
+            ends = itertools.accumulate(map(len, block), initial=self._offsets[-1])
+            # Skip the initial value: it is already the last stored offset
+            self._offsets.extend(itertools.islice(ends, 1, None))
+            self._data += b"".join(block)
+
+    def __len__(self) -> int:
+        """Return the number of names in the collection."""
+        return len(self._offsets) - 1
+
+    def name_at(self, index: int) -> str:
+        """Return the name at ``index`` (negative indices count from the end).
+
+        Raises:
+            IndexError: If ``index`` is out of range
+        """
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("collection index out of range")
+        start, stop = self._offsets[index], self._offsets[index + 1]
+        return str(memoryview(self._data)[start:stop], "utf-8")
+
+    def __getitem__(self, index: int) -> {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}:
+        """Return an instance for the name at ``index``, created on demand."""
+        return {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}(self.name_at(index))
+
+    def __iter__(self) -> Iterator[{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}]:
+        """Iterate over instances, created one at a time."""
+        for name in self.names():
+            yield {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}(name)
+
+    def _bounds(self) -> Iterator[tuple[int, int]]:
+        """Iterate over the (start, stop) byte offsets of the names stored now."""
+        size = len(self)
+        return zip(
+            itertools.islice(self._offsets, size),
+            itertools.islice(self._offsets, 1, size + 1),
+        )
+
+    def names(self) -> Iterator[str]:
+        """Iterate over the stored names without creating instances.
+
+        Names appended once iteration has started are not included.
+        """
+        if self._data.isascii():
+            # Byte offsets are character offsets: decode the buffer only once
+            text = self._data.decode("ascii")
+            for start, stop in self._bounds():
+                yield text[start:stop]
+            return
+        # Slice per name: a memoryview held across yields would lock the
+        # bytearray against append() until the generator finished
+        for start, stop in self._bounds():
+            yield self._data[start:stop].decode()
+
+    def greet_all(self) -> Iterator[str]:
+        """Lazily return a greeting for every name, without creating instances."""
+        if self._data.isascii():
+            text = self._data.decode("ascii")
+            for start, stop in self._bounds():
+                yield f"Hello, {text[start:stop]}!"
+            return
+        yield from hello_world_many(self.names())
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size in bytes of the name buffer and offsets index."""
+        return len(self._data) + self._offsets.itemsize * len(self._offsets)
+
+    def __repr__(self) -> str:
+        """Return string representation of the collection."""
+        return f"{self.__class__.__name__}(<{len(self)} names>)"
@@ -0,0 +1,75 @@
+"""Console script entry point for {{ cookiecutter.project_name }}.
+
+Importing the CLI framework costs far more than the work behind
+``--version`` or ``greet [NAME]``, so :func:`main` answers those itself,
+printing exactly what the full CLI would, and imports :mod:`.core` only when
+it greets. Every other invocation, including ``--help``, options and
+errors, is handed to :mod:`.cli` unchanged.
+"""
+
+import sys
+
+from . import __version__
+
+{%- if cookiecutter.command_line_interface == "typer" %}
+
+VERSION_FLAGS = ("--version", "-v")
+VERSION_TEXT = f"{{ cookiecutter.project_name }} v{__version__}"
+{%- elif cookiecutter.command_line_interface == "click" %}
+
+VERSION_FLAGS = ("--version",)
+VERSION_TEXT = f"{{ cookiecutter.project_slug }}, version {__version__}"
+{%- else %}
+
+VERSION_FLAGS = ("--version",)
+VERSION_TEXT = f"{{ cookiecutter.project_name }} v{__version__}"
+{%- endif %}
+
+
+def fast_path(args: list[str]) -> bool:
+    """Handle ``args`` without the CLI framework if they are trivial.
+
+    Args:
+        args: Command line arguments, without the program name
+
+    Returns:
+        True if the invocation was handled, False to defer to :mod:`.cli`
+    """
+    if len(args) == 1 and args[0] in VERSION_FLAGS:
+        sys.stdout.write(VERSION_TEXT + "\n")
+        return True
+
+    if not args:
+        return False
+    command, *names = args
+    if command != "greet" or len(names) > 1 or any(n.startswith("-") for n in names):
+        return False
+
+    from . import core, instrumentation
+
+    if instrumentation.is_enabled():
+        # Let the CLI run so that its instrumented greet command is recorded
+        return False
+    sys.stdout.write(core.hello_world(*names) + "\n")
+    return True
+
+
+def main() -> None:
+    """Run the command line interface."""
+    if fast_path(sys.argv[1:]):
+        return
+{%- if cookiecutter.command_line_interface == "typer" %}
+
+    from .cli import app
+
+    app()
+{%- else %}
+
+    from . import cli
+
+    cli.main()
+{%- endif %}
+
+
+if __name__ == "__main__":
+    main()
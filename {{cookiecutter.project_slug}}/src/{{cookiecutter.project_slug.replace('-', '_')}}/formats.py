@@ -0,0 +1,180 @@
+"""Output formats for the greet command.
+
+``--format text``, the default, prints the bare greetings, one per line.
+The structured formats write one record per name, with the fields in
+FIELDS, for downstream tools to parse without matching on the text.
+``jsonl`` writes one JSON object per line, escaped to ASCII. ``csv`` and
+``tsv`` write a header row, then one row per name, ending in ``\\n``; a
+field is quoted only if it holds the delimiter, a double quote or a line
+break, with double quotes doubled as in RFC 4180.
+
+Records are encoded one chunk of input lines at a time, as the lines are
+read, and written as bytes; the input is never collected into a list. A
+chunk with nothing to escape, the common case, is joined into records
+directly; the others are escaped field by field.
+
+Names are decoded from UTF-8 with ``surrogateescape``, so undecodable bytes
+are written back unchanged in csv and tsv, and as ``\\udcXX`` escapes in
+JSON.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from json.encoder import encode_basestring_ascii
+from typing import BinaryIO
+
+from .core import _READ_SIZE, greet_chunks, hello_world_many, iter_line_chunks
+
+FORMATS = ("text", "jsonl", "csv", "tsv")
+FIELDS = ("name", "greeting")
+
+# (name, greeting)
+Record = tuple[str, str]
+# Encodes the records for a block of names and their greetings, without header
+Encoder = Callable[[list[str], list[str]], str]
+
+
+def _text(_names: list[str], greetings: list[str]) -> str:
+    """Encode the greetings alone, one per line."""
+    return "".join([greeting + "\n" for greeting in greetings])
+
+
+def _jsonl(names: list[str], greetings: list[str]) -> str:
+    """Encode one JSON object per line, with the FIELDS as keys."""
+    fields = "".join(names) + "".join(greetings)
+    if fields.isascii() and fields.isprintable() and not _has(fields, '"\\'):
+        # Nothing to escape: quoting each string would return it unchanged
+        return "".join(
+            [
+                '{"name":"' + name + '","greeting":"' + greeting + '"}\n'
+                for name, greeting in zip(names, greetings)
+            ]
+        )
+    # The C string encoder json.dumps uses, without its per-call setup
+    quote = encode_basestring_ascii
+    return "".join(
+        [
+            '{"name":' + quote(name) + ',"greeting":' + quote(greeting) + "}\n"
+            for name, greeting in zip(names, greetings)
+        ]
+    )
+
+
+def _delimited(delimiter: str) -> Encoder:
+    """Return an encoder of one row per record, fields split by ``delimiter``."""
+
+    def encode(names: list[str], greetings: list[str]) -> str:
+        columns = _quote_column(names, delimiter), _quote_column(greetings, delimiter)
+        rows = map(delimiter.join, zip(*columns))
+        return "".join([row + "\n" for row in rows])
+
+    return encode
+
+
+def _quote_column(fields: list[str], delimiter: str) -> list[str]:
+    """Quote the fields holding ``delimiter``, a double quote or a line break."""
+    joined = "".join(fields)
+    if not _has(joined, delimiter + '"\r\n'):
+        return fields
+    if not _has(joined, '"\r\n'):
+        # Only delimiters, e.g. the comma of every greeting: nothing to escape
+        return ['"' + field + '"' if delimiter in field else field for field in fields]
+    return [
+        '"' + field.replace('"', '""') + '"'
+        if _has(field, delimiter + '"\r\n')
+        else field
+        for field in fields
+    ]
+
+
+def _has(text: str, characters: str) -> bool:
+    """Return whether ``text`` holds any of ``characters``."""
+    return any(character in text for character in characters)
+
+
+ENCODERS: dict[str, Encoder] = {
+    "text": _text,
+    "jsonl": _jsonl,
+    "csv": _delimited(","),
+    "tsv": _delimited("\t"),
+}
+
+
+def header(fmt: str) -> str:
+    """Return what precedes the records in ``fmt``: the csv and tsv header row."""
+    name, greeting = FIELDS
+    return ENCODERS[fmt]([name], [greeting]) if fmt in ("csv", "tsv") else ""
+
+
+def format_records(records: Iterable[Record], fmt: str) -> str:
+    """Return ``records`` encoded in ``fmt``, header included.
+
+    Example:
+        >>> print(format_records([("Ada", "Hello, Ada!")], "csv"), end="")
+        name,greeting
+        Ada,"Hello, Ada!"
+    """
+    rows = list(records)
+    names = [name for name, _ in rows]
+    greetings = [greeting for _, greeting in rows]
+    return header(fmt) + ENCODERS[fmt](names, greetings)
+
+
+def write_records(
+    source: BinaryIO,
+    sink: BinaryIO,
+    fmt: str,
+    *,
+    with_header: bool = True,
+    read_size: int = _READ_SIZE,
+) -> int:
+    """Write a record in ``fmt`` for each line of ``source`` to ``sink``.
+
+    The lines are read by :func:`~{{ cookiecutter.project_slug.replace('-', '_') }}.core.iter_line_chunks`, which
+    memory-maps regular files, and written by :func:`write_chunks`.
+
+    Args:
+        source: The input, opened in binary mode
+        sink: A writable binary file-like object
+        fmt: One of FORMATS
+        with_header: Whether to write the csv or tsv header row first
+        read_size: Approximate number of bytes per chunk of lines
+
+    Returns:
+        The number of records written, not counting the header
+    """
+    chunks = iter_line_chunks(source, read_size=read_size)
+    return write_chunks(chunks, sink, fmt, with_header=with_header)
+
+
+def write_chunks(
+    chunks: Iterable[bytes], sink: BinaryIO, fmt: str, *, with_header: bool = True
+) -> int:
+    """Write a record in ``fmt`` for each line of chunks of whole lines.
+
+    ``text`` goes through :func:`~{{ cookiecutter.project_slug.replace('-', '_') }}.core.greet_chunks`, which never decodes
+    its input; the other formats decode each chunk once.
+
+    Args:
+        chunks: Chunks of lines, each ending in ``\\n``, as yielded by
+            :func:`~{{ cookiecutter.project_slug.replace('-', '_') }}.core.iter_line_chunks`
+        sink: A writable binary file-like object
+        fmt: One of FORMATS
+        with_header: Whether to write the csv or tsv header row first
+
+    Returns:
+        The number of records written, not counting the header
+    """
+    if fmt == "text":
+        return greet_chunks(chunks, sink)
+    encode = ENCODERS[fmt]
+    if with_header:
+        sink.write(header(fmt).encode())
+    count = 0
+    for chunk in chunks:
+        names = chunk[:-1].decode("utf-8", "surrogateescape").split("\n")
+        count += len(names)
+        greetings = list(hello_world_many(names))
+        sink.write(encode(names, greetings).encode("utf-8", "surrogateescape"))
+    return count
@@ -0,0 +1,325 @@
+"""Opt-in call counts and latency histograms.
+
+Functions decorated with :func:`instrument` are left untouched while
+instrumentation is disabled, which is the default: the decorator returns the
+function itself, so the hot path pays nothing. :func:`enable` swaps every
+registered function for a timing wrapper wherever the package binds it
+(module globals, class attributes and ``from ... import`` copies in other
+package modules), and :func:`disable` swaps the raw functions back.
+
+References taken outside the package before a swap keep what they were
+bound to, and so do CLI commands already registered with typer or click. To
+instrument a whole process from the start, set
+``{{ cookiecutter.project_slug.replace('-', '_').upper() }}_INSTRUMENT=1`` in the environment; with
+``{{ cookiecutter.project_slug.replace('-', '_').upper() }}_INSTRUMENT_OUTPUT=PATH`` the snapshot is also written to
+``PATH`` at exit, in Prometheus text format if it ends in ``.prom`` and as
+JSON otherwise.
+
+Example:
+    >>> from {{ cookiecutter.project_slug.replace('-', '_') }} import core, instrumentation
+    >>> instrumentation.enable()
+    >>> core.hello_world("Ada")
+    'Hello, Ada!'
+    >>> instrumentation.snapshot()["core.hello_world"]["count"]
+    1
+    >>> instrumentation.disable()
+    >>> instrumentation.reset()
+"""
+
+from __future__ import annotations
+
+import atexit
+import bisect
+import functools
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Generator, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TypeVar, cast
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_PACKAGE = __name__.rpartition(".")[0]
+_ENV_PREFIX = "{{ cookiecutter.project_slug.replace('-', '_').upper() }}_INSTRUMENT"
+
+# Upper bounds of the latency buckets in seconds: 1us to 10s in 1-2.5-5 steps
+BUCKETS: tuple[float, ...] = (
+    *(float(f"{m}e{e}") for e in range(-6, 1) for m in (1, 2.5, 5)),
+    10.0,
+)
+
+# inspect.CO_GENERATOR, without importing inspect on the core import path
+_CO_GENERATOR = 0x20
+
+
+class Histogram:
+    """Thread-safe latency histogram with fixed :data:`BUCKETS`."""
+
+    __slots__ = ("_counts", "_lock", "count", "sum")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        # One counter per bucket, plus one for values above the last bound
+        self._counts = [0] * (len(BUCKETS) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum = 0.0
+
+    def clear(self) -> None:
+        """Forget every recorded call."""
+        with self._lock:
+            self._counts = [0] * (len(BUCKETS) + 1)
+            self.count = 0
+            self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one call that took ``seconds``."""
+        index = bisect.bisect_left(BUCKETS, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += seconds
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the count, the sum and the cumulative count per bucket bound."""
+        with self._lock:
+            counts, count, total = list(self._counts), self.count, self.sum
+        bounds = [*map(str, BUCKETS), "+Inf"]
+        cumulative = [sum(counts[: i + 1]) for i in range(len(counts))]
+        return {"count": count, "sum": total, "buckets": dict(zip(bounds, cumulative))}
+
+
+class _Registry:
+    """Histograms by metric name and the functions registered for swapping."""
+
+    def __init__(self) -> None:
+        self.enabled = os.environ.get(_ENV_PREFIX, "") not in ("", "0")
+        self.histograms: dict[str, Histogram] = {}
+        # (raw function, timing wrapper) for every instrumented function
+        self.probes: list[tuple[Callable[..., Any], Callable[..., Any]]] = []
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str) -> Histogram:
+        """Return the histogram for ``name``, creating it on first use."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, Histogram())
+        return histogram
+
+
+_REGISTRY = _Registry()
+
+
+def _time_iteration(
+    generator: Generator[Any, Any, Any], start: float, observe: Callable[[float], None]
+) -> Generator[Any, Any, Any]:
+    """Delegate to ``generator`` and record the time from ``start`` to its end."""
+    try:
+        return (yield from generator)
+    finally:
+        observe(time.perf_counter() - start)
+
+
+def _wrap(func: Callable[..., Any], name: str) -> Callable[..., Any]:
+    """Return a wrapper recording the latency of each call to ``func``.
+
+    Calls to generator functions are recorded when the generator finishes,
+    so that the latency covers the whole iteration.
+    """
+    observe = _REGISTRY.histogram(name).observe
+    clock = time.perf_counter
+
+    code = getattr(func, "__code__", None)
+    if code is None:
+        # Compiled (mypyc) functions have no code object telling whether they
+        # are generators, so check what each call returns instead
+        @functools.wraps(func)
+        def compiled_wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = clock()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                observe(clock() - start)
+                raise
+            if isinstance(result, Generator):
+                return _time_iteration(result, start, observe)
+            observe(clock() - start)
+            return result
+
+        return compiled_wrapper
+
+    if code.co_flags & _CO_GENERATOR:
+
+        @functools.wraps(func)
+        def generator_wrapper(*args: Any, **kwargs: Any) -> Any:
+            return _time_iteration(func(*args, **kwargs), clock(), observe)
+
+        return generator_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            observe(clock() - start)
+
+    return wrapper
+
+
+def instrument(func: F) -> F:
+    """Register ``func`` for call counting and latency recording.
+
+    The metric is named after the module and qualified name, e.g.
+    ``core.hello_world``. While instrumentation is disabled this returns
+    ``func`` itself. For generator functions the recorded latency spans the
+    whole iteration, including time the consumer spends between items.
+
+    Args:
+        func: A module-level function or method
+
+    Returns:
+        ``func``, or its timing wrapper if instrumentation is enabled
+    """
+    name = f"{func.__module__.rpartition('.')[2]}.{func.__qualname__}"
+    wrapped = _wrap(func, name)
+    _REGISTRY.probes.append((func, wrapped))
+    return cast(F, wrapped if _REGISTRY.enabled else func)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Record the latency of the ``with`` block under ``name``.
+
+    Unlike :func:`instrument` this checks whether instrumentation is enabled
+    on every use, so it costs a generator-based context manager even when
+    disabled; prefer the decorator on hot paths.
+
+    Example:
+        >>> with timed("startup"):
+        ...     pass
+    """
+    if not _REGISTRY.enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _REGISTRY.histogram(name).observe(time.perf_counter() - start)
+
+
+def _swap(replacements: dict[int, Callable[..., Any]]) -> None:
+    """Rebind package references to functions keyed by id in ``replacements``."""
+    for module_name, module in list(sys.modules.items()):
+        if module is None or (
+            module_name != _PACKAGE and not module_name.startswith(f"{_PACKAGE}.")
+        ):
+            continue
+        namespace = vars(module)
+        for attr, value in list(namespace.items()):
+            if id(value) in replacements:
+                namespace[attr] = replacements[id(value)]
+            elif isinstance(value, type) and value.__module__ == module_name:
+                for method, member in list(vars(value).items()):
+                    if id(member) in replacements:
+                        try:
+                            setattr(value, method, replacements[id(member)])
+                        except (AttributeError, TypeError):
+                            # Compiled (mypyc) or built-in classes are immutable
+                            continue
+
+
+def enable() -> None:
+    """Swap the timing wrappers in for every instrumented function."""
+    _REGISTRY.enabled = True
+    _swap({id(raw): wrapped for raw, wrapped in _REGISTRY.probes})
+
+
+def disable() -> None:
+    """Swap the raw functions back in; recorded metrics are kept."""
+    _REGISTRY.enabled = False
+    _swap({id(wrapped): raw for raw, wrapped in _REGISTRY.probes})
+
+
+def is_enabled() -> bool:
+    """Return True if instrumentation is enabled."""
+    return _REGISTRY.enabled
+
+
+def reset() -> None:
+    """Clear all recorded metrics."""
+    for histogram in list(_REGISTRY.histograms.values()):
+        histogram.clear()
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """Return the recorded metrics of every function that was called.
+
+    Returns:
+        A mapping of metric name to its ``count``, ``sum`` (seconds) and
+        cumulative ``buckets`` keyed by upper bound in seconds
+    """
+    return {
+        name: histogram.snapshot()
+        for name, histogram in sorted(_REGISTRY.histograms.items())
+        if histogram.count
+    }
+
+
+def to_json(indent: int | None = 2) -> str:
+    """Return :func:`snapshot` as a JSON document."""
+    import json
+
+    return json.dumps(snapshot(), indent=indent)
+
+
+def _sample(metric: str, value: object, **labels: str) -> str:
+    """Format one Prometheus sample line, e.g. ``name{function="f"} 1``."""
+    pairs = ",".join(f'{key}="{label}"' for key, label in labels.items())
+    return metric + "{" + pairs + "} " + str(value)
+
+
+def to_prometheus(prefix: str = _PACKAGE) -> str:
+    """Return :func:`snapshot` in the Prometheus text exposition format.
+
+    Each function becomes a ``function`` label on a ``<prefix>_calls_total``
+    counter and a ``<prefix>_call_duration_seconds`` histogram.
+    """
+    metrics = snapshot()
+    counter, histogram = f"{prefix}_calls_total", f"{prefix}_call_duration_seconds"
+    lines = [
+        f"# HELP {counter} Number of calls per instrumented function.",
+        f"# TYPE {counter} counter",
+    ]
+    lines.extend(
+        _sample(counter, data["count"], function=name) for name, data in metrics.items()
+    )
+    lines += [
+        f"# HELP {histogram} Latency of instrumented functions in seconds.",
+        f"# TYPE {histogram} histogram",
+    ]
+    for name, data in metrics.items():
+        lines.extend(
+            _sample(f"{histogram}_bucket", count, function=name, le=bound)
+            for bound, count in data["buckets"].items()
+        )
+        lines.append(_sample(f"{histogram}_sum", repr(data["sum"]), function=name))
+        lines.append(_sample(f"{histogram}_count", data["count"], function=name))
+    return "\n".join(lines) + "\n"
+
+
+def write(path: str | os.PathLike[str]) -> None:
+    """Write :func:`snapshot` to ``path``: Prometheus text for ``.prom``, else JSON."""
+    path = Path(path)
+    text = to_prometheus() if path.suffix == ".prom" else to_json() + "\n"
+    path.write_text(text, encoding="utf-8")
+
+
+_OUTPUT = os.environ.get(f"{_ENV_PREFIX}_OUTPUT")
+if _REGISTRY.enabled and _OUTPUT:
+    atexit.register(write, _OUTPUT)
@@ -0,0 +1,155 @@
+"""Profile CLI commands with cProfile.
+
+:func:`profiled` runs the enclosed block under cProfile and writes two files:
+the raw ``.pstats`` data, for ``python -m pstats`` or snakeviz, and a
+collapsed-stack text file with one ``frame;frame;frame microseconds`` line
+per stack, which flamegraph.pl, inferno and speedscope read directly.
+
+The CLI exposes this as ``--profile[=PATH]``. The path must be attached with
+``=``, so that ``--profile greet`` profiles the greet command rather than
+writing to a file named "greet".
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pstats
+
+# (filename, line number, function name), as keyed by pstats
+Func = tuple[str, int, str]
+
+DEFAULT_PATH = "{{ cookiecutter.project_slug }}.pstats"
+
+# pstats.SortKey values, listed here so that importing the CLI does not
+# import pstats
+SORT_KEYS = (
+    "calls",
+    "cumulative",
+    "filename",
+    "line",
+    "name",
+    "nfl",
+    "pcalls",
+    "stdname",
+    "time",
+)
+
+# Number of functions listed in the --profile-sort summary
+SUMMARY_LIMIT = 25
+
+# Deepest reconstructed stack; also bounds the walk through recursive calls
+_MAX_DEPTH = 128
+
+# Call paths below this many seconds are not followed any further
+_MIN_SECONDS = 1e-6
+
+
+def expand_profile_flag(args: list[str]) -> list[str]:
+    """Return ``args`` with a bare ``--profile`` turned into ``--profile=PATH``.
+
+    Arguments after ``--`` are left alone.
+    """
+    expanded = list(args)
+    for index, arg in enumerate(expanded):
+        if arg == "--":
+            break
+        if arg == "--profile":
+            expanded[index] = f"--profile={DEFAULT_PATH}"
+    return expanded
+
+
+def _label(func: Func) -> str:
+    """Return the flame graph frame name for a pstats function key."""
+    filename, line, name = func
+    if filename == "~":
+        # Built-in functions have no source location
+        return name
+    return f"{name} ({Path(filename).name}:{line})"
+
+
+def collapsed_stacks(stats: pstats.Stats) -> dict[str, float]:
+    """Rebuild call stacks, with their self time in seconds, from ``stats``.
+
+    cProfile records caller/callee pairs rather than full stacks, so each
+    function's time is split across its callers in proportion to the time
+    spent in it from each one. This is exact for call trees and a close
+    approximation when a function is reached through several paths.
+    """
+    entries = stats.stats  # type: ignore[attr-defined]
+    callees: dict[Func, list[Func]] = {}
+    roots: list[Func] = []
+    for func, (*_, callers) in entries.items():
+        if not callers:
+            roots.append(func)
+        for caller in callers:
+            callees.setdefault(caller, []).append(func)
+
+    stacks: dict[str, float] = {}
+
+    def walk(func: Func, path: tuple[str, ...], seconds: float) -> None:
+        _, _, self_time, total, _ = entries[func]
+        share = seconds / total if total else 0.0
+        path = (*path, _label(func))
+        stack = ";".join(path)
+        stacks[stack] = stacks.get(stack, 0.0) + self_time * share
+        if len(path) >= _MAX_DEPTH:
+            return
+        for callee in callees.get(func, ()):
+            # Cumulative time of callee when called from func, on this path
+            edge = entries[callee][4][func][3] * share
+            if edge >= _MIN_SECONDS and _label(callee) not in path:
+                walk(callee, path, edge)
+
+    for root in roots:
+        walk(root, (), entries[root][3])
+    return stacks
+
+
+def write_collapsed(stats: pstats.Stats, path: Path) -> None:
+    """Write the collapsed stacks of ``stats`` to ``path``, in microseconds."""
+    lines = []
+    for stack, seconds in sorted(collapsed_stacks(stats).items()):
+        micros = round(seconds * 1e6)
+        if micros:
+            lines.append(f"{stack} {micros}\n")
+    path.write_text("".join(lines), encoding="utf-8")
+
+
+@contextmanager
+def profiled(path: str | None = None, sort: str | None = None) -> Iterator[None]:
+    """Profile the enclosed block if ``path`` or ``sort`` is given.
+
+    Args:
+        path: File for the pstats data, DEFAULT_PATH if only ``sort`` is
+            given. The collapsed stacks are written next to it with a
+            ``.collapsed`` suffix.
+        sort: One of SORT_KEYS to print the top functions to stderr, or
+            None for no summary
+    """
+    if path is None and sort is None:
+        yield
+        return
+
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        target = Path(path or DEFAULT_PATH)
+        collapsed = target.with_suffix(".collapsed")
+        profiler.dump_stats(target)
+        stats = pstats.Stats(profiler, stream=sys.stderr)
+        write_collapsed(stats, collapsed)
+        if sort is not None:
+            stats.sort_stats(sort).print_stats(SUMMARY_LIMIT)
+        print(f"Profile written to {target} and {collapsed}", file=sys.stderr)
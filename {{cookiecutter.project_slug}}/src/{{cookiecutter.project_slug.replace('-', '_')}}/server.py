@@ -0,0 +1,325 @@
+"""Local HTTP/JSON server for the core functions.
+
+Callers making many small requests pay for a new interpreter on every CLI
+invocation; :func:`serve` answers them from one long-running process
+instead:
+
+    POST /hello  {"name": "Ada"}            -> {"greeting": "Hello, Ada!"}
+    POST /greet  {"names": ["Ada", "Bob"]}  -> {"greetings": [...]}
+    POST /add    {"a": 2, "b": 3}           -> {"result": 5}
+
+The server speaks the subset of HTTP/1.1 these calls need, on asyncio
+streams. Connections are kept alive between requests until the client sends
+``Connection: close`` or stays idle for KEEPALIVE_TIMEOUT seconds, and
+pipelined requests are answered in order straight from the read buffer.
+Request bodies need a ``Content-Length``; chunked uploads are refused.
+
+On SIGINT or SIGTERM the server stops accepting connections, closes the
+idle ones and lets requests in progress finish, for up to SHUTDOWN_TIMEOUT
+seconds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import signal
+import sys
+from collections.abc import Callable
+from http import HTTPStatus
+from types import TracebackType
+from typing import Any, NamedTuple, cast
+
+from .core import add_numbers, hello_world, hello_world_many
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+# Largest request line plus headers, and largest body, in bytes
+MAX_HEAD = 16 << 10
+MAX_BODY = 1 << 20
+# Seconds a connection may stay idle between two requests
+KEEPALIVE_TIMEOUT = 5.0
+# Seconds requests in progress get to finish on shutdown
+SHUTDOWN_TIMEOUT = 10.0
+
+# Decoded JSON request body -> JSON response object
+Handler = Callable[[Any], dict[str, Any]]
+
+_MISSING = object()
+
+
+class HTTPError(Exception):
+    """A request error, answered with ``status`` and ``{"error": message}``."""
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _field(
+    request: Any,
+    key: str,
+    kind: type | tuple[type, ...],
+    what: str,
+    default: Any = _MISSING,
+) -> Any:
+    """Return ``request[key]``, checking that it is an instance of ``kind``."""
+    if not isinstance(request, dict):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "body must be a JSON object")
+    value = request.get(key, default)
+    if value is _MISSING:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"missing {key!r}")
+    # bool is a subclass of int, but true + false is not a sum anyone meant
+    if not isinstance(value, kind) or isinstance(value, bool):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"{key!r} must be {what}")
+    return value
+
+
+def _hello(request: Any) -> dict[str, Any]:
+    """Greet ``name``, World by default."""
+    return {"greeting": hello_world(_field(request, "name", str, "a string", "World"))}
+
+
+def _greet(request: Any) -> dict[str, Any]:
+    """Greet each of ``names`` in one batch."""
+    names = _field(request, "names", list, "a list of strings")
+    if not all(isinstance(name, str) for name in names):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "'names' must be a list of strings")
+    return {"greetings": list(hello_world_many(names))}
+
+
+def _add(request: Any) -> dict[str, Any]:
+    """Add numbers ``a`` and ``b``."""
+    a = _field(request, "a", (int, float), "a number")
+    b = _field(request, "b", (int, float), "a number")
+    return {"result": add_numbers(a, b)}
+
+
+ROUTES: dict[str, Handler] = {"/hello": _hello, "/greet": _greet, "/add": _add}
+
+
+def handle(method: str, path: str, body: bytes) -> tuple[HTTPStatus, dict[str, Any]]:
+    """Answer one request to ``path``; an empty body counts as ``{}``.
+
+    Returns:
+        The response status and JSON object
+    """
+    try:
+        handler = ROUTES.get(path)
+        if handler is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"no endpoint {path}")
+        if method != "POST":
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "use POST")
+        try:
+            request = json.loads(body) if body else {}
+        except (ValueError, RecursionError):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "body is not valid JSON") from None
+        return HTTPStatus.OK, handler(request)
+    except HTTPError as exc:
+        return exc.status, {"error": str(exc)}
+
+
+class Request(NamedTuple):
+    """What the server needs from a request line and headers."""
+
+    method: str
+    path: str
+    length: int
+    # Connection header to answer with: None keeps an HTTP/1.1 connection
+    # open, "keep-alive" an HTTP/1.0 one, and "close" closes it
+    connection: str | None
+    # Whether the client waits for "100 Continue" before sending the body
+    expect_continue: bool
+
+
+def parse_head(head: bytes) -> Request:
+    """Parse a request line and headers ending with a blank line.
+
+    Raises:
+        HTTPError: If the request is malformed or its body is not acceptable
+    """
+    request_line, _, header_block = head.decode("latin-1").partition("\r\n")
+    try:
+        method, target, version = request_line.split(" ")
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "malformed request line") from None
+    if version not in ("HTTP/1.1", "HTTP/1.0"):
+        raise HTTPError(
+            HTTPStatus.HTTP_VERSION_NOT_SUPPORTED, f"{version} not supported"
+        )
+    headers = {}
+    for line in header_block.split("\r\n"):
+        name, colon, value = line.partition(":")
+        if colon:
+            headers[name.strip().lower()] = value.strip()
+    if "transfer-encoding" in headers:
+        raise HTTPError(HTTPStatus.NOT_IMPLEMENTED, "send a Content-Length instead")
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "invalid Content-Length") from None
+    if length < 0:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+    if length > MAX_BODY:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "body too large")
+
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.1":
+        reply = "close" if connection == "close" else None
+    else:
+        reply = "keep-alive" if connection == "keep-alive" else "close"
+    expect_continue = headers.get("expect", "").lower() == "100-continue"
+    return Request(method, target.partition("?")[0], length, reply, expect_continue)
+
+
+def encode_response(
+    status: HTTPStatus, payload: dict[str, Any], connection: str | None = None
+) -> bytes:
+    """Return a complete HTTP/1.1 response carrying ``payload`` as JSON."""
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+    )
+    if connection is not None:
+        head += f"Connection: {connection}\r\n"
+    if status is HTTPStatus.METHOD_NOT_ALLOWED:
+        head += "Allow: POST\r\n"
+    return b"".join((head.encode(), b"\r\n", body))
+
+
+class Server:
+    """The HTTP/JSON server on one local address.
+
+    Use it as an async context manager, or call :meth:`start` and
+    :meth:`shutdown`:
+
+        >>> async def main():
+        ...     async with Server(port=0) as server:
+        ...         return server.port > 0
+        >>> asyncio.run(main())
+        True
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        """Prepare a server for ``host`` and ``port``; port 0 picks a free one."""
+        self.host = host
+        self.port = port
+        self._server: asyncio.AbstractServer | None = None
+        self._connections: set[asyncio.Task[Any]] = set()
+        # Connections waiting for their next request, closed first on shutdown
+        self._idle: set[asyncio.Task[Any]] = set()
+        self._closing = False
+
+    async def start(self) -> None:
+        """Start accepting connections."""
+        server = await asyncio.start_server(
+            self._serve_connection, self.host, self.port, limit=MAX_HEAD
+        )
+        self._server = server
+        self.port = server.sockets[0].getsockname()[1]
+
+    async def shutdown(self, timeout: float = SHUTDOWN_TIMEOUT) -> None:
+        """Stop accepting, close idle connections and drain the busy ones.
+
+        A busy connection is closed after its current response; those still
+        busy after ``timeout`` seconds are cancelled.
+        """
+        self._closing = True
+        if self._server is not None:
+            self._server.close()
+        for task in self._idle:
+            task.cancel()
+        if self._connections:
+            _, pending = await asyncio.wait(set(self._connections), timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    async def __aenter__(self) -> Server:
+        """Start the server."""
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Shut the server down gracefully."""
+        await self.shutdown()
+
+    async def _serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer the requests of one connection, in order, until it closes."""
+        # Stream callbacks always run in a task of their own
+        task = cast("asyncio.Task[Any]", asyncio.current_task())
+        loop = asyncio.get_running_loop()
+        self._connections.add(task)
+        try:
+            while not self._closing:
+                # A timer rather than asyncio.wait_for, which costs a task per
+                # request before Python 3.12
+                self._idle.add(task)
+                timer = loop.call_later(KEEPALIVE_TIMEOUT, task.cancel)
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                finally:
+                    timer.cancel()
+                    self._idle.discard(task)
+
+                try:
+                    request = parse_head(head)
+                except HTTPError as exc:
+                    payload = {"error": str(exc)}
+                    writer.write(encode_response(exc.status, payload, "close"))
+                    break
+                body = b""
+                if request.length:
+                    if request.expect_continue:
+                        writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+                    body = await reader.readexactly(request.length)
+                status, payload = handle(request.method, request.path, body)
+                connection = "close" if self._closing else request.connection
+                writer.write(encode_response(status, payload, connection))
+                await writer.drain()
+                if connection == "close":
+                    break
+        except asyncio.LimitOverrunError:
+            status = HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE
+            writer.write(encode_response(status, {"error": "head too large"}, "close"))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # The client closed the connection
+        except asyncio.CancelledError:
+            pass  # Idle for too long, or idle during shutdown
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+
+async def _serve(host: str, port: int) -> None:
+    """Serve until SIGINT or SIGTERM, then shut down gracefully."""
+    async with Server(host, port) as server:
+        print(f"Serving on http://{host}:{server.port}", file=sys.stderr, flush=True)
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            # Not on Windows, where Ctrl+C raises KeyboardInterrupt instead
+            with contextlib.suppress(NotImplementedError):
+                loop.add_signal_handler(signum, stop.set)
+        await stop.wait()
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+    """Serve the core functions on ``host`` and ``port`` until interrupted.
+
+    The address actually bound is printed to standard error first, e.g.
+    ``Serving on http://127.0.0.1:8000``; port 0 picks a free port.
+    """
+    asyncio.run(_serve(host, port))
@@ -0,0 +1,112 @@
+"""Tests for {{ cookiecutter.project_slug }} asyncio API."""
+{%- if cookiecutter.use_pytest == "y" %}
+
+import asyncio
+
+import pytest
+
+from {{ cookiecutter.project_slug.replace('-', '_') }}.aio import aadd_numbers, agreet_many, ahello_world
+from {{ cookiecutter.project_slug.replace('-', '_') }}.core import hello_world
+
+NAMES = [f"user{i}" for i in range(25)]
+
+
+async def collect(greetings):
+    """Return all items of an async iterator as a list."""
+    return [greeting async for greeting in greetings]
+
+
+async def async_names(names):
+    """Yield names from an async generator."""
+    for name in names:
+        await asyncio.sleep(0)
+        yield name
+
+
+def test_ahello_world():
+    """Test the awaitable greeting and addition."""
+    assert asyncio.run(ahello_world()) == "Hello, World!"
+    assert asyncio.run(ahello_world("Python")) == "Hello, Python!"
+    assert asyncio.run(aadd_numbers(2, 3)) == 5.0
+
+
+@pytest.mark.parametrize("concurrency", [None, 1, 3])
+@pytest.mark.parametrize("source", [list, iter, async_names])
+def test_agreet_many_order(concurrency, source):
+    """Test that greetings match hello_world in input order."""
+    greetings = agreet_many(source(NAMES), concurrency=concurrency, chunk_size=4)
+    assert asyncio.run(collect(greetings)) == [hello_world(n) for n in NAMES]
+
+
+def test_agreet_many_empty():
+    """Test that an empty input yields nothing."""
+    assert asyncio.run(collect(agreet_many([], concurrency=2))) == []
+
+
+@pytest.mark.parametrize("kwargs", [{"concurrency": 0}, {"chunk_size": 0}])
+def test_agreet_many_invalid_arguments(kwargs):
+    """Test that non-positive concurrency and chunk sizes are rejected."""
+    with pytest.raises(ValueError):
+        asyncio.run(collect(agreet_many(NAMES, **kwargs)))
+
+
+def test_agreet_many_yields_between_chunks():
+    """Test that other tasks run between chunks on the event loop."""
+    events = []
+
+    async def ticker():
+        for _ in range(3):
+            events.append("tick")
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        async for greeting in agreet_many(NAMES[:6], chunk_size=2):
+            events.append(greeting)
+        await task
+
+    asyncio.run(main())
+    # The ticker gets a turn after the first chunk, before the second one
+    assert events.index("tick") < events.index("Hello, user2!")
+
+
+@pytest.mark.parametrize("concurrency", [None, 2])
+def test_agreet_many_backpressure(concurrency):
+    """Test that input is read only a few chunks ahead of the consumer."""
+    consumed = []
+
+    def names():
+        for i in range(1000):
+            consumed.append(i)
+            yield f"user{i}"
+
+    async def main():
+        greetings = agreet_many(names(), concurrency=concurrency, chunk_size=10)
+        first = await greetings.__anext__()
+        await greetings.aclose()
+        return first
+
+    assert asyncio.run(main()) == "Hello, user0!"
+    assert len(consumed) <= 10 * (concurrency or 1) + 1
+
+
+def test_agreet_many_cancellation():
+    """Test that cancelling the consumer stops the iteration promptly."""
+    seen = []
+
+    async def consume():
+        names = (f"user{i}" for i in range(10**9))
+        async for greeting in agreet_many(names, concurrency=2, chunk_size=100):
+            seen.append(greeting)
+
+    async def main():
+        task = asyncio.create_task(consume())
+        while len(seen) < 500:
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert seen[:2] == ["Hello, user0!", "Hello, user1!"]
+{%- endif %}
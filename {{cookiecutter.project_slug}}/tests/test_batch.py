@@ -0,0 +1,139 @@
+"""Tests for batch greeting from the command line."""
+{%- if cookiecutter.use_pytest == "y" %}
+
+import io
+import subprocess
+import sys
+
+import pytest
+
+from {{ cookiecutter.project_slug.replace('-', '_') }} import batch
+from {{ cookiecutter.project_slug.replace('-', '_') }}.batch import greet_range, greet_stream, open_input, split_ranges
+from {{ cookiecutter.project_slug.replace('-', '_') }}.core import shutdown_pool
+from {{ cookiecutter.project_slug.replace('-', '_') }}.formats import FORMATS, write_records
+
+PACKAGE = "{{ cookiecutter.project_slug.replace('-', '_') }}"
+# Lines of assorted lengths, with an empty line, CRLF and no final newline
+CONTENT = b"Alice\nBob\n\nJos\xc3\xa9\r\n" + b"x" * 20 + b"\nlast"
+
+
+def greetings(content, fmt="text", with_header=True):
+    """Return the sequential records for ``content``."""
+    sink = io.BytesIO()
+    write_records(io.BytesIO(content), sink, fmt, with_header=with_header)
+    return sink.getvalue()
+
+
+def test_greet_stream(tmp_path, capsys):
+    """Test that every line of the source is greeted on standard output."""
+    path = tmp_path / "names.txt"
+    path.write_bytes(b"Alice\nBob\n")
+    with open_input(str(path)) as source:
+        assert greet_stream(source) == 0
+    assert capsys.readouterr().out == "Hello, Alice!\nHello, Bob!\n"
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 11, len(CONTENT)])
+def test_ranges_greet_every_line_once(tmp_path, size, fmt):
+    """Test that consecutive ranges of any size cover each line exactly once."""
+    path = tmp_path / "names.txt"
+    path.write_bytes(CONTENT)
+    bounds = range(0, len(CONTENT), size)
+    parts = [
+        greet_range((str(path), lo, min(lo + size, len(CONTENT)), fmt)) for lo in bounds
+    ]
+    assert b"".join(parts) == greetings(CONTENT, fmt, with_header=False)
+
+
+def test_split_ranges(tmp_path, monkeypatch):
+    """Test that only regular files larger than one range are split."""
+    monkeypatch.setattr(batch, "RANGE_SIZE", 10)
+    path = tmp_path / "names.txt"
+    path.write_bytes(CONTENT)
+    with path.open("rb") as source:
+        source.seek(5)
+        ranges = split_ranges(source, "csv")
+    assert ranges[0] == (str(path), 5, 15, "csv")
+    assert ranges[-1][2] == len(CONTENT)
+    assert split_ranges(io.BytesIO(CONTENT)) is None
+    monkeypatch.setattr(batch, "RANGE_SIZE", len(CONTENT))
+    with path.open("rb") as source:
+        assert split_ranges(source) is None
+
+
+@pytest.mark.parametrize("fmt", ["text", "csv"])
+def test_parallel_output_is_ordered(tmp_path, capsysbinary, monkeypatch, fmt):
+    """Test that --jobs output matches the sequential output line for line."""
+    monkeypatch.setattr(batch, "RANGE_SIZE", 1000)
+    content = "".join(f"user{i}\n" for i in range(20_000)).encode()
+    path = tmp_path / "names.txt"
+    path.write_bytes(content)
+    try:
+        with path.open("rb") as source:
+            assert greet_stream(source, jobs=2, fmt=fmt) == 0
+    finally:
+        shutdown_pool()
+    assert capsysbinary.readouterr().out == greetings(content, fmt)
+
+
+def test_open_input_dash_is_stdin():
+    """Test that '-' reads standard input."""
+    assert open_input("-") is sys.stdin.buffer
+
+
+def test_stdin_streams_in_one_process():
+    """Test greeting standard input through the CLI."""
+    names = "".join(f"user{i}\n" for i in range(100_000))
+    result = subprocess.run(
+        [sys.executable, "-m", f"{PACKAGE}.cli", "greet", "--input", "-"],
+        input=names.encode(),
+        capture_output=True,
+        check=True,
+    )
+    lines = result.stdout.splitlines()
+    assert len(lines) == 100_000
+    assert lines[-1] == b"Hello, user99999!"
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_peak_memory_independent_of_file_size(tmp_path):
+    """Test that a mapped file's pages are released as it is greeted."""
+    # VmHWM rather than ru_maxrss, which counts the parent's memory at fork
+    script = (
+        "import sys\n"
+        f"from {PACKAGE}.batch import greet_stream, open_input\n"
+        "greet_stream(open_input(sys.argv[1]))\n"
+        "status = open('/proc/self/status').read()\n"
+        "print(status.split('VmHWM:')[1].split()[0], file=sys.stderr)"
+    )
+    peaks = []
+    for lines in (1 << 10, 2 << 20):
+        path = tmp_path / f"{lines}.txt"
+        path.write_bytes((b"x" * 31 + b"\n") * lines)
+        result = subprocess.run(
+            [sys.executable, "-c", script, str(path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=True,
+        )
+        peaks.append(int(result.stderr))
+    # 64 MiB more input, well under 16 MiB more memory (in KiB)
+    assert peaks[1] - peaks[0] < 16 << 10
+
+
+def test_broken_pipe_exits_quietly(tmp_path):
+    """Test that closing standard output early is not reported as an error."""
+    path = tmp_path / "names.txt"
+    path.write_text("".join(f"user{i}\n" for i in range(1_000_000)))
+    process = subprocess.Popen(
+        [sys.executable, "-m", f"{PACKAGE}.cli", "greet", "--input", str(path)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert process.stdout.readline() == b"Hello, user0!\n"
+    process.stdout.close()
+    assert process.wait() == 1
+    assert process.stderr.read() == b""
+    process.stderr.close()
+{%- endif %}
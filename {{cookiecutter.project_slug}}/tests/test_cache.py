@@ -0,0 +1,194 @@
+"""Tests for {{ cookiecutter.project_slug }} greeting caches."""
+{%- if cookiecutter.use_pytest == "y" %}
+
+import threading
+
+import pytest
+
+from {{ cookiecutter.project_slug.replace('-', '_') }} import instrumentation
+from {{ cookiecutter.project_slug.replace('-', '_') }}.cache import (
+    Cached{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }},
+    LRUCache,
+    cached_hello_world,
+    memoize,
+)
+
+
+class FakeTimer:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_cache():
+    """Start every test with an empty shared greeting cache."""
+    cached_hello_world.cache_clear()
+    yield
+    cached_hello_world.cache_clear()
+
+
+class TestLRUCache:
+    """Test the bounded LRU cache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest unused entry is evicted when full."""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1  # "b" is now the least recently used
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.cache_info().evictions == 1
+
+    def test_ttl_expiry(self):
+        """Test that entries expire ttl seconds after being stored."""
+        timer = FakeTimer()
+        cache = LRUCache(maxsize=10, ttl=5, timer=timer)
+        cache.put("a", 1)
+        timer.now = 4.9
+        assert cache.get("a") == 1
+        timer.now = 5.0
+        assert cache.get("a", "missing") == "missing"
+        info = cache.cache_info()
+        assert (info.hits, info.misses, info.expirations, info.currsize) == (1, 1, 1, 0)
+
+    def test_cache_info_and_clear(self):
+        """Test the statistics snapshot and resetting it."""
+        cache = LRUCache(maxsize=3)
+        assert cache.cache_info().hit_rate == 0.0
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("b")
+        info = cache.cache_info()
+        assert info.hit_rate == 0.5
+        assert (info.maxsize, info.currsize, info.ttl) == (3, 1, None)
+        cache.clear()
+        assert cache.cache_info()[:2] == (0, 0)
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize("kwargs", [{"maxsize": 0}, {"ttl": 0}])
+    def test_invalid_arguments(self, kwargs):
+        """Test that non-positive sizes and TTLs are rejected."""
+        with pytest.raises(ValueError):
+            LRUCache(**kwargs)
+
+    def test_thread_safety(self):
+        """Test that concurrent access keeps the bound and the counters."""
+        cache = LRUCache(maxsize=50)
+
+        def worker(offset):
+            for i in range(2000):
+                key = (offset + i) % 100
+                if cache.get(key) is None:
+                    cache.put(key, key)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cache.cache_info()
+        assert info.currsize <= 50
+        assert info.hits + info.misses == 8 * 2000
+
+
+class TestMemoize:
+    """Test the memoizing decorator."""
+
+    def test_caches_by_arguments(self):
+        """Test that repeated calls with the same arguments hit the cache."""
+        calls = []
+
+        @memoize(maxsize=8)
+        def double(value, factor=2):
+            calls.append((value, factor))
+            return value * factor
+
+        assert double(3) == 6
+        assert double(3) == 6
+        assert double(3, factor=3) == 9
+        assert calls == [(3, 2), (3, 3)]
+        assert double.cache_info().hits == 1
+
+    def test_caches_none_results(self):
+        """Test that a None result is cached like any other value."""
+        calls = []
+
+        @memoize()
+        def nothing(value):
+            calls.append(value)
+
+        nothing(1)
+        nothing(1)
+        assert calls == [1]
+
+    def test_bypass_cache(self):
+        """Test that bypassed calls neither read nor update the cache."""
+        calls = []
+
+        @memoize()
+        def echo(value):
+            calls.append(value)
+            return value
+
+        assert echo("a", bypass_cache=True) == "a"
+        assert echo("a", bypass_cache=True) == "a"
+        assert calls == ["a", "a"]
+        assert echo.cache_info()[:2] == (0, 0)
+
+    def test_wraps_metadata(self):
+        """Test that the wrapper exposes the wrapped function."""
+
+        @memoize()
+        def greet(name):
+            """Say hello."""
+            return name
+
+        assert greet.__name__ == "greet"
+        assert greet.__doc__ == "Say hello."
+        assert greet.__wrapped__("x") == "x"
+
+
+class TestGreetingCache:
+    """Test the ready-made greeting caches."""
+
+    def test_cached_hello_world(self):
+        """Test that cached greetings match hello_world and are counted."""
+        assert cached_hello_world("Alice") == "Hello, Alice!"
+        assert cached_hello_world("Alice") == "Hello, Alice!"
+        assert cached_hello_world() == "Hello, World!"
+        info = cached_hello_world.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+
+    def test_cached_class_shares_cache(self):
+        """Test that instances greet through the shared greeting cache."""
+        instance = Cached{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}("Bob")
+        assert instance.greet() == "Hello, Bob!"
+        assert cached_hello_world("Bob") == "Hello, Bob!"
+        assert cached_hello_world.cache_info().hits == 1
+        assert instance.greet(bypass_cache=True) == "Hello, Bob!"
+        assert cached_hello_world.cache_info().hits == 1
+        assert not hasattr(instance, "__dict__")
+
+    def test_instrumented_misses(self):
+        """Test that misses and bypassed calls reach instrumented hello_world."""
+        instrumentation.reset()
+        instrumentation.enable()
+        try:
+            cached_hello_world("Eve")
+            cached_hello_world("Eve")
+            cached_hello_world("Eve", bypass_cache=True)
+            metrics = instrumentation.snapshot()
+        finally:
+            instrumentation.disable()
+            instrumentation.reset()
+        assert metrics["core.hello_world"]["count"] == 2
+{%- endif %}
@@ -2,9 +2,13 @@
 {%- if cookiecutter.use_pytest == "y" and cookiecutter.command_line_interface != "none" %}
 {%- if cookiecutter.command_line_interface == "typer" %}
 
+import pstats
+
 from typer.testing import CliRunner
 
+from {{ cookiecutter.project_slug.replace('-', '_') }} import server
 from {{ cookiecutter.project_slug.replace('-', '_') }}.cli import app
+from {{ cookiecutter.project_slug.replace('-', '_') }}.profiling import DEFAULT_PATH
 
 runner = CliRunner()
 
@@ -36,11 +40,94 @@ def test_cli_help():
     assert result.exit_code == 0
     assert "{{ cookiecutter.project_short_description }}" in result.stdout
 
+
+def test_cli_greet_input(tmp_path):
+    """Test greeting each line of a file."""
+    path = tmp_path / "names.txt"
+    path.write_text("Alice\nBob\n")
+    result = runner.invoke(app, ["greet", "--input", str(path)])
+    assert result.exit_code == 0
+    assert result.stdout == "Hello, Alice!\nHello, Bob!\n"
+    result = runner.invoke(app, ["greet", "--input", str(path), "--jobs", "2"])
+    assert result.exit_code == 0
+    assert result.stdout == "Hello, Alice!\nHello, Bob!\n"
+    assert runner.invoke(app, ["greet", "-i", str(path), "-j", "-1"]).exit_code != 0
+
+
+def test_cli_greet_format(tmp_path):
+    """Test structured output for one name and for each line of a file."""
+    result = runner.invoke(app, ["greet", "Ada", "--format", "jsonl"])
+    assert result.exit_code == 0
+    assert result.stdout == '{"name":"Ada","greeting":"Hello, Ada!"}\n'
+    path = tmp_path / "names.txt"
+    path.write_text("Alice\nBob\n")
+    result = runner.invoke(app, ["greet", "-i", str(path), "-f", "tsv"])
+    assert result.exit_code == 0
+    assert result.stdout == "name\tgreeting\nAlice\tHello, Alice!\nBob\tHello, Bob!\n"
+    assert runner.invoke(app, ["greet", "--format", "xml"]).exit_code != 0
+
+
+def test_cli_greet_stdin():
+    """Test greeting each line of standard input."""
+    result = runner.invoke(app, ["greet", "-i", "-"], input="Alice\nBob")
+    assert result.exit_code == 0
+    assert result.stdout == "Hello, Alice!\nHello, Bob!\n"
+
+
+def test_cli_greet_input_with_name(tmp_path):
+    """Test that a name cannot be combined with --input."""
+    path = tmp_path / "names.txt"
+    path.write_text("Alice\n")
+    result = runner.invoke(app, ["greet", "Bob", "--input", str(path)])
+    assert result.exit_code != 0
+
+
+def test_cli_profile(tmp_path):
+    """Test that --profile writes pstats and collapsed stacks."""
+    path = tmp_path / "greet.pstats"
+    result = runner.invoke(app, [f"--profile={path}", "greet", "Python"])
+    assert result.exit_code == 0
+    assert "Hello, Python!" in result.stdout
+    assert pstats.Stats(str(path)).total_calls > 0
+    assert "greet" in path.with_suffix(".collapsed").read_text()
+
+
+def test_cli_profile_default_path(tmp_path, monkeypatch):
+    """Test that a bare --profile before the command uses the default path."""
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(app, ["--profile", "greet"])
+    assert result.exit_code == 0
+    assert (tmp_path / DEFAULT_PATH).exists()
+
+
+def test_cli_profile_sort(tmp_path, monkeypatch):
+    """Test that --profile-sort prints a summary."""
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(app, ["--profile-sort", "cumulative", "greet"])
+    assert result.exit_code == 0
+    assert "function calls" in result.output
+    assert runner.invoke(app, ["--profile-sort", "bogus", "greet"]).exit_code != 0
+
+
+def test_cli_serve(monkeypatch):
+    """Test that serve starts the server on the requested address."""
+    calls = []
+    monkeypatch.setattr(server, "serve", lambda host, port: calls.append((host, port)))
+    assert runner.invoke(app, ["serve"]).exit_code == 0
+    result = runner.invoke(app, ["serve", "--host", "localhost", "--port", "0"])
+    assert result.exit_code == 0
+    assert calls == [(server.DEFAULT_HOST, server.DEFAULT_PORT), ("localhost", 0)]
+    assert runner.invoke(app, ["serve", "--port", "70000"]).exit_code != 0
+
 {%- elif cookiecutter.command_line_interface == "click" %}
 
+import pstats
+
 from click.testing import CliRunner
 
+from {{ cookiecutter.project_slug.replace('-', '_') }} import server
 from {{ cookiecutter.project_slug.replace('-', '_') }}.cli import main
+from {{ cookiecutter.project_slug.replace('-', '_') }}.profiling import DEFAULT_PATH
 
 runner = CliRunner()
 
@@ -64,12 +151,96 @@ def test_cli_greet_custom():
     assert result.exit_code == 0
     assert "Hello, Python!" in result.output
 
+
+def test_cli_greet_input(tmp_path):
+    """Test greeting each line of a file."""
+    path = tmp_path / "names.txt"
+    path.write_text("Alice\nBob\n")
+    result = runner.invoke(main, ["greet", "--input", str(path)])
+    assert result.exit_code == 0
+    assert result.output == "Hello, Alice!\nHello, Bob!\n"
+    result = runner.invoke(main, ["greet", "--input", str(path), "--jobs", "2"])
+    assert result.exit_code == 0
+    assert result.output == "Hello, Alice!\nHello, Bob!\n"
+    assert runner.invoke(main, ["greet", "-i", str(path), "-j", "-1"]).exit_code != 0
+
+
+def test_cli_greet_format(tmp_path):
+    """Test structured output for one name and for each line of a file."""
+    result = runner.invoke(main, ["greet", "Ada", "--format", "jsonl"])
+    assert result.exit_code == 0
+    assert result.output == '{"name":"Ada","greeting":"Hello, Ada!"}\n'
+    path = tmp_path / "names.txt"
+    path.write_text("Alice\nBob\n")
+    result = runner.invoke(main, ["greet", "-i", str(path), "-f", "tsv"])
+    assert result.exit_code == 0
+    assert result.output == "name\tgreeting\nAlice\tHello, Alice!\nBob\tHello, Bob!\n"
+    assert runner.invoke(main, ["greet", "--format", "xml"]).exit_code != 0
+
+
+def test_cli_greet_stdin():
+    """Test greeting each line of standard input."""
+    result = runner.invoke(main, ["greet", "-i", "-"], input="Alice\nBob")
+    assert result.exit_code == 0
+    assert result.output == "Hello, Alice!\nHello, Bob!\n"
+
+
+def test_cli_greet_input_with_name(tmp_path):
+    """Test that a name cannot be combined with --input."""
+    path = tmp_path / "names.txt"
+    path.write_text("Alice\n")
+    result = runner.invoke(main, ["greet", "Bob", "--input", str(path)])
+    assert result.exit_code != 0
+
+
+def test_cli_profile(tmp_path):
+    """Test that --profile writes pstats and collapsed stacks."""
+    path = tmp_path / "greet.pstats"
+    result = runner.invoke(main, [f"--profile={path}", "greet", "Python"])
+    assert result.exit_code == 0
+    assert "Hello, Python!" in result.output
+    assert pstats.Stats(str(path)).total_calls > 0
+    assert "greet" in path.with_suffix(".collapsed").read_text()
+
+
+def test_cli_profile_default_path(tmp_path, monkeypatch):
+    """Test that a bare --profile before the command uses the default path."""
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(main, ["--profile", "greet"])
+    assert result.exit_code == 0
+    assert (tmp_path / DEFAULT_PATH).exists()
+
+
+def test_cli_profile_sort(tmp_path, monkeypatch):
+    """Test that --profile-sort prints a summary."""
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(main, ["--profile-sort", "cumulative", "greet"])
+    assert result.exit_code == 0
+    assert "function calls" in result.output
+    assert runner.invoke(main, ["--profile-sort", "bogus", "greet"]).exit_code != 0
+
+
+def test_cli_serve(monkeypatch):
+    """Test that serve starts the server on the requested address."""
+    calls = []
+    monkeypatch.setattr(server, "serve", lambda host, port: calls.append((host, port)))
+    assert runner.invoke(main, ["serve"]).exit_code == 0
+    result = runner.invoke(main, ["serve", "--host", "localhost", "--port", "0"])
+    assert result.exit_code == 0
+    assert calls == [(server.DEFAULT_HOST, server.DEFAULT_PORT), ("localhost", 0)]
+    assert runner.invoke(main, ["serve", "--port", "70000"]).exit_code != 0
+
 {%- elif cookiecutter.command_line_interface == "argparse" %}
 
+import pstats
 import sys
 from unittest.mock import patch
 
+import pytest
+
+from {{ cookiecutter.project_slug.replace('-', '_') }} import server
 from {{ cookiecutter.project_slug.replace('-', '_') }}.cli import create_parser, main
+from {{ cookiecutter.project_slug.replace('-', '_') }}.profiling import DEFAULT_PATH
 
 def test_parser_creation():
     """Test parser creation."""
@@ -91,6 +262,93 @@ def test_greet_default(capsys):
         main()
     captured = capsys.readouterr()
     assert "Hello, World!" in captured.out
+
+
+def test_greet_input(capsys, tmp_path):
+    """Test greeting each line of a file."""
+    path = tmp_path / "names.txt"
+    path.write_text("Alice\nBob\n")
+    argv = ['{{ cookiecutter.project_slug }}', 'greet', '--input', str(path)]
+    with patch.object(sys, 'argv', argv), pytest.raises(SystemExit) as excinfo:
+        main()
+    assert excinfo.value.code == 0
+    assert capsys.readouterr().out == "Hello, Alice!\nHello, Bob!\n"
+
+
+def test_greet_format(capsys, tmp_path):
+    """Test structured output for one name and for each line of a file."""
+    argv = ['{{ cookiecutter.project_slug }}', 'greet', 'Ada', '--format', 'jsonl']
+    with patch.object(sys, 'argv', argv):
+        main()
+    assert capsys.readouterr().out == '{"name":"Ada","greeting":"Hello, Ada!"}\n'
+    path = tmp_path / "names.txt"
+    path.write_text("Alice\nBob\n")
+    argv = ['{{ cookiecutter.project_slug }}', 'greet', '-i', str(path), '-f', 'tsv']
+    with patch.object(sys, 'argv', argv), pytest.raises(SystemExit) as excinfo:
+        main()
+    assert excinfo.value.code == 0
+    expected = "name\tgreeting\nAlice\tHello, Alice!\nBob\tHello, Bob!\n"
+    assert capsys.readouterr().out == expected
+
+
+def test_greet_input_errors(capsys, tmp_path):
+    """Test that a missing file, an extra name or bad --jobs is a usage error."""
+    path = tmp_path / "names.txt"
+    path.write_text("Alice\n")
+    invalid = [
+        ['--input', str(tmp_path / "missing")],
+        ['Bob', '--input', str(path)],
+        ['--input', str(path), '--jobs', '-1'],
+        ['--format', 'xml'],
+    ]
+    for args in invalid:
+        argv = ['{{ cookiecutter.project_slug }}', 'greet', *args]
+        with patch.object(sys, 'argv', argv), pytest.raises(SystemExit) as excinfo:
+            main()
+        assert excinfo.value.code == 2
+    assert capsys.readouterr().out == ""
+
+
+def test_profile(capsys, tmp_path):
+    """Test that --profile writes pstats and collapsed stacks."""
+    path = tmp_path / "greet.pstats"
+    argv = ['{{ cookiecutter.project_slug }}', f'--profile={path}', 'greet', 'Python']
+    with patch.object(sys, 'argv', argv):
+        main()
+    assert "Hello, Python!" in capsys.readouterr().out
+    assert pstats.Stats(str(path)).total_calls > 0
+    assert "greet" in path.with_suffix(".collapsed").read_text()
+
+
+def test_profile_default_path(tmp_path, monkeypatch):
+    """Test that a bare --profile before the command uses the default path."""
+    monkeypatch.chdir(tmp_path)
+    with patch.object(sys, 'argv', ['{{ cookiecutter.project_slug }}', '--profile', 'greet']):
+        main()
+    assert (tmp_path / DEFAULT_PATH).exists()
+
+
+def test_profile_sort(capsys, tmp_path, monkeypatch):
+    """Test that --profile-sort prints a summary to stderr."""
+    monkeypatch.chdir(tmp_path)
+    argv = ['{{ cookiecutter.project_slug }}', '--profile-sort', 'cumulative', 'greet']
+    with patch.object(sys, 'argv', argv):
+        main()
+    assert "function calls" in capsys.readouterr().err
+
+
+def test_serve(monkeypatch):
+    """Test that serve starts the server on the requested address."""
+    calls = []
+    monkeypatch.setattr(server, "serve", lambda host, port: calls.append((host, port)))
+    for args in [[], ['--host', 'localhost', '--port', '0']]:
+        with patch.object(sys, 'argv', ['{{ cookiecutter.project_slug }}', 'serve', *args]):
+            main()
+    assert calls == [(server.DEFAULT_HOST, server.DEFAULT_PORT), ("localhost", 0)]
+    argv = ['{{ cookiecutter.project_slug }}', 'serve', '--port', '70000']
+    with patch.object(sys, 'argv', argv), pytest.raises(SystemExit) as excinfo:
+        main()
+    assert excinfo.value.code == 2
 {%- endif %}
 
 {%- elif cookiecutter.command_line_interface != "none" %}
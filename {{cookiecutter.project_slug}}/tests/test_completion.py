@@ -0,0 +1,116 @@
+"""Tests for the static shell completion scripts."""
+{%- if cookiecutter.use_pytest == "y" %}
+
+import shutil
+import subprocess
+
+import pytest
+
+from {{ cookiecutter.project_slug.replace('-', '_') }} import completion
+from {{ cookiecutter.project_slug.replace('-', '_') }}.formats import FORMATS
+from {{ cookiecutter.project_slug.replace('-', '_') }}.profiling import SORT_KEYS
+
+BASH = shutil.which("bash")
+
+
+def options(spec):
+    """Return the options of ``spec`` by flag."""
+    return {flag: option for option in spec.options for flag in option.flags}
+
+
+def complete_bash(words):
+    """Return bash's completions of the last of ``words``.
+
+    PATH is empty, so the script can only use shell builtins: it cannot
+    start the program or Python.
+    """
+    script = completion.bash_script(completion.describe())
+    function = completion._function_name(completion.PROG)
+    code = (
+        script
+        + 'COMP_WORDS=("$@"); COMP_CWORD=$(($# - 1)); '
+        + function
+        + '; printf "%s\\n" "${COMPREPLY[@]}"'
+    )
+    result = subprocess.run(
+        [BASH, "--norc", "--noprofile", "-c", code, "bash", completion.PROG, *words],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PATH": ""},
+    )
+    return result.stdout.split()
+
+
+def test_describe_reads_cli_definition():
+    """Test that the command tree matches the CLI."""
+    spec = completion.describe()
+    commands = {command.name: command for command in spec.commands}
+    assert spec.name == completion.PROG
+    assert list(commands) == ["greet", "serve"]
+    assert options(spec)["--profile-sort"].choices == SORT_KEYS
+    # The path can only be attached with "="
+    assert not options(spec)["--profile"].takes_value
+    assert not options(spec)["--version"].takes_value
+    assert "--help" in options(commands["serve"])
+
+    greet = options(commands["greet"])
+    assert greet["--format"].choices == FORMATS
+    assert greet["--input"].files
+    assert greet["--jobs"].takes_value
+    assert not greet["--jobs"].files
+    assert not greet["--jobs"].choices
+
+
+@pytest.mark.skipif(BASH is None, reason="bash is not installed")
+@pytest.mark.parametrize(
+    ("words", "expected"),
+    [
+        (["gr"], ["greet"]),
+        (["greet", "--fo"], ["--format"]),
+        (["greet", "--format", ""], list(FORMATS)),
+        (["greet", "--format", "=", "j"], ["jsonl"]),
+        (["--profile-sort", "cu"], ["cumulative"]),
+        (["--profile", "se"], ["serve"]),
+        (["serve", "--port", ""], []),
+    ],
+)
+def test_bash_completes_without_python(words, expected):
+    """Test that bash completes commands, options and choices."""
+    assert complete_bash(words) == expected
+
+
+@pytest.mark.skipif(BASH is None, reason="bash is not installed")
+def test_bash_completes_files(tmp_path):
+    """Test that file options complete file names."""
+    (tmp_path / "names.txt").touch()
+    prefix = str(tmp_path / "na")
+    assert complete_bash(["greet", "--input", prefix]) == [str(tmp_path / "names.txt")]
+
+
+@pytest.mark.parametrize(
+    ("shell", "command"),
+    [("bash", ["bash", "-n"]), ("zsh", ["zsh", "-n"]), ("fish", ["fish", "-n"])],
+)
+def test_script_syntax(tmp_path, shell, command):
+    """Test that each script parses in its shell."""
+    if shutil.which(command[0]) is None:
+        pytest.skip(f"{shell} is not installed")
+    render, _ = completion.SCRIPTS[shell]
+    path = tmp_path / shell
+    path.write_text(render(completion.describe()), encoding="utf-8")
+    subprocess.run([*command, str(path)], check=True)
+
+
+def test_main_writes_every_script(tmp_path, capsys):
+    """Test that --output writes one script per shell, named for its directory."""
+    completion.main(["--output", str(tmp_path)])
+    zsh = (tmp_path / "zsh" / f"_{completion.PROG}").read_text()
+    assert zsh.startswith(f"#compdef {completion.PROG}\n")
+    assert (tmp_path / "bash" / completion.PROG).is_file()
+    assert (tmp_path / "fish" / f"{completion.PROG}.fish").is_file()
+    capsys.readouterr()
+
+    completion.main(["fish"])
+    assert "-x -a 'text jsonl csv tsv'" in capsys.readouterr().out
+{%- endif %}
@@ -1,12 +1,31 @@
 """Tests for {{ cookiecutter.project_slug }} core functionality."""
 {%- if cookiecutter.use_pytest == "y" %}
 
+import ctypes
+import io
+import mmap
+import sys
+from array import array
+
 import pytest
 
+from {{ cookiecutter.project_slug.replace('-', '_') }} import core
 from {{ cookiecutter.project_slug.replace('-', '_') }}.core import (
     {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }},
+    {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}Collection,
+    add_many,
     add_numbers,
+    greet_lines,
+    greetings_nbytes,
     hello_world,
+    hello_world_many,
+    iter_buffer_chunks,
+    iter_line_blocks,
+    iter_line_chunks,
+    parallel_map,
+    shutdown_pool,
+    write_greetings,
+    write_greetings_into,
 )
 
 
@@ -72,9 +91,452 @@ class TestMainClass:
         assert "TestRepr" in repr_str
         assert instance.__class__.__name__ in repr_str
 
+    def test_slots(self):
+        """Test that instances carry no per-instance __dict__."""
+        instance = {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}("Slots")
+        assert not hasattr(instance, "__dict__")
+        with pytest.raises(AttributeError):
+            instance.other = "value"
+
+
+class TestCollection:
+    """Test the columnar collection of names."""
+
+    def test_len_and_indexing(self):
+        """Test length, positive and negative indexing."""
+        people = {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}Collection(["Alice", "Bob", "Carol"])
+        assert len(people) == 3
+        assert people.name_at(0) == "Alice"
+        assert people.name_at(-1) == "Carol"
+        assert people[1].greet() == "Hello, Bob!"
+
+    def test_index_out_of_range(self):
+        """Test that out-of-range indices raise IndexError."""
+        people = {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}Collection(["Alice"])
+        with pytest.raises(IndexError):
+            people.name_at(1)
+        with pytest.raises(IndexError):
+            people.name_at(-2)
+
+    def test_append_and_extend(self, monkeypatch):
+        """Test growing the collection across several extend blocks."""
+        monkeypatch.setattr(core, "_CHUNK_SIZE", 3)
+        people = {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}Collection()
+        people.append("first")
+        people.extend(f"user{i}" for i in range(7))
+        assert len(people) == 8
+        assert list(people.names()) == ["first"] + [f"user{i}" for i in range(7)]
+
+    @pytest.mark.parametrize(
+        "names",
+        [["Alice", "Bob"], ["José", "李小明", ""], []],
+    )
+    def test_greet_all(self, names):
+        """Test that bulk greetings match per-instance greetings."""
+        people = {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}Collection(names)
+        assert list(people.greet_all()) == [{{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}(n).greet() for n in names]
+        assert [p.name for p in people] == names
+
+    @pytest.mark.parametrize("first", ["x", "é"])
+    def test_append_while_iterating(self, first):
+        """Test that a running names() generator does not block append."""
+        people = {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}Collection([first, "z"])
+        names = people.names()
+        assert next(names) == first
+        people.append("y")
+        assert list(names) == ["z"]
+        greetings = people.greet_all()
+        next(greetings)
+        people.append("w")
+        assert len(people) == 4
+
+    def test_nbytes(self):
+        """Test that the reported size covers the buffer and the index."""
+        people = {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}Collection(["ab", "é"])
+        assert people.nbytes == len("abé".encode()) + 3 * 8
+
+
+class TestBatchGreetings:
+    """Test the batch and streaming greeting API."""
+
+    def test_hello_world_many_matches_hello_world(self):
+        """Test that batch greetings match the per-item function."""
+        names = ["Alice", "Bob", "", "123"]
+        assert list(hello_world_many(names)) == [hello_world(n) for n in names]
+
+    def test_hello_world_many_is_lazy(self):
+        """Test that names are consumed only as greetings are requested."""
+        consumed = []
+
+        def names():
+            for name in ["Alice", "Bob"]:
+                consumed.append(name)
+                yield name
+
+        greetings = hello_world_many(names())
+        assert consumed == []
+        assert next(greetings) == "Hello, Alice!"
+        assert consumed == ["Alice"]
+
+    def test_write_greetings_text(self):
+        """Test writing greetings to a text sink."""
+        sink = io.StringIO()
+        assert write_greetings(["Alice", "Bob"], sink) == 2
+        assert sink.getvalue() == "Hello, Alice!\nHello, Bob!\n"
+
+    def test_write_greetings_binary(self):
+        """Test writing greetings to a binary sink."""
+        sink = io.BytesIO()
+        assert write_greetings(["José"], sink) == 1
+        assert sink.getvalue() == "Hello, José!\n".encode()
+
+    def test_write_greetings_chunks(self):
+        """Test that greetings are written in blocks of chunk_size lines."""
+        writes = []
+
+        class Sink(io.StringIO):
+            def write(self, text):
+                writes.append(text)
+                return super().write(text)
+
+        names = [f"user{i}" for i in range(10)]
+        assert write_greetings(names, Sink(), chunk_size=4) == 10
+        assert [block.count("\n") for block in writes] == [4, 4, 2]
+
+    def test_write_greetings_empty(self):
+        """Test that an empty input writes nothing."""
+        sink = io.StringIO()
+        assert write_greetings([], sink) == 0
+        assert sink.getvalue() == ""
+
+    def test_write_greetings_invalid_chunk_size(self):
+        """Test that a non-positive chunk size is rejected."""
+        with pytest.raises(ValueError):
+            write_greetings(["Alice"], io.StringIO(), chunk_size=0)
+
+    @pytest.mark.parametrize("read_size", [1, 2, 3, 7, 1 << 20])
+    def test_greet_lines(self, read_size):
+        """Test that lines split across reads are greeted whole."""
+        source = io.BytesIO("Alice\r\nBob\n\nJosé".encode())
+        sink = io.BytesIO()
+        assert greet_lines(source, sink, read_size=read_size) == 4
+        expected = "Hello, Alice!\nHello, Bob!\nHello, !\nHello, José!\n"
+        assert sink.getvalue() == expected.encode()
+
+    def test_greet_lines_matches_write_greetings(self):
+        """Test that both batch writers produce the same output."""
+        names = [f"user{i}" for i in range(1000)]
+        expected = io.BytesIO()
+        write_greetings(names, expected)
+        sink = io.BytesIO()
+        source = io.BytesIO("".join(f"{name}\n" for name in names).encode())
+        assert greet_lines(source, sink, read_size=100) == 1000
+        assert sink.getvalue() == expected.getvalue()
+
+    def test_greet_lines_empty(self):
+        """Test that an empty input writes nothing."""
+        sink = io.BytesIO()
+        assert greet_lines(io.BytesIO(), sink) == 0
+        assert sink.getvalue() == b""
+
+    @pytest.mark.parametrize("read_size", [1, 2, 5, 1 << 20])
+    def test_iter_line_blocks(self, read_size):
+        """Test that blocks hold whole lines without endings, in order."""
+        source = io.BytesIO(b"Alice\r\nBob\n\nlast\r")
+        blocks = list(iter_line_blocks(source, read_size=read_size))
+        assert all(blocks)
+        assert [line for block in blocks for line in block] == [
+            b"Alice",
+            b"Bob",
+            b"",
+            b"last",
+        ]
+
+    @pytest.mark.parametrize("read_size", [1, 2, 5, 1 << 20])
+    @pytest.mark.parametrize(
+        "content",
+        [b"Alice\r\nBob\n\nlast\r", b"\n\n", b"one", b"x\r\n" * 5000],
+        ids=["mixed", "empty-lines", "unterminated", "many"],
+    )
+    def test_mapped_file_matches_stream(self, tmp_path, content, read_size):
+        """Test that a memory-mapped file yields the same lines as a stream."""
+        path = tmp_path / "names.txt"
+        path.write_bytes(content)
+        expected = list(iter_line_chunks(io.BytesIO(content), read_size=read_size))
+        with path.open("rb") as source:
+            chunks = list(iter_line_chunks(source, read_size=read_size))
+            assert source.tell() == len(content)
+        assert b"".join(chunks) == b"".join(expected)
+        assert all(chunk.endswith(b"\n") for chunk in chunks)
+
+    def test_mapped_file_from_position(self, tmp_path):
+        """Test that a mapped file is read from its current position on."""
+        path = tmp_path / "names.txt"
+        path.write_bytes(b"header\nAlice\nBob\n")
+        sink = io.BytesIO()
+        with path.open("rb") as source:
+            source.readline()
+            assert greet_lines(source, sink) == 2
+        assert sink.getvalue() == b"Hello, Alice!\nHello, Bob!\n"
+
+    def test_empty_file(self, tmp_path):
+        """Test that an empty file, which cannot be mapped, has no lines."""
+        path = tmp_path / "names.txt"
+        path.write_bytes(b"")
+        with path.open("rb") as source:
+            assert list(iter_line_chunks(source)) == []
+
+    @pytest.mark.parametrize(
+        ("start", "stop", "expected"),
+        [
+            (0, None, [b"Alice\nBob\n", b"Cy\n"]),
+            (0, 1, [b"Alice\n"]),
+            (0, 6, [b"Alice\n"]),
+            (0, 7, [b"Alice\nBob\n"]),
+            (6, 10, [b"Bob\n"]),
+            (10, 99, [b"Cy\n"]),
+            (12, None, []),
+        ],
+    )
+    def test_iter_buffer_chunks(self, start, stop, expected):
+        """Test that the lines starting in a range are yielded whole."""
+        buffer = b"Alice\nBob\nCy"
+        assert list(iter_buffer_chunks(buffer, start, stop, chunk_size=8)) == expected
+
+    def test_greet_lines_invalid_read_size(self):
+        """Test that a non-positive read size is rejected."""
+        with pytest.raises(ValueError):
+            greet_lines(io.BytesIO(b"Alice"), io.BytesIO(), read_size=0)
+
+
+class TestWriteGreetingsInto:
+    """Test encoding greetings directly into writable buffers."""
+
+    @pytest.mark.parametrize("names", [["Alice", "Bob"], ["José", "李小明", ""], []])
+    def test_layout_and_offsets(self, names):
+        """Test that offsets delimit each encoded greeting."""
+        buffer = bytearray(greetings_nbytes(names))
+        offsets = write_greetings_into(names, buffer)
+        assert offsets[-1] == len(buffer)
+        greetings = [
+            bytes(buffer[start:stop]).decode()
+            for start, stop in zip(offsets, offsets[1:])
+        ]
+        assert greetings == [hello_world(n) + "\n" for n in names]
+
+    def test_offset_and_terminator(self):
+        """Test writing C strings after a header at a given offset."""
+        buffer = bytearray(b"HDR") + bytearray(greetings_nbytes(["a"], terminator="\0"))
+        offsets = write_greetings_into(["a"], buffer, 3, terminator="\0")
+        assert offsets.tolist() == [3, 13]
+        assert bytes(buffer) == b"HDRHello, a!\0"
+
+    def test_blocks(self, monkeypatch):
+        """Test offsets across several encoding blocks."""
+        monkeypatch.setattr(core, "_GREETINGS_PER_WRITE", 3)
+        names = [f"user{i}" for i in range(10)] + ["é"]
+        buffer = bytearray(greetings_nbytes(names))
+        offsets = write_greetings_into(names, buffer)
+        assert len(offsets) == len(names) + 1
+        assert bytes(buffer[offsets[-2] : offsets[-1]]) == "Hello, é!\n".encode()
+
+    def test_memoryview_and_mmap(self):
+        """Test memoryview and anonymous mmap targets."""
+        size = greetings_nbytes(["Alice"])
+        storage = bytearray(size)
+        write_greetings_into(["Alice"], memoryview(storage))
+        assert storage == b"Hello, Alice!\n"
+        with mmap.mmap(-1, size) as target:
+            write_greetings_into(["Alice"], target)
+            assert target[:] == b"Hello, Alice!\n"
+
+    def test_buffer_too_small(self):
+        """Test that overflowing the buffer is rejected."""
+        with pytest.raises(ValueError):
+            write_greetings_into(["Alice"], bytearray(5))
+        with pytest.raises(ValueError):
+            write_greetings_into(["Alice"], bytearray(100), offset=101)
+
+    def test_read_only_buffer(self):
+        """Test that read-only buffers are rejected."""
+        with pytest.raises(TypeError):
+            write_greetings_into(["Alice"], b"\0" * 100)
+
+
+class TestAddMany:
+    """Test add_many with and without NumPy."""
+
+    @pytest.fixture(autouse=True, params=["numpy", "python"])
+    def backend(self, request, monkeypatch):
+        """Run each test with NumPy and with the pure-Python fallback."""
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(core, "_load_numpy", lambda: None)
+        return request.param
+
+    def test_array_inputs(self):
+        """Test element-wise addition of array.array operands."""
+        result = add_many(array("d", [1, 2, 3]), array("d", [10, 20, 30]))
+        assert list(result) == [11.0, 22.0, 33.0]
+
+    def test_memoryview_inputs(self):
+        """Test element-wise addition of memoryview operands."""
+        a = memoryview(array("d", [1.5, 2.5]))
+        b = memoryview(array("d", [0.5, 0.5]))
+        assert list(add_many(a, b)) == [2.0, 3.0]
+
+    def test_broadcasting(self):
+        """Test that scalars and length-1 operands are broadcast."""
+        values = array("d", [1, 2, 3])
+        assert list(add_many(values, 1)) == [2.0, 3.0, 4.0]
+        assert list(add_many(array("d", [5]), values)) == [6.0, 7.0, 8.0]
+
+    def test_out_buffer(self):
+        """Test that results are written into the given buffer."""
+        out = array("d", [0, 0, 0])
+        result = add_many(array("d", [1, 2, 3]), array("d", [1, 1, 1]), out=out)
+        assert result is out
+        assert list(out) == [2.0, 3.0, 4.0]
+
+    def test_out_memoryview(self):
+        """Test writing into a memoryview over an existing buffer."""
+        storage = array("d", [0, 0])
+        add_many(array("d", [1, 2]), 1, out=memoryview(storage))
+        assert list(storage) == [2.0, 3.0]
+
+    def test_out_ctypes_array(self):
+        """Test writing into a buffer whose format has a byte-order prefix."""
+        out = (ctypes.c_double * 2)()
+        add_many(array("d", [1, 2]), array("d", [3, 4]), out=memoryview(out))
+        assert list(out) == [4.0, 6.0]
+
+    def test_scalars(self):
+        """Test that two scalars give a one-element array with either backend."""
+        result = add_many(1.0, 2.0)
+        assert len(result) == 1
+        assert list(result) == [3.0]
+
+    def test_out_list_rejected(self):
+        """Test that a list out, which NumPy would copy, is rejected."""
+        out = [0] * 3
+        with pytest.raises(TypeError, match="list"):
+            add_many(array("d", [1, 2, 3]), 1, out=out)
+        assert out == [0, 0, 0]
+
+    def test_out_foreign_byte_order(self, backend):
+        """Test that the fallback rejects items array cannot hold."""
+        if backend == "numpy":
+            pytest.skip("NumPy converts the byte order itself")
+        swapped = "__ctype_be__" if sys.byteorder == "little" else "__ctype_le__"
+        out = (getattr(ctypes.c_double, swapped) * 2)()
+        with pytest.raises(TypeError, match="format"):
+            add_many(array("d", [1, 2]), 1, out=memoryview(out))
+
+    def test_mismatched_lengths(self):
+        """Test that operands of incompatible lengths are rejected."""
+        with pytest.raises(ValueError):
+            add_many(array("d", [1, 2]), array("d", [1, 2, 3]))
+
+    def test_chunk_boundaries(self, monkeypatch):
+        """Test inputs spanning several fallback chunks."""
+        monkeypatch.setattr(core, "_CHUNK_SIZE", 4)
+        values = array("d", range(10))
+        assert list(add_many(values, values)) == [2.0 * i for i in range(10)]
+
+
+def interrupt(_item):
+    """Simulate Ctrl+C arriving while a worker runs (picklable by name)."""
+    raise KeyboardInterrupt
+
+
+@pytest.fixture(scope="module")
+def warm_pool():
+    """Stop the parallel_map worker pool once the module is done."""
+    yield
+    shutdown_pool()
+
+
+@pytest.mark.usefixtures("warm_pool")
+class TestParallelMap:
+    """Test the process-pool parallel map."""
+
+    @pytest.mark.parametrize("chunksize", ["auto", 1, 7])
+    def test_ordered(self, chunksize):
+        """Test that results match map() in input order."""
+        names = [f"user{i}" for i in range(100)]
+        result = parallel_map(hello_world, names, workers=2, chunksize=chunksize)
+        assert list(result) == [hello_world(n) for n in names]
+
+    def test_unordered(self):
+        """Test that unordered results contain every result exactly once."""
+        names = (f"user{i}" for i in range(1000))
+        result = parallel_map(hello_world, names, workers=2, ordered=False)
+        assert sorted(result) == sorted(hello_world(f"user{i}") for i in range(1000))
+
+    def test_auto_chunks(self):
+        """Test chunk sizing for sized inputs and for plain iterators."""
+        sized = [len(chunk) for chunk in core._iter_chunks(range(100), "auto", 5)]
+        assert sized == [5] * 20
+        unsized = [
+            len(chunk) for chunk in core._iter_chunks(iter(range(500)), "auto", 5)
+        ]
+        assert unsized == [64, 128, 256, 52]
+
+    def test_warm_pool_reused(self):
+        """Test that consecutive calls share the same worker pool."""
+        list(parallel_map(len, ["a"], workers=2))
+        executor = core._WARM_POOL.get(2)
+        list(parallel_map(len, ["b"], workers=2))
+        assert core._WARM_POOL.get(2) is executor
+
+    def test_function_error(self):
+        """Test that errors from func propagate and keep the pool."""
+        executor = core._WARM_POOL.get(2)
+        with pytest.raises(TypeError):
+            list(parallel_map(len, [1], workers=2))
+        assert core._WARM_POOL.get(2) is executor
+
+    def test_keyboard_interrupt(self):
+        """Test that an interrupt discards the pool and the next call works."""
+        executor = core._WARM_POOL.get(2)
+        with pytest.raises(KeyboardInterrupt):
+            list(parallel_map(interrupt, range(10), workers=2))
+        assert core._WARM_POOL.get(2) is not executor
+        assert list(parallel_map(hello_world, ["Bob"], workers=2)) == ["Hello, Bob!"]
+
+    def test_interrupt_kills_workers(self):
+        """Test that the workers of an interrupted call really exit."""
+        executor = core._WARM_POOL.get(2)
+        list(parallel_map(hello_world, ["Alice", "Bob"], workers=2, chunksize=1))
+        workers = list(executor._processes.values())
+        assert workers
+        with pytest.raises(KeyboardInterrupt):
+            list(parallel_map(interrupt, range(10), workers=2))
+        for process in workers:
+            process.join(timeout=10)
+            assert process.exitcode is not None
+
+    def test_interleaved_worker_counts(self):
+        """Test that a call with other workers leaves a running call's pool alone."""
+        names = [f"user{i}" for i in range(200)]
+        first = parallel_map(hello_world, iter(names), workers=2, chunksize=1)
+        assert next(first) == "Hello, user0!"
+        assert list(parallel_map(hello_world, ["x"], workers=3)) == ["Hello, x!"]
+        assert list(first) == [hello_world(name) for name in names[1:]]
+
+    @pytest.mark.parametrize("kwargs", [{"workers": 0}, {"chunksize": 0}])
+    def test_invalid_arguments(self, kwargs):
+        """Test that non-positive workers and chunk sizes are rejected."""
+        with pytest.raises(ValueError):
+            parallel_map(hello_world, ["Alice"], **kwargs)
+
 {%- else %}
 
+from array import array
+
 from {{ cookiecutter.project_slug.replace('-', '_') }}.core import (
+    add_many,
     add_numbers,
     hello_world,
     {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }},
@@ -93,6 +555,11 @@ def test_add_numbers():
     assert add_numbers(1.5, 2.5) == 4.0
 
 
+def test_add_many():
+    """Test add_many function."""
+    assert list(add_many(array("d", [1, 2]), array("d", [3, 4]))) == [4.0, 6.0]
+
+
 def test_main_class():
     """Test the main class."""
     instance = {{ cookiecutter.project_slug.replace('-', '_').replace('_', ' ').title().replace(' ', '') }}("Test")
@@ -103,6 +570,7 @@ def test_main_class():
 if __name__ == "__main__":
     test_hello_world()
     test_add_numbers()
+    test_add_many()
     test_main_class()
     print("All tests passed!")
 {%- endif %}
@@ -0,0 +1,84 @@
+"""Tests for the console script fast path."""
+{%- if cookiecutter.use_pytest == "y" %}
+
+import subprocess
+import sys
+
+import pytest
+
+from {{ cookiecutter.project_slug.replace('-', '_') }} import dispatch
+
+PACKAGE = "{{ cookiecutter.project_slug.replace('-', '_') }}"
+# Module the full CLI is built on
+FRAMEWORK = "{{ cookiecutter.command_line_interface }}"
+TRIVIAL = [["--version"], ["greet"], ["greet", "Ada"]]
+
+
+def run(module, *args):
+    """Run ``python -m module *args`` and return its standard output."""
+    result = subprocess.run(
+        [sys.executable, "-m", module, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def run_code(code):
+    """Run ``code`` in a fresh interpreter and return its standard output."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+@pytest.mark.parametrize("args", TRIVIAL)
+def test_fast_path_matches_cli(args):
+    """Test that the fast path prints exactly what the full CLI prints."""
+    assert run(f"{PACKAGE}.dispatch", *args) == run(f"{PACKAGE}.cli", *args)
+
+
+@pytest.mark.parametrize("args", [*TRIVIAL, ["greet", "Ada", "--format", "csv"]])
+def test_python_m_runs_cli(args):
+    """Test that ``python -m`` on the package runs the CLI."""
+    assert run(PACKAGE, *args) == run(f"{PACKAGE}.cli", *args)
+
+
+@pytest.mark.parametrize("args", TRIVIAL)
+def test_fast_path_skips_cli_import(args):
+    """Test that trivial invocations import neither the CLI nor its framework."""
+    code = (
+        "import sys\n"
+        f"sys.argv = ['prog', *{args!r}]\n"
+        f"from {PACKAGE}.dispatch import main\n"
+        "main()\n"
+        f"print({FRAMEWORK!r} in sys.modules, '{PACKAGE}.cli' in sys.modules)\n"
+    )
+    assert run_code(code).splitlines()[-1] == "False False"
+
+
+@pytest.mark.parametrize(
+    "args", [[], ["--help"], ["greet", "--help"], ["greet", "Ada", "Bob"], ["other"]]
+)
+def test_other_invocations_are_deferred(args, capsys):
+    """Test that anything but a trivial invocation is left to the CLI."""
+    assert not dispatch.fast_path(args)
+    assert capsys.readouterr().out == ""
+
+
+def test_main_greets(capsys, monkeypatch):
+    """Test the fast path in-process."""
+    monkeypatch.setattr(sys, "argv", ["prog", "greet", "Ada"])
+    dispatch.main()
+    assert capsys.readouterr().out == "Hello, Ada!\n"
+
+
+def test_main_falls_back_to_cli(capsys, monkeypatch):
+    """Test that main() runs the full CLI for other invocations."""
+    monkeypatch.setattr(sys, "argv", ["prog", "greet", "--help"])
+    with pytest.raises(SystemExit) as excinfo:
+        dispatch.main()
+    assert excinfo.value.code == 0
+    assert "greet" in capsys.readouterr().out.lower()
+{%- endif %}
@@ -0,0 +1,81 @@
+"""Tests for the greet command output formats."""
+{%- if cookiecutter.use_pytest == "y" %}
+
+import csv
+import io
+import json
+
+import pytest
+
+from {{ cookiecutter.project_slug.replace('-', '_') }}.core import hello_world
+from {{ cookiecutter.project_slug.replace('-', '_') }}.formats import FIELDS, FORMATS, format_records, write_records
+
+# Names with each format's special characters
+NAMES = ["Alice", "Smith, Jo", 'Say "hi"', "tab\there", "José", ""]
+RECORDS = [(name, hello_world(name)) for name in NAMES]
+
+
+def parse(text, fmt):
+    """Parse ``text`` in a structured format back into records."""
+    if fmt == "jsonl":
+        return [(r["name"], r["greeting"]) for r in map(json.loads, text.splitlines())]
+    delimiter = "," if fmt == "csv" else "\t"
+    rows = list(csv.reader(io.StringIO(text, newline=""), delimiter=delimiter))
+    assert tuple(rows[0]) == FIELDS
+    return [tuple(row) for row in rows[1:]]
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "csv", "tsv"])
+@pytest.mark.parametrize(
+    "names", [NAMES, ["Alice", "Bob"], ["Smith, Jo"], ["two\nlines"], ["cr\r"]]
+)
+def test_structured_formats_round_trip(fmt, names):
+    """Test that standard parsers read back every record unchanged."""
+    records = [(name, hello_world(name)) for name in names]
+    assert parse(format_records(records, fmt), fmt) == records
+
+
+def test_text_format():
+    """Test that text is the bare greetings, as printed without --format."""
+    assert format_records(RECORDS[:2], "text") == "Hello, Alice!\nHello, Smith, Jo!\n"
+
+
+def test_jsonl_is_ascii():
+    """Test that JSON lines escape non-ASCII characters."""
+    assert format_records([("José", "Hello, José!")], "jsonl") == (
+        '{"name":"Jos\\u00e9","greeting":"Hello, Jos\\u00e9!"}\n'
+    )
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+@pytest.mark.parametrize("read_size", [1, 7, 1 << 20])
+def test_write_records_streams_blocks(fmt, read_size):
+    """Test that encoding block by block matches encoding everything at once."""
+    content = "".join(f"{name}\n" for name in NAMES).encode()
+    sink = io.BytesIO()
+    count = write_records(io.BytesIO(content), sink, fmt, read_size=read_size)
+    assert count == len(NAMES)
+    assert sink.getvalue() == format_records(RECORDS, fmt).encode()
+
+
+@pytest.mark.parametrize("fmt", ["csv", "tsv"])
+def test_header_written_once(fmt):
+    """Test the header row is optional and never repeated."""
+    content = b"Alice\nBob\n"
+    sink = io.BytesIO()
+    write_records(io.BytesIO(content), sink, fmt, read_size=1)
+    assert sink.getvalue().count(b"name") == 1
+    sink = io.BytesIO()
+    write_records(io.BytesIO(content), sink, fmt, with_header=False)
+    assert b"name" not in sink.getvalue()
+
+
+def test_undecodable_bytes():
+    """Test that invalid UTF-8 passes through csv and is escaped in JSON."""
+    sink = io.BytesIO()
+    write_records(io.BytesIO(b"\xff\n"), sink, "csv", with_header=False)
+    assert sink.getvalue() == b'\xff,"Hello, \xff!"\n'
+    sink = io.BytesIO()
+    write_records(io.BytesIO(b"\xff\n"), sink, "jsonl")
+    assert json.loads(sink.getvalue())["name"] == "\udcff"
+{%- endif %}
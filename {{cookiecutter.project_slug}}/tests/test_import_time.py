@@ -0,0 +1,114 @@
+"""Import-time budget tests for {{ cookiecutter.project_slug }}.
+
+Each module is imported in a fresh interpreter under ``python -X importtime``
+and the reported self times are checked against the budgets in the
+``[tool.{{ cookiecutter.project_slug.replace('-', '_') }}.import-time]`` table of pyproject.toml.
+"""
+{%- if cookiecutter.use_pytest == "y" %}
+
+import os
+import re
+import subprocess
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+PACKAGE = "{{ cookiecutter.project_slug.replace('-', '_') }}"
+MODULES = [
+    PACKAGE,
+{%- if cookiecutter.command_line_interface != "none" %}
+    f"{PACKAGE}.cli",
+    f"{PACKAGE}.dispatch",
+{%- endif %}
+]
+PYPROJECT = Path(__file__).resolve().parents[1] / "pyproject.toml"
+# Best of several runs, so one slow run (e.g. writing .pyc files) is ignored
+RUNS = 3
+# "import time: <self us> | <cumulative us> | <indent><module>"
+LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+\d+\s+\|\s+(\S+)$", re.MULTILINE)
+
+# The budgets are wall-clock times, which workers competing for the CPU under
+# ``pytest -n auto`` inflate: run them serially, e.g. with ``pytest -n 0``
+pytestmark = [
+    pytest.mark.serial,
+    pytest.mark.skipif(
+        "PYTEST_XDIST_WORKER" in os.environ,
+        reason="import-time budgets need a serial run (pytest -n 0)",
+    ),
+]
+
+
+def load_budget():
+    """Return the import-time budget table from pyproject.toml."""
+    with PYPROJECT.open("rb") as f:
+        return tomllib.load(f)["tool"][PACKAGE]["import-time"]
+
+
+def self_times(code):
+    """Run ``code`` under -X importtime and return the self time per module (us).
+
+    Each run is a fresh interpreter; the minimum over RUNS is kept per module.
+    """
+    best = {}
+    for _ in range(RUNS):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for match in LINE.finditer(result.stderr):
+            name, micros = match.group(2), int(match.group(1))
+            best[name] = min(micros, best.get(name, micros))
+    return best
+
+
+@pytest.fixture(scope="module")
+def startup_modules():
+    """Return the modules every interpreter imports at startup (site, etc.)."""
+    return set(self_times("pass"))
+
+
+def format_ms(times):
+    """Format the largest entries of a {name: us} mapping for a failure message."""
+    ranked = sorted(times.items(), key=lambda item: item[1], reverse=True)
+    return ", ".join(f"{name}={micros / 1000:.1f}ms" for name, micros in ranked[:5])
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import_time_within_budget(module, startup_modules):
+    """Test that importing ``module`` stays within the configured budgets."""
+    budget = load_budget()
+    times = {
+        name: micros
+        for name, micros in self_times(f"import {module}").items()
+        if name not in startup_modules
+    }
+
+    total = sum(times.values())
+    assert total / 1000 <= budget["total-ms"], (
+        f"import {module} took {total / 1000:.1f}ms "
+        f"(budget {budget['total-ms']}ms); slowest: {format_ms(times)}"
+    )
+
+    # Attribute each submodule to its distribution, e.g. rich.console -> rich
+    per_package = Counter()
+    for name, micros in times.items():
+        per_package[name.partition(".")[0]] += micros
+    over = {
+        name: micros
+        for name, micros in per_package.items()
+        if micros / 1000 > budget["package-ms"]
+    }
+    assert not over, (
+        f"import {module}: packages over the {budget['package-ms']}ms "
+        f"budget: {format_ms(over)}"
+    )
+{%- endif %}
@@ -0,0 +1,95 @@
+"""Tests for {{ cookiecutter.project_slug }} lazy package attributes."""
+{%- if cookiecutter.use_pytest == "y" %}
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import {{ cookiecutter.project_slug.replace('-', '_') }}
+
+PACKAGE = "{{ cookiecutter.project_slug.replace('-', '_') }}"
+
+
+def loaded_modules(code):
+    """Run ``code`` in a fresh interpreter and return the package modules loaded."""
+    script = (
+        "import json, sys\n"
+        f"{code}\n"
+        f"print(json.dumps(sorted(m for m in sys.modules if m.split('.')[0] == {PACKAGE!r})))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def test_version_imports_no_submodule():
+    """Test that reading __version__ loads only the package itself."""
+    code = f"import {PACKAGE}; {PACKAGE}.__version__"
+    assert loaded_modules(code) == [PACKAGE]
+
+
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        ("hello_world", "core"),
+        ("cached_hello_world", "cache"),
+        ("agreet_many", "aio"),
+    ],
+)
+def test_attribute_loads_its_submodule_only(name, expected):
+    """Test that each public name imports only the submodules it needs."""
+    modules = loaded_modules(f"import {PACKAGE}; {PACKAGE}.{name}")
+    assert f"{PACKAGE}.{expected}" in modules
+    assert f"{PACKAGE}.cli" not in modules
+    if expected == "core":
+{%- if cookiecutter.use_mypyc == "y" %}
+        # A compiled core also loads its mypyc runtime library
+        modules = [m for m in modules if not m.endswith("__mypyc")]
+{%- endif %}
+        assert modules == [PACKAGE, f"{PACKAGE}.core", f"{PACKAGE}.instrumentation"]
+
+
+def test_lazy_attributes_resolve():
+    """Test that every public name resolves to the submodule's object."""
+    from {{ cookiecutter.project_slug.replace('-', '_') }} import core
+
+    assert {{ cookiecutter.project_slug.replace('-', '_') }}.hello_world is core.hello_world
+    assert {{ cookiecutter.project_slug.replace('-', '_') }}.core is core
+    for name in {{ cookiecutter.project_slug.replace('-', '_') }}.__all__:
+        assert getattr({{ cookiecutter.project_slug.replace('-', '_') }}, name) is not None
+
+
+def test_all_matches_lazy_attributes():
+    """Test that __all__ lists exactly the metadata and the lazy names."""
+    metadata = {"__version__", "__author__", "__email__"}
+    lazy = set({{ cookiecutter.project_slug.replace('-', '_') }}._LAZY_ATTRS)
+    assert set({{ cookiecutter.project_slug.replace('-', '_') }}.__all__) == lazy | metadata
+
+
+def test_dir_lists_lazy_names():
+    """Test that dir() shows names that have not been loaded yet."""
+    names = dir({{ cookiecutter.project_slug.replace('-', '_') }})
+    assert "hello_world" in names
+    assert "agreet_many" in names
+    assert "core" in names
+
+
+def test_unknown_attribute():
+    """Test that unknown names raise AttributeError."""
+    with pytest.raises(AttributeError):
+        _ = {{ cookiecutter.project_slug.replace('-', '_') }}.does_not_exist
+{%- if cookiecutter.command_line_interface == "none" %}
+
+
+def test_python_m_prints_version():
+    """Test that ``python -m`` on the package prints its version."""
+    result = subprocess.run(
+        [sys.executable, "-m", PACKAGE], capture_output=True, text=True, check=True
+    )
+    version = {{ cookiecutter.project_slug.replace('-', '_') }}.__version__
+    assert result.stdout == "{{ cookiecutter.project_name }} v" + version + "\n"
+{%- endif %}
+{%- endif %}
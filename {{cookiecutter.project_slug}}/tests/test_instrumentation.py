@@ -0,0 +1,147 @@
+"""Tests for {{ cookiecutter.project_slug }} instrumentation."""
+{%- if cookiecutter.use_pytest == "y" %}
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from {{ cookiecutter.project_slug.replace('-', '_') }} import core, instrumentation
+from {{ cookiecutter.project_slug.replace('-', '_') }}.instrumentation import Histogram, instrument, timed
+
+ENV = "{{ cookiecutter.project_slug.replace('-', '_').upper() }}_INSTRUMENT"
+
+
+@pytest.fixture(autouse=True)
+def disabled():
+    """Run every test disabled and with no recorded metrics."""
+    instrumentation.disable()
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_functions_are_raw():
+    """Test that disabled instrumentation leaves the raw function in place."""
+    assert not hasattr(core.hello_world, "__wrapped__")
+    core.hello_world("Ada")
+    assert instrumentation.snapshot() == {}
+
+
+def test_decorator_returns_function_when_disabled():
+    """Test that instrument() returns the decorated function itself."""
+
+    def func():
+        return 1
+
+    assert instrument(func) is func
+
+
+def test_enable_swaps_wrappers_in_and_out():
+    """Test that enable() and disable() rebind the module attributes."""
+    raw = core.hello_world
+    instrumentation.enable()
+    assert core.hello_world is not raw
+    assert core.hello_world.__wrapped__ is raw
+    assert core.hello_world("Ada") == "Hello, Ada!"
+    instrumentation.disable()
+    assert core.hello_world is raw
+
+
+def test_counts_and_histogram():
+    """Test that calls are counted and land in the latency buckets."""
+    instrumentation.enable()
+    for i in range(3):
+        core.add_numbers(i, 1)
+    data = instrumentation.snapshot()["core.add_numbers"]
+    assert data["count"] == 3
+    assert data["sum"] > 0
+    assert data["buckets"]["+Inf"] == 3
+    counts = list(data["buckets"].values())
+    assert counts == sorted(counts)
+
+
+def test_generator_time_covers_iteration():
+    """Test that generator functions are recorded once, when exhausted."""
+    instrumentation.enable()
+    greetings = core.hello_world_many(["Alice", "Bob"])
+    assert "core.hello_world_many" not in instrumentation.snapshot()
+    assert list(greetings) == ["Hello, Alice!", "Hello, Bob!"]
+    assert instrumentation.snapshot()["core.hello_world_many"]["count"] == 1
+
+
+def test_exceptions_are_recorded():
+    """Test that calls raising an exception are still recorded."""
+    instrumentation.enable()
+    with pytest.raises(TypeError):
+        core.add_numbers("a", 1)
+    assert instrumentation.snapshot()["core.add_numbers"]["count"] == 1
+
+
+def test_timed_block():
+    """Test that timed() records only while enabled."""
+    with timed("block"):
+        pass
+    assert instrumentation.snapshot() == {}
+    instrumentation.enable()
+    with timed("block"):
+        pass
+    assert instrumentation.snapshot()["block"]["count"] == 1
+
+
+def test_histogram_buckets():
+    """Test bucket boundaries and the overflow bucket."""
+    histogram = Histogram()
+    histogram.observe(0.000001)
+    histogram.observe(0.003)
+    histogram.observe(60)
+    buckets = histogram.snapshot()["buckets"]
+    assert buckets["1e-06"] == 1
+    assert buckets["0.005"] == 2
+    assert buckets["10.0"] == 2
+    assert buckets["+Inf"] == 3
+
+
+def test_json_export():
+    """Test that the JSON export round-trips the snapshot."""
+    instrumentation.enable()
+    core.hello_world()
+    assert json.loads(instrumentation.to_json()) == instrumentation.snapshot()
+
+
+def test_prometheus_export():
+    """Test the Prometheus text exposition format."""
+    instrumentation.enable()
+    core.hello_world()
+    text = instrumentation.to_prometheus(prefix="app")
+    assert "# TYPE app_calls_total counter" in text
+    assert 'app_calls_total{function="core.hello_world"} 1' in text
+    assert "# TYPE app_call_duration_seconds histogram" in text
+    assert (
+        'app_call_duration_seconds_bucket{function="core.hello_world",le="+Inf"} 1'
+        in text
+    )
+    assert 'app_call_duration_seconds_count{function="core.hello_world"} 1' in text
+    assert text.endswith("\n")
+
+
+@pytest.mark.parametrize("suffix", [".json", ".prom"])
+def test_environment_enables_and_writes_at_exit(tmp_path, suffix):
+    """Test that the environment variables instrument a fresh process."""
+    output = tmp_path / f"metrics{suffix}"
+    env = {**os.environ, ENV: "1", f"{ENV}_OUTPUT": str(output)}
+    code = (
+        "from {{ cookiecutter.project_slug.replace('-', '_') }} import core\n"
+        "assert hasattr(core.hello_world, '__wrapped__')\n"
+        "core.hello_world()\n"
+    )
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+    text = output.read_text()
+    if suffix == ".json":
+        assert json.loads(text)["core.hello_world"]["count"] == 1
+    else:
+        assert 'calls_total{function="core.hello_world"} 1' in text
+{%- endif %}
@@ -0,0 +1,47 @@
+"""Tests for {{ cookiecutter.project_slug }} profiling."""
+{%- if cookiecutter.use_pytest == "y" %}
+
+import pstats
+
+from {{ cookiecutter.project_slug.replace('-', '_') }}.core import hello_world_many
+from {{ cookiecutter.project_slug.replace('-', '_') }}.profiling import DEFAULT_PATH, expand_profile_flag, profiled
+
+
+def work():
+    """Do enough work to show up in the collapsed stacks."""
+    return sum(len(greeting) for greeting in hello_world_many(["Ada"] * 20_000))
+
+
+def test_expand_profile_flag():
+    """Test that only a bare --profile before -- gets the default path."""
+    args = ["--profile", "--profile=x.pstats", "greet", "--", "--profile"]
+    assert expand_profile_flag(args) == [
+        f"--profile={DEFAULT_PATH}",
+        "--profile=x.pstats",
+        "greet",
+        "--",
+        "--profile",
+    ]
+
+
+def test_profiled_is_inert_without_options(tmp_path, monkeypatch):
+    """Test that nothing is profiled or written by default."""
+    monkeypatch.chdir(tmp_path)
+    with profiled():
+        work()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profiled_writes_pstats_and_collapsed(tmp_path, capsys):
+    """Test the pstats file, the collapsed stacks and the summary."""
+    path = tmp_path / "work.pstats"
+    with profiled(str(path), "cumulative"):
+        work()
+    assert pstats.Stats(str(path)).total_calls > 0
+    lines = path.with_suffix(".collapsed").read_text().splitlines()
+    stacks = dict(line.rsplit(" ", 1) for line in lines)
+    assert all(int(micros) > 0 for micros in stacks.values())
+    assert any("work (test_profiling.py:" in stack for stack in stacks)
+    assert any(";<genexpr> (test_profiling.py:" in stack for stack in stacks)
+    assert "function calls" in capsys.readouterr().err
+{%- endif %}
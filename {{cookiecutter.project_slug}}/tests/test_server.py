@@ -0,0 +1,252 @@
+"""Tests for the {{ cookiecutter.project_slug }} HTTP/JSON server."""
+{%- if cookiecutter.use_pytest == "y" %}
+
+import asyncio
+import json
+import signal
+import subprocess
+import sys
+from http.client import HTTPConnection
+
+import pytest
+
+from {{ cookiecutter.project_slug.replace('-', '_') }} import server
+from {{ cookiecutter.project_slug.replace('-', '_') }}.server import HTTPError, Server, handle, parse_head
+
+PACKAGE = "{{ cookiecutter.project_slug.replace('-', '_') }}"
+
+
+def request(path, payload=None, headers=""):
+    """Return a raw HTTP/1.1 POST request carrying ``payload`` as JSON."""
+    body = b"" if payload is None else json.dumps(payload).encode()
+    head = f"POST {path} HTTP/1.1\r\nHost: localhost\r\n{headers}"
+    return f"{head}Content-Length: {len(body)}\r\n\r\n".encode() + body
+
+
+async def read_response(reader):
+    """Read one response and return its status, headers and JSON payload."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    status_line, *lines = head.decode().split("\r\n")[:-2]
+    headers = dict(line.split(": ", 1) for line in lines)
+    body = await reader.readexactly(int(headers["Content-Length"]))
+    return int(status_line.split()[1]), headers, json.loads(body)
+
+
+def run_with_server(scenario):
+    """Run ``scenario(server, connect)`` against a server on a free port."""
+
+    async def main():
+        async with Server(port=0) as srv:
+            return await scenario(
+                srv, lambda: asyncio.open_connection(srv.host, srv.port)
+            )
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    ("path", "body", "expected"),
+    [
+        ("/hello", b"", {"greeting": "Hello, World!"}),
+        ("/hello", b'{"name": "Ada"}', {"greeting": "Hello, Ada!"}),
+        (
+            "/greet",
+            b'{"names": ["Ada", "Bob"]}',
+            {"greetings": ["Hello, Ada!", "Hello, Bob!"]},
+        ),
+        ("/greet", b'{"names": []}', {"greetings": []}),
+        ("/add", b'{"a": 2, "b": 3.5}', {"result": 5.5}),
+    ],
+)
+def test_handle(path, body, expected):
+    """Test each endpoint."""
+    assert handle("POST", path, body) == (200, expected)
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "body", "status"),
+    [
+        ("POST", "/missing", b"", 404),
+        ("GET", "/hello", b"", 405),
+        ("POST", "/hello", b"{not json", 400),
+        ("POST", "/hello", b"\xff", 400),
+        ("POST", "/hello", b"[]", 400),
+        ("POST", "/hello", b'{"name": 1}', 400),
+        ("POST", "/greet", b"{}", 400),
+        ("POST", "/greet", b'{"names": ["Ada", 1]}', 400),
+        ("POST", "/add", b'{"a": 1}', 400),
+        ("POST", "/add", b'{"a": true, "b": 1}', 400),
+    ],
+)
+def test_handle_errors(method, path, body, status):
+    """Test that bad requests get an error status and message."""
+    code, payload = handle(method, path, body)
+    assert code == status
+    assert payload["error"]
+
+
+@pytest.mark.parametrize(
+    ("version", "header", "connection"),
+    [
+        ("HTTP/1.1", "", None),
+        ("HTTP/1.1", "Connection: close\r\n", "close"),
+        ("HTTP/1.0", "", "close"),
+        ("HTTP/1.0", "Connection: keep-alive\r\n", "keep-alive"),
+    ],
+)
+def test_parse_head_connection(version, header, connection):
+    """Test when connections are kept alive."""
+    head = f"POST /add?x=1 {version}\r\n{header}Content-Length: 7\r\n\r\n".encode()
+    assert parse_head(head) == ("POST", "/add", 7, connection, False)
+
+
+@pytest.mark.parametrize(
+    ("head", "status"),
+    [
+        (b"POST /hello\r\n\r\n", 400),
+        (b"POST /hello HTTP/2\r\n\r\n", 505),
+        (b"POST /hello HTTP/1.1\r\nContent-Length: x\r\n\r\n", 400),
+        (b"POST /hello HTTP/1.1\r\nContent-Length: -1\r\n\r\n", 400),
+        (b"POST /hello HTTP/1.1\r\nContent-Length: 99999999\r\n\r\n", 413),
+        (b"POST /hello HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n", 501),
+    ],
+)
+def test_parse_head_errors(head, status):
+    """Test that unacceptable requests are rejected before their body."""
+    with pytest.raises(HTTPError) as excinfo:
+        parse_head(head)
+    assert excinfo.value.status == status
+
+
+def test_keep_alive_and_pipelining():
+    """Test that pipelined requests are answered in order on one connection."""
+
+    async def scenario(srv, connect):
+        reader, writer = await connect()
+        names = [f"user{i}" for i in range(10)]
+        writer.write(b"".join(request("/hello", {"name": n}) for n in names))
+        greetings = [(await read_response(reader))[2]["greeting"] for _ in names]
+        writer.write(request("/add", {"a": 1, "b": 2}))
+        status, headers, payload = await read_response(reader)
+        writer.close()
+        return greetings, status, headers, payload
+
+    greetings, status, headers, payload = run_with_server(scenario)
+    assert greetings == [f"Hello, user{i}!" for i in range(10)]
+    assert (status, payload) == (200, {"result": 3})
+    assert "Connection" not in headers
+
+
+def test_connection_close():
+    """Test that the server closes the connection when asked to."""
+
+    async def scenario(srv, connect):
+        reader, writer = await connect()
+        writer.write(request("/hello", headers="Connection: close\r\n"))
+        response = await read_response(reader)
+        return response, await reader.read()
+
+    (status, headers, _), rest = run_with_server(scenario)
+    assert status == 200
+    assert headers["Connection"] == "close"
+    assert rest == b""
+
+
+def test_expect_continue():
+    """Test that clients waiting for 100 Continue get it before the body."""
+
+    async def scenario(srv, connect):
+        reader, writer = await connect()
+        writer.write(
+            b"POST /hello HTTP/1.1\r\nExpect: 100-continue\r\nContent-Length: 15\r\n\r\n"
+        )
+        interim = await reader.readuntil(b"\r\n\r\n")
+        writer.write(b'{"name": "Ada"}')
+        response = await read_response(reader)
+        writer.close()
+        return interim, response
+
+    interim, (status, _, payload) = run_with_server(scenario)
+    assert interim == b"HTTP/1.1 100 Continue\r\n\r\n"
+    assert (status, payload) == (200, {"greeting": "Hello, Ada!"})
+
+
+def test_head_too_large():
+    """Test that an oversized request head is refused."""
+
+    async def scenario(srv, connect):
+        reader, writer = await connect()
+        writer.write(b"POST /hello HTTP/1.1\r\nX: " + b"x" * server.MAX_HEAD * 2)
+        response = await read_response(reader)
+        writer.close()
+        return response
+
+    status, headers, _ = run_with_server(scenario)
+    assert status == 431
+    assert headers["Connection"] == "close"
+
+
+def test_idle_connection_times_out(monkeypatch):
+    """Test that connections idle for KEEPALIVE_TIMEOUT are closed."""
+    monkeypatch.setattr(server, "KEEPALIVE_TIMEOUT", 0.05)
+
+    async def scenario(srv, connect):
+        reader, writer = await connect()
+        writer.write(request("/hello"))
+        await read_response(reader)
+        return await asyncio.wait_for(reader.read(), timeout=5)
+
+    assert run_with_server(scenario) == b""
+
+
+def test_graceful_shutdown():
+    """Test that shutdown closes idle connections and finishes busy ones."""
+
+    async def main():
+        srv = Server(port=0)
+        await srv.start()
+        idle_reader, _ = await asyncio.open_connection(srv.host, srv.port)
+        busy_reader, busy_writer = await asyncio.open_connection(srv.host, srv.port)
+        raw = request("/hello", {"name": "Ada"})
+        busy_writer.write(raw[:-5])
+        await asyncio.sleep(0.05)
+
+        shutdown = asyncio.create_task(srv.shutdown())
+        idle_rest = await asyncio.wait_for(idle_reader.read(), timeout=5)
+        with pytest.raises(OSError):
+            await asyncio.open_connection(srv.host, srv.port)
+        busy_writer.write(raw[-5:])
+        response = await read_response(busy_reader)
+        await asyncio.wait_for(shutdown, timeout=5)
+        busy_writer.close()
+        return idle_rest, response
+
+    idle_rest, (status, headers, payload) = asyncio.run(main())
+    assert idle_rest == b""
+    assert (status, payload) == (200, {"greeting": "Hello, Ada!"})
+    assert headers["Connection"] == "close"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="SIGTERM is not catchable")
+def test_serve_until_sigterm():
+    """Test serving from a separate process and stopping it with SIGTERM."""
+    process = subprocess.Popen(
+        [sys.executable, "-c", f"from {PACKAGE}.server import serve; serve(port=0)"],
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        banner = process.stderr.readline()
+        assert banner.startswith("Serving on http://127.0.0.1:")
+        connection = HTTPConnection("127.0.0.1", int(banner.rsplit(":", 1)[1]))
+        for name in ["Ada", "Bob"]:
+            connection.request("POST", "/hello", json.dumps({"name": name}))
+            response = connection.getresponse()
+            assert json.loads(response.read()) == {"greeting": f"Hello, {name}!"}
+        connection.close()
+        process.send_signal(signal.SIGTERM)
+        assert process.wait(timeout=10) == 0
+    finally:
+        process.kill()
+        process.stderr.close()
+{%- endif %}
@@ -0,0 +1,78 @@
+"""Tests for the zipapp build script."""
+{%- if cookiecutter.use_pytest == "y" %}
+
+import importlib.util
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+PACKAGE = "{{ cookiecutter.project_slug.replace('-', '_') }}"
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "build_zipapp.py"
+
+
+@pytest.fixture(scope="module")
+def archive(tmp_path_factory):
+    """Build the zipapp without dependencies, which the test environment has."""
+    path = tmp_path_factory.mktemp("zipapp") / "app.pyz"
+    subprocess.run(
+        [sys.executable, str(SCRIPT), "--no-deps", "--output", str(path)],
+        capture_output=True,
+        check=True,
+    )
+    return path
+
+
+def test_archive_holds_bytecode_only(archive):
+    """Test that modules are precompiled and their sources left out."""
+    with zipfile.ZipFile(archive) as zf:
+        names = set(zf.namelist())
+    assert f"{PACKAGE}/core.pyc" in names
+    assert f"{PACKAGE}/__main__.pyc" in names
+    # Only the bootstrap __main__.py written by zipapp is left as source
+    assert [name for name in names if name.endswith(".py")] == ["__main__.py"]
+
+
+@pytest.mark.parametrize("args", [["--version"], ["greet", "Ada", "--format", "csv"]])
+def test_archive_runs_cli(archive, args):
+    """Test that the archive answers like the installed CLI."""
+    command = [sys.executable, "-m", f"{PACKAGE}.cli", *args]
+    expected = subprocess.run(command, capture_output=True, text=True, check=True)
+    result = subprocess.run(
+        [sys.executable, str(archive), *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout == expected.stdout
+
+
+def test_package_imported_from_archive(archive):
+    """Test that the archive's package shadows the installed one."""
+    code = f"import {PACKAGE}; print({PACKAGE}.__file__)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PYTHONPATH": str(archive)},
+    )
+    assert result.stdout.startswith(str(archive))
+
+
+def test_stage_skips_extension_modules(tmp_path, monkeypatch):
+    """Test that extension modules built in place are left out of the archive."""
+    spec = importlib.util.spec_from_file_location("build_zipapp", SCRIPT)
+    build_zipapp = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(build_zipapp)
+    source = tmp_path / "project" / "src" / PACKAGE
+    source.mkdir(parents=True)
+    (source / "core.py").touch()
+    (source / "core.cpython-311-x86_64-linux-gnu.so").touch()
+    monkeypatch.setattr(build_zipapp, "PROJECT", tmp_path / "project")
+
+    build_zipapp.stage(tmp_path / "staging", with_deps=False)
+    assert [p.name for p in (tmp_path / "staging" / PACKAGE).iterdir()] == ["core.py"]
+{%- endif %}